@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import time
+from collections import OrderedDict
+
+import pytest
+
+# how many times each constructor or property is timed
+ROUNDS = 5
+
+
+class PageObjectTimer(object):
+    """Times page object constructors and properties, keyed by a label."""
+
+    def __init__(self, rounds=ROUNDS):
+        self.rounds = rounds
+        self.timings = OrderedDict()
+
+    def measure(self, label, function, *args):
+        """Calls function(*args) rounds times and returns the last result."""
+        durations = self.timings.setdefault(label, [])
+        for i in range(self.rounds):
+            start = time.time()
+            result = function(*args)
+            durations.append(time.time() - start)
+        return result
+
+    def measure_step(self, label, setup, step):
+        """
+        Times step(page) for a page freshly returned by setup() in every
+        round, for steps that navigate away from the page they start on.
+        """
+        durations = self.timings.setdefault(label, [])
+        for i in range(self.rounds):
+            page = setup()
+            start = time.time()
+            result = step(page)
+            durations.append(time.time() - start)
+        return result
+
+    def measure_properties(self, page, *names):
+        for name in names:
+            self.measure('%s.%s' % (type(page).__name__, name), getattr, page, name)
+
+    def summary_lines(self):
+        lines = ['%-60s %8s %8s %8s' % ('page object', 'min ms', 'median', 'max')]
+        for label, durations in self.timings.items():
+            durations = sorted(durations)
+            lines.append('%-60s %8.1f %8.1f %8.1f' % (
+                label, durations[0] * 1000, durations[len(durations) // 2] * 1000, durations[-1] * 1000))
+        return lines
+
+
+_timer = PageObjectTimer()
+
+
+@pytest.fixture
+def timer():
+    return _timer
+
+
+def pytest_runtest_setup(item):
+    if not item.config.option.standin:
+        pytest.skip('benchmarks only run against the stand-in site, pass --standin')
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _timer.timings:
+        terminalreporter.write_sep('-', 'page object timings')
+        for line in _timer.summary_lines():
+            terminalreporter.write_line(line)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from pages.desktop.details import Details
+from pages.desktop.discovery import DiscoveryPane
+from pages.desktop.home import Home
+
+
+class TestDesktopPageObjects:
+
+    @pytest.mark.nondestructive
+    def test_home(self, mozwebqa, timer):
+        home_page = timer.measure('Home()', lambda: Home(mozwebqa, force_reload=True))
+        timer.measure_properties(home_page, 'most_popular_count', 'most_popular_list_heading',
+                                 'featured_themes_count', 'featured_collections_count',
+                                 'featured_extensions_count', 'featured_extensions_title',
+                                 'explore_side_navigation_header_text', 'promo_box_present')
+
+    @pytest.mark.nondestructive
+    def test_details(self, mozwebqa, timer):
+        details_page = timer.measure('Details()', lambda: Details(mozwebqa, 'Firebug', force_reload=True))
+        timer.measure_properties(details_page, 'title', 'version_number', 'authors', 'summary',
+                                 'rating', 'description', 'breadcrumb', 'review_count',
+                                 'total_reviews_count', 'daily_users_number', 'other_addons',
+                                 'part_of_collections', 'is_devs_comments_section_expanded')
+
+    @pytest.mark.nondestructive
+    def test_statistics(self, mozwebqa, timer):
+        statistics_page = timer.measure_step('Details.click_view_statistics()',
+                                             lambda: Details(mozwebqa, 'Firebug'),
+                                             lambda page: page.click_view_statistics())
+        timer.measure_properties(statistics_page, 'addon_name', 'total_downloads_number', 'is_chart_loaded')
+
+    @pytest.mark.nondestructive
+    def test_search(self, mozwebqa, timer):
+        home_page = Home(mozwebqa)
+        search_page = timer.measure('Home.search_for()', home_page.search_for, 'firebug')
+        timer.measure_properties(search_page, 'result_count', 'number_of_results_text',
+                                 'search_results_title', 'results')
+        timer.measure_properties(search_page.paginator, 'page_number', 'total_page_number', 'total_items')
+        # each click refreshes the results over AJAX and waits for div.updating to go
+        timer.measure_step('Paginator.click_next_page()',
+                           lambda: home_page.search_for('firebug').paginator,
+                           lambda paginator: paginator.click_next_page())
+        timer.measure('SearchResultList.click_sort_by()', search_page.click_sort_by, 'newest')
+
+    @pytest.mark.nondestructive
+    def test_extensions(self, mozwebqa, timer):
+        extensions_page = timer.measure_step('Home.click_to_explore()',
+                                             lambda: Home(mozwebqa),
+                                             lambda page: page.click_to_explore('featured'))
+        timer.measure_properties(extensions_page, 'extensions', 'featured_extensions_header_text',
+                                 'subscribe_link_text', 'is_paginator_present')
+        timer.measure_properties(extensions_page.sorter, 'sorted_by')
+
+    @pytest.mark.nondestructive
+    def test_themes(self, mozwebqa, timer):
+        themes_page = timer.measure_step('Home.click_featured_themes_see_all_link()',
+                                         lambda: Home(mozwebqa),
+                                         lambda page: page.click_featured_themes_see_all_link())
+        timer.measure_properties(themes_page, 'theme_count', 'featured_themes_count',
+                                 'recently_added_dates', 'most_popular_downloads', 'top_rated_ratings',
+                                 'theme_header')
+
+    @pytest.mark.nondestructive
+    def test_complete_themes(self, mozwebqa, timer):
+        complete_themes_page = timer.measure_step('HeaderRegion.click_complete_themes()',
+                                                  lambda: Home(mozwebqa),
+                                                  lambda page: page.header.click_complete_themes())
+        timer.measure_properties(complete_themes_page, 'addon_count', 'categories_count',
+                                 'get_all_categories', 'addon_download_number', 'addon_rating',
+                                 'complete_themes')
+        timer.measure('CompleteThemes.click_sort_by()', complete_themes_page.click_sort_by, 'name')
+
+    @pytest.mark.nondestructive
+    def test_collections(self, mozwebqa, timer):
+        collections_page = timer.measure_step('Home.click_featured_collections_see_all_link()',
+                                              lambda: Home(mozwebqa),
+                                              lambda page: page.click_featured_collections_see_all_link())
+        timer.measure_properties(collections_page, 'default_selected_tab', 'breadcrumbs')
+
+    @pytest.mark.nondestructive
+    def test_discovery_pane(self, mozwebqa, timer):
+        path = '/en-US/firefox/discovery/pane/%s/Darwin' % mozwebqa.selenium.capabilities['version']
+        discovery_page = timer.measure('DiscoveryPane()', lambda: DiscoveryPane(mozwebqa, path, force_reload=True))
+        timer.measure_properties(discovery_page, 'what_are_addons_text', 'mission_section',
+                                 'download_count', 'themes_count', 'up_and_coming_item_count',
+                                 'carousel_panels')
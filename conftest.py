@@ -7,6 +7,29 @@
 import py
 import pytest
 
+pytest_plugins = [
+    'plugins.animations',
+    'plugins.asset_proxy',
+    'plugins.browser_pool',
+    'plugins.browserless',
+    'plugins.command_budget',
+    'plugins.command_tracer',
+    'plugins.data_factory',
+    'plugins.navigation_timing',
+    'plugins.perf_budget',
+    'plugins.prefetch',
+    'plugins.profile_template',
+    'plugins.rate_limit',
+    'plugins.shared_pages',
+    'plugins.standin_site',
+    'plugins.wait_report',
+]
+
+
+def pytest_addhooks(pluginmanager):
+    from plugins import hookspec
+    pluginmanager.addhooks(hookspec)
+
 
 def pytest_runtest_setup(item):
     pytest_mozwebqa = py.test.config.pluginmanager.getplugin("mozwebqa")
@@ -24,7 +47,9 @@ def pytest_addoption(parser):
 
 def pytest_funcarg__mozwebqa(request):
     pytest_mozwebqa = py.test.config.pluginmanager.getplugin("mozwebqa")
-    return pytest_mozwebqa.TestSetup(request)
+    testsetup = pytest_mozwebqa.TestSetup(request)
+    request.config.hook.pytest_mozwebqa_testsetup(testsetup=testsetup, request=request)
+    return testsetup
 
 
 @pytest.fixture
@@ -8,9 +8,10 @@ import re
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.desktop.base import Base
+from pages.wait import Wait
+from utils import review_harvest
 
 
 class WriteReviewBlock(Base):
@@ -53,6 +54,10 @@ class ViewReviews(Base):
         from pages.desktop.regions.paginator import Paginator
         return Paginator(self.testsetup)
 
+    def all_reviews(self):
+        """Yields a Review record for each review on this page and the pages after it."""
+        return review_harvest.stream(self.selenium)
+
     class ReviewSnippet(Base):
 
         _review_text_locator = (By.CSS_SELECTOR, ".description")
@@ -87,8 +92,8 @@ class ViewReviews(Base):
 
         def delete(self):
             self._root_element.find_element(*self._delete_review_locator).click()
-            WebDriverWait(self.selenium, self.timeout).until(lambda s:
-                                                             self.marked_for_deletion == 'Marked for deletion')
+            Wait(self.selenium, self.timeout).until(
+                lambda s: self.marked_for_deletion == 'Marked for deletion')
 
         @property
         def marked_for_deletion(self):
@@ -9,9 +9,10 @@ import re
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
+from pages.wait import Wait
+from utils import asset_check
 
 
 class Base(Page):
@@ -22,15 +23,25 @@ class Base(Page):
 
     _footer_locator = (By.CSS_SELECTOR, "#footer")
 
+    # the parts of the page whose links the links property reads, as (region, CSS selector of the links)
+    _link_regions = [('header', '.site-title a, #site-nav a, #aux-nav a'),
+                     ('footer', '#footer a')]
+
     def login(self, email, password):
         login_page = self.header.click_login()
         login_page.login(email, password)
 
     @property
     def page_title(self):
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: self.selenium.title)
+        Wait(self.selenium, self.timeout).until(lambda s: self.selenium.title)
         return self.selenium.title
 
+    @property
+    def links(self):
+        """Returns (region, url) for each link in the page's _link_regions, read in one script."""
+        return asset_check.urls_of(self.selenium, [(region, selector, 'href')
+                                                   for region, selector in self._link_regions])
+
     @property
     def is_amo_logo_visible(self):
         return self.is_element_visible(*self._amo_logo_locator)
@@ -62,14 +73,16 @@ class Base(Page):
         from pages.desktop.themes import Themes, ThemesSearchResultList
         from pages.desktop.complete_themes import CompleteThemes, CompleteThemesSearchResultList
         if isinstance(self, (Collections, CollectionSearchResultList)):
-            return CollectionSearchResultList(self.testsetup)
+            results = CollectionSearchResultList(self.testsetup)
         elif isinstance(self, (Themes, ThemesSearchResultList)):
-            return ThemesSearchResultList(self.testsetup)
+            results = ThemesSearchResultList(self.testsetup)
         elif isinstance(self, (CompleteThemes, CompleteThemesSearchResultList)):
-            return CompleteThemesSearchResultList(self.testsetup)
+            results = CompleteThemesSearchResultList(self.testsetup)
         else:
             from pages.desktop.search import SearchResultList
-            return SearchResultList(self.testsetup)
+            results = SearchResultList(self.testsetup)
+        results.notify_navigation()
+        return results
 
     @property
     def breadcrumbs(self):
@@ -146,7 +159,7 @@ class Base(Page):
         @property
         def site_navigation_menus(self):
             # returns a list containing all the site navigation menus
-            WebDriverWait(self.selenium, self.timeout).until(lambda s: len(s.find_elements(*self._site_navigation_menus_locator)) >= self._site_navigation_min_number_menus)
+            Wait(self.selenium, self.timeout).until(lambda s: len(s.find_elements(*self._site_navigation_menus_locator)) >= self._site_navigation_min_number_menus)
             from pages.desktop.regions.header_menu import HeaderMenu
             return [HeaderMenu(self.testsetup, web_element) for web_element in self.selenium.find_elements(*self._site_navigation_menus_locator)]
 
@@ -11,6 +11,8 @@ from pages.desktop.base import Base
 
 class Category(Base):
 
+    _link_regions = Base._link_regions + [('categories', '#side-categories a')]
+
     _categories_side_navigation_header_locator = (By.CSS_SELECTOR, "#side-nav > h2:nth-of-type(2)")
     _categories_alert_update_link_locator = (By.CSS_SELECTOR, "#side-categories > li:nth-of-type(1) > a")
     _categories_appearance_link_locator = (By.CSS_SELECTOR, "#side-categories > li:nth-of-type(2) > a")
@@ -65,6 +65,7 @@ class Collection(Base):
     _notification_locator = (By.CSS_SELECTOR, ".notification-box.success h2")
     _collection_name_locator = (By.CSS_SELECTOR, ".collection > span")
     _delete_collection_locator = (By.CSS_SELECTOR, ".delete")
+    _delete_confirmation_form_locator = (By.CSS_SELECTOR, ".section > form")
     _delete_confirmation_locator = (By.CSS_SELECTOR, ".section > form > button")
     _breadcrumb_locator = (By.ID, "breadcrumbs")
 
@@ -4,6 +4,13 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+# pages.desktop.collections would shadow the standard library's collections
+from __future__ import absolute_import
+
+import re
+from collections import namedtuple
+from datetime import datetime
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 
@@ -11,6 +18,42 @@ from pages.desktop.regions.sorter import Sorter
 from pages.desktop.base import Base
 from pages.page import Page
 from pages.desktop.search import SearchResultList
+from utils import dom_snapshot
+
+
+class ThemeGrid(namedtuple('ThemeGrid', 'names dates download_texts rating_texts '
+                                        'incompatible incompatible_flags_visible flyout_texts')):
+    """
+    One list per column, an item per theme of the grid in the order shown.
+    flyout_texts are the 'not available' texts of the flyouts, read without
+    opening them. The dates, downloads and ratings are parsed when read and
+    raise, like Base._extract_iso_dates and _extract_integers, when the text
+    of any theme does not parse.
+    """
+
+    __slots__ = ()
+
+    def _iso_dates(self, date_format):
+        return [datetime.strptime(date, date_format).isoformat() for date in self.dates]
+
+    def _integers(self, pattern, texts):
+        return [int(re.search(pattern, text.replace(',', '')).group(1)) for text in texts]
+
+    @property
+    def updated_dates(self):
+        return self._iso_dates('Updated %B %d, %Y')
+
+    @property
+    def created_dates(self):
+        return self._iso_dates('Added %B %d, %Y')
+
+    @property
+    def downloads(self):
+        return self._integers(r'(\d+) weekly downloads', self.download_texts)
+
+    @property
+    def ratings(self):
+        return self._integers(r'(\d)', self.rating_texts)
 
 
 class CompleteThemes(Base):
@@ -115,6 +158,23 @@ class CompleteThemes(Base):
         ratings = self._extract_integers(pattern, *self._addons_rating_locator)
         return ratings
 
+    @property
+    def grid(self):
+        """Returns the ThemeGrid of every theme shown, read in one script."""
+        theme = self.CompleteTheme
+        columns = dom_snapshot.columns(self.selenium, self._addons_root_locator[1], {
+            'name': (self._addon_name_locator[1], 'text'),
+            'date': (self._addons_metadata_locator[1], 'text'),
+            'downloads': (self._addons_download_locator[1], 'text'),
+            'rating': (self._addons_rating_locator[1], 'text'),
+            'hovercard': (theme._hovercard_locator[1], 'class'),
+            'incompatible_flag': (theme._is_incompatible_locator[1], 'visible'),
+            'flyout_text': (theme._not_available_locator[1], 'text')})
+        return ThemeGrid(columns['name'], columns['date'], columns['downloads'], columns['rating'],
+                         ['incompatible' in (hovercard or '').split() for hovercard in columns['hovercard']],
+                         [bool(visible) for visible in columns['incompatible_flag']],
+                         columns['flyout_text'])
+
     @property
     def complete_themes(self):
         return [self.CompleteTheme(self.testsetup, completetheme)for completetheme in self.selenium.find_elements(*self._addons_root_locator)]
@@ -8,11 +8,12 @@ import re
 
 from urllib2 import urlparse
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 
 from pages.page import Page
 from pages.desktop.base import Base
+from pages.wait import Wait
+from utils import asset_check
 
 
 class Details(Base):
@@ -92,17 +93,23 @@ class Details(Base):
     _contribute_button_locator = (By.ID, 'contribute-button')
     _paypal_login_dialog_locator = (By.CSS_SELECTOR, '#page .content')
 
-    def __init__(self, testsetup, addon_name=None):
-        # formats name for url
+    _link_regions = Base._link_regions + [('details', '.primary a')]
+
+    def __init__(self, testsetup, addon_name=None, force_reload=False):
         Base.__init__(self, testsetup)
         if (addon_name is not None):
-            self.addon_name = addon_name.replace(" ", "-")
-            self.addon_name = re.sub(r'[^A-Za-z0-9\-]', '', self.addon_name).lower()
-            self.addon_name = self.addon_name[:27]
-            self.selenium.get("%s/addon/%s" % (self.base_url, self.addon_name))
-        WebDriverWait(self.selenium, self.timeout).until(
+            self.addon_name = self.addon_slug(addon_name)
+            self.get_url("%s/addon/%s" % (self.base_url, self.addon_name), force_reload)
+        Wait(self.selenium, self.timeout).until(
             lambda s: self.is_element_visible(*self._title_locator))
 
+    @staticmethod
+    def addon_slug(addon_name):
+        """Formats an add-on name the way AMO does in its urls."""
+        slug = addon_name.replace(" ", "-")
+        slug = re.sub(r'[^A-Za-z0-9\-]', '', slug).lower()
+        return slug[:27]
+
     @property
     def _page_title(self):
         return "%s :: Add-ons for Firefox" % self.title
@@ -146,7 +153,7 @@ class Details(Base):
         self.selenium.find_element(*self._daily_users_link_locator).click()
         from pages.desktop.statistics import Statistics
         stats_page = Statistics(self.testsetup)
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: stats_page.is_chart_loaded)
+        Wait(self.selenium, self.timeout).until(lambda s: stats_page.is_chart_loaded)
         return stats_page
 
     @property
@@ -270,7 +277,7 @@ class Details(Base):
         self.selenium.find_element(*self._view_the_source_locator).click()
         from pages.desktop.addons_site import ViewAddonSource
         addon_source = ViewAddonSource(self.testsetup)
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: addon_source.is_file_viewer_visible)
+        Wait(self.selenium, self.timeout).until(lambda s: addon_source.is_file_viewer_visible)
         return addon_source
 
     @property
@@ -349,6 +356,15 @@ class Details(Base):
     def icon_url(self):
         return self.selenium.find_element(*self._icon_locator).get_attribute('src')
 
+    @property
+    def asset_urls(self):
+        """Returns (kind, url) for the icon and each preview thumbnail and full-size preview."""
+        image = self.ImagePreviewer._image_locator[1]
+        return asset_check.urls_of(self.selenium, [
+            ('icon', self._icon_locator[1], 'src'),
+            ('thumbnail', '%s a img' % image, 'src'),
+            ('preview', '%s a' % image, 'href')])
+
     @property
     def website(self):
         url = self.selenium.find_element(*self._website_locator).get_attribute('href')
@@ -356,7 +372,7 @@ class Details(Base):
 
     def click_website_link(self):
         self.selenium.find_element(*self._website_locator).click()
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: self.selenium.title)
+        Wait(self.selenium, self.timeout).until(lambda s: self.selenium.title)
 
     @property
     def support_url(self):
@@ -418,7 +434,7 @@ class Details(Base):
 
             from pages.desktop.regions.image_viewer import ImageViewer
             image_viewer = ImageViewer(self.testsetup)
-            WebDriverWait(self.selenium, self.timeout).until(lambda s: image_viewer.is_visible)
+            Wait(self.selenium, self.timeout).until(lambda s: image_viewer.is_visible)
             return image_viewer
 
         def image_title(self, image_no):
@@ -460,14 +476,14 @@ class Details(Base):
         self.selenium.find_element(*self._info_link_locator).click()
 
     def click_user_reviews_link(self):
-        WebDriverWait(self.selenium, self.timeout).until(
+        Wait(self.selenium, self.timeout).until(
             lambda s: self.is_element_present(*self._reviews_section_header_locator))
         self.selenium.find_element(*self._review_link_locator).click()
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: (self.selenium.execute_script('return window.pageYOffset')) > 1000)
+        Wait(self.selenium, self.timeout).until(lambda s: (self.selenium.execute_script('return window.pageYOffset')) > 1000)
 
     def expand_version_information(self):
         self.selenium.find_element(*self._version_information_button_locator).click()
-        WebDriverWait(self.selenium, self.timeout).until(
+        Wait(self.selenium, self.timeout).until(
             lambda s: self.is_version_information_section_expanded)
 
     @property
@@ -476,7 +492,7 @@ class Details(Base):
 
     def expand_devs_comments(self):
         self.selenium.find_element(*self._devs_comments_toggle_locator).click()
-        WebDriverWait(self.selenium, self.timeout).until(
+        Wait(self.selenium, self.timeout).until(
             lambda s: self.is_devs_comments_section_expanded)
 
     class OtherAddons(Page):
@@ -525,7 +541,7 @@ class Details(Base):
         expander = self.selenium.find_element(*self._development_channel_toggle)
         expander_saved_class = expander.get_attribute('class')
         self.selenium.find_element(*self._development_channel_toggle).click()
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: expander.get_attribute('class') is not expander_saved_class)
+        Wait(self.selenium, self.timeout).until(lambda s: expander.get_attribute('class') is not expander_saved_class)
 
     @property
     def is_development_channel_expanded(self):
@@ -534,7 +550,7 @@ class Details(Base):
 
     @property
     def is_development_channel_install_button_visible(self):
-        WebDriverWait(self.selenium, self.timeout).until(
+        Wait(self.selenium, self.timeout).until(
             lambda s: self.is_element_visible(*self._development_channel_install_button_locator),
             "Timeout waiting for 'development channel install' button.")
         return True
@@ -554,7 +570,7 @@ class Details(Base):
         def __init__(self, testsetup):
             Page.__init__(self, testsetup)
 
-            WebDriverWait(self.selenium, self.timeout).until(
+            Wait(self.selenium, self.timeout).until(
                 lambda s: s.find_element(*self._make_contribution_button_locator).is_displayed(),
                 "Timeout waiting for 'make contribution' button.")
 
@@ -581,7 +597,7 @@ class Details(Base):
         return self.is_element_visible(*self._paypal_login_dialog_locator)
 
     def _wait_for_favorite_addon_to_be_added(self):
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: not self.is_element_present(*self._add_to_favorites_updating_locator))
+        Wait(self.selenium, self.timeout).until(lambda s: not self.is_element_present(*self._add_to_favorites_updating_locator))
 
     def click_add_to_favorites(self):
         self.selenium.find_element(*self._add_to_favorites_widget_locator).click()
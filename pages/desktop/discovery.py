@@ -5,10 +5,10 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
 from pages.desktop.base import Base
+from pages.wait import Wait
 
 
 class DiscoveryPane(Base):
@@ -30,12 +30,13 @@ class DiscoveryPane(Base):
     _logout_link_locator = (By.CSS_SELECTOR, '#logout > a')
 
     _carousel_panels_locator = (By.CSS_SELECTOR, '#promos .slider li.panel')
+    _ready_locators = [_carousel_panels_locator]
     _carousel_next_panel_button_locator = (By.CSS_SELECTOR, '#nav-features .nav-next a')
     _carousel_previous_panel_button_locator = (By.CSS_SELECTOR, '#nav-features .nav-prev a')
 
     _featured_addons_base_locator = (By.CSS_SELECTOR, '#featured-addons .addon-title ')
 
-    def __init__(self, testsetup, path):
+    def __init__(self, testsetup, path, force_reload=False):
         '''
             The default behavior of the class is to use --baseurl. If --servicesbaseurl
             is passed as an argument to pytest, --baseurl will be overridden.
@@ -49,13 +50,13 @@ class DiscoveryPane(Base):
         '''
         Base.__init__(self, testsetup)
         if self.services_base_url:
-            self.selenium.get(self.services_base_url + path)
+            self.get_url(self.services_base_url + path, force_reload)
         else:
-            self.selenium.get(self.base_url + path)
+            self.get_url(self.base_url + path, force_reload)
         self.selenium.maximize_window()
         # resizing this page for elements that disappear when the window is < 1000
         # self.selenium.set_window_size(1000, 1000) Commented because this selenium call is still in beta
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: self.selenium.find_element(*self._promo_box_locator).size['height'] == 273)
+        self.wait_for_page_ready()
 
     @property
     def what_are_addons_text(self):
@@ -144,8 +145,8 @@ class DiscoveryPane(Base):
             return self._root_element.is_displayed()
 
         def wait_for_next_promo(self):
-            WebDriverWait(self.selenium, self.timeout).until(lambda s:
-                                                             self._root_element.find_element(*self._heading_locator).is_displayed())
+            Wait(self.selenium, self.timeout).until(
+                lambda s: self._root_element.find_element(*self._heading_locator).is_displayed())
 
 
 class DiscoveryThemesDetail(Base):
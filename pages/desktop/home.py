@@ -6,10 +6,10 @@
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
 from pages.desktop.base import Base
+from utils import commands, dom_snapshot
 
 
 class Home(Base):
@@ -41,15 +41,18 @@ class Home(Base):
     _extensions_menu_link = (By.CSS_SELECTOR, "#extensions > a")
 
     _promo_box_locator = (By.ID, "promos")
+    _ready_locators = [(By.CSS_SELECTOR, "#promos .panel")]
 
     _up_and_coming_locator = (By.ID, "upandcoming")
 
-    def __init__(self, testsetup, open_url=True):
+    _link_regions = Base._link_regions + [('home', '#homepage a')]
+
+    def __init__(self, testsetup, open_url=True, force_reload=False):
         """Creates a new instance of the class and gets the page ready for testing."""
         Base.__init__(self, testsetup)
         if open_url:
-            self.selenium.get(self.base_url)
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: s.find_element(*self._promo_box_locator).size['height'] == 271)
+            self.get_url(self.base_url, force_reload)
+        self.wait_for_page_ready()
 
     def hover_over_addons_home_title(self):
         home_item = self.selenium.find_element(*self._amo_logo_link_locator)
@@ -178,8 +181,17 @@ class Home(Base):
 
     @property
     def featured_extensions(self):
-        return [self.FeaturedExtensions(self.testsetup, web_element)
-                for web_element in self.selenium.find_elements(*self._featured_extensions_elements_locator)]
+        if not commands.supports_listeners(self.selenium):
+            return [self.FeaturedExtensions(self.testsetup, web_element)
+                    for web_element in self.selenium.find_elements(*self._featured_extensions_elements_locator)]
+        # the hover cards are read in the same script, so reading them needs no hover
+        extension = self.FeaturedExtensions
+        columns = dom_snapshot.columns(self.selenium, self._featured_extensions_elements_locator[1], {
+            'element': (None, 'element'),
+            'authors': (extension._author_locator[1], 'texts'),
+            'summary': (extension._summary_locator[1], 'text')})
+        return [extension(self.testsetup, web_element, authors, summary)
+                for web_element, authors, summary in zip(columns['element'], columns['authors'], columns['summary'])]
 
     class FeaturedExtensions(Page):
 
@@ -187,17 +199,23 @@ class Home(Base):
         _summary_locator = (By.CSS_SELECTOR, 'div.addon > div.more > .addon-summary')
         _link_locator = (By.CSS_SELECTOR, 'div.addon > .summary')
 
-        def __init__(self, testsetup, web_element):
+        def __init__(self, testsetup, web_element, author_name=None, summary=None):
             Page.__init__(self, testsetup)
             self._root_element = web_element
+            self._author_name = author_name
+            self._summary = summary
 
         @property
         def author_name(self):
+            if self._author_name is not None:
+                return self._author_name
             self._move_to_addon_flyout()
             return [element.text for element in self._root_element.find_elements(*self._author_locator)]
 
         @property
         def summary(self):
+            if self._summary is not None:
+                return self._summary
             self._move_to_addon_flyout()
             return self._root_element.find_element(*self._summary_locator).text
 
@@ -5,9 +5,9 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
+from pages.wait import Wait
 
 
 class ImageViewer(Page):
@@ -51,7 +51,7 @@ class ImageViewer(Page):
 
     def close(self):
         self.selenium.find_element(*self._close_locator).click()
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: not self.is_element_visible(*self._image_viewer))
+        Wait(self.selenium, self.timeout).until(lambda s: not self.is_element_visible(*self._image_viewer))
 
     @property
     def caption(self):
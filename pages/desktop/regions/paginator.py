@@ -5,9 +5,9 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
+from pages.wait import Wait
 
 
 class Paginator(Page):
@@ -31,7 +31,7 @@ class Paginator(Page):
 
     def _wait_for_results_refresh(self):
         # On pages that do not have ajax refresh this wait will have no effect.
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: not self.is_element_present(*self._updating_locator))
+        Wait(self.selenium, self.timeout).until(lambda s: not self.is_element_present(*self._updating_locator))
 
     @property
     def page_number(self):
@@ -6,9 +6,9 @@
 
 
 from pages.page import Page
+from pages.wait import Wait
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 
 class PayPalFrame(Page):
@@ -21,7 +21,7 @@ class PayPalFrame(Page):
         Page.__init__(self, testsetup)
         self.selenium.switch_to_frame(self._iframe_id)
         # wait for the paypal logo to appear, then we know the frame's contents has loaded
-        WebDriverWait(self.selenium, self.timeout).until(
+        Wait(self.selenium, self.timeout).until(
             lambda s: s.find_element(*self._logo_locator),
             'Timeout waiting for Paypal logo in frame.')
 
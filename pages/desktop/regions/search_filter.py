@@ -5,9 +5,9 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
+from pages.wait import Wait
 
 
 class FilterBase(Page):
@@ -45,7 +45,7 @@ class FilterBase(Page):
                    self.selenium.find_element(*self._category_section_locator).get_attribute('class')
 
         def wait_for_result_set_to_update(self):
-            WebDriverWait(self.selenium, self.timeout)\
+            Wait(self.selenium, self.timeout)\
                 .until(lambda s: self.is_element_visible(*self._updating_throbber_locator) is False)
 
         def expand_filter_options(self):
@@ -72,7 +72,7 @@ class FilterBase(Page):
                    self.selenium.find_element(*self._works_with_section_locator).get_attribute('class')
 
         def wait_for_result_set_to_update(self):
-            WebDriverWait(self.selenium, self.timeout)\
+            Wait(self.selenium, self.timeout)\
                 .until(lambda s: self.is_element_visible(*self._updating_throbber_locator) is False)
 
         def expand_filter_options(self):
@@ -6,10 +6,10 @@
 
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 
 from pages.page import Page
+from pages.wait import Wait
 
 
 class Sorter(Page):
@@ -44,7 +44,7 @@ class Sorter(Page):
             ActionChains(self.selenium).move_to_element(hover_element).\
                 move_to_element(click_element).\
                 click().perform()
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: not self.is_element_present(*self._updating_locator))
+        Wait(self.selenium, self.timeout).until(lambda s: not self.is_element_present(*self._updating_locator))
 
     @property
     def sorted_by(self):
@@ -8,10 +8,10 @@
 from time import strptime, mktime
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.page import Page
 from pages.desktop.base import Base
+from pages.wait import Wait
 
 
 class SearchResultList(Base):
@@ -24,7 +24,7 @@ class SearchResultList(Base):
 
     def __init__(self, testsetup):
         Base.__init__(self, testsetup)
-        WebDriverWait(self.selenium, self.timeout).until(
+        Wait(self.selenium, self.timeout).until(
             lambda s: self.is_no_results_present or
             len(s.find_elements(*self._results_locator)) > 0)
 
@@ -96,6 +96,10 @@ class SearchResultList(Base):
         def text(self):
             return self._root_element.text
 
+        @property
+        def url(self):
+            return self._root_element.find_element(*self._name_locator).get_attribute('href')
+
         @property
         def downloads(self):
             number = self._root_element.find_element(*self._sort_criteria).text
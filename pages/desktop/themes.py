@@ -8,10 +8,10 @@ import re
 import pytest
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.desktop.base import Base
 from pages.desktop.search import SearchResultList
+from pages.wait import Wait
 
 
 class Themes(Base):
@@ -35,16 +35,16 @@ class Themes(Base):
 
     def click_theme(self, index):
         """Clicks on the theme with the given index in the page."""
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: self.selenium.find_elements(*self._themes_locator)[index].is_displayed())
+        Wait(self.selenium, self.timeout).until(lambda s: self.selenium.find_elements(*self._themes_locator)[index].is_displayed())
 
         self.selenium.find_elements(*self._themes_locator)[index].click()
         theme_detail = ThemesDetail(self.testsetup)
 
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: theme_detail.is_title_visible)
+        Wait(self.selenium, self.timeout).until(lambda s: theme_detail.is_title_visible)
         return theme_detail
 
     def open_theme_detail_page(self, theme_key):
-        self.selenium.get(self.base_url + "/addon/%s" % theme_key)
+        self.get_url(self.base_url + "/addon/%s" % theme_key)
         return ThemesDetail(self.testsetup)
 
     def click_start_exploring(self):
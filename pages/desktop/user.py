@@ -6,12 +6,13 @@
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import NoSuchElementException
 from selenium.common.exceptions import NoSuchAttributeException
 
 from pages.desktop.base import Base
 from pages.page import Page
+from pages.wait import Wait
+from utils import dom_snapshot, form_fill
 
 
 class Login(Base):
@@ -35,7 +36,7 @@ class ViewProfile(Base):
 
     def __init__(self, testsetup):
         Base.__init__(self, testsetup)
-        WebDriverWait(self.selenium, self.timeout).until(
+        Wait(self.selenium, self.timeout).until(
             lambda s: (s.find_element(*self._about_locator)).is_displayed())
 
     @property
@@ -76,7 +77,7 @@ class EditProfile(Base):
 
     def __init__(self, testsetup):
         Base.__init__(self, testsetup)
-        WebDriverWait(self.selenium, self.timeout).until(
+        Wait(self.selenium, self.timeout).until(
             lambda s: (s.find_element(*self._account_locator)).is_displayed())
 
     @property
@@ -97,7 +98,7 @@ class EditProfile(Base):
 
     def click_update_account(self):
         self.selenium.find_element(*self._update_account_locator).click()
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: self.update_message == "Profile Updated")
+        Wait(self.selenium, self.timeout).until(lambda s: self.update_message == "Profile Updated")
 
     def change_hide_email_state(self):
         self.selenium.find_element(*self._hide_email_checkbox).click()
@@ -107,6 +108,38 @@ class EditProfile(Base):
         return [self.ProfileSection(self.testsetup, web_element)
                 for web_element in self.selenium.find_elements(*self._profile_fields_locator)]
 
+    @property
+    def profile_form(self):
+        """Returns (field name, input type, value) for each profile field, read in one script."""
+        section = self.ProfileSection
+        columns = dom_snapshot.columns(self.selenium, self._profile_fields_locator[1], {
+            'name': (section._field_name[1].strip(), 'text'),
+            'type': (section._input_field_locator[1].strip(), 'type'),
+            'value': (section._input_field_locator[1].strip(), 'value')})
+        return zip(columns['name'], columns['type'], columns['value'])
+
+    @property
+    def editable_profile_values(self):
+        """
+        Returns the value of each editable profile field by its name, and
+        raises ValueError when two editable fields share a name.
+        """
+        fields = [(name, value) for name, input_type, value in self.profile_form
+                  if input_type in self.ProfileSection.EDITABLE_TYPES]
+        names = [name for name, value in fields]
+        duplicates = sorted(set(name for name in names if names.count(name) > 1))
+        if duplicates:
+            raise ValueError('Profile fields share the names %s' % ', '.join(duplicates))
+        return dict(fields)
+
+    def fill_profile(self, values):
+        """Sets the profile fields named by the keys of values, an empty value clearing the field."""
+        section = self.ProfileSection
+        missing = form_fill.fill(self.selenium, self._profile_fields_locator[1], section._field_name[1].strip(),
+                                 section._input_field_locator[1].strip(), values)
+        if missing:
+            raise NoSuchElementException('No profile fields named %s' % ', '.join(missing))
+
     @property
     def update_message(self):
         return self.selenium.find_element(*self._update_message_locator).text
@@ -116,6 +149,8 @@ class EditProfile(Base):
         _input_field_locator = (By.CSS_SELECTOR, ' input')
         _field_name = (By.CSS_SELECTOR, ' label')
 
+        EDITABLE_TYPES = ('text', 'url')
+
         def __init__(self, testsetup, element):
             Page.__init__(self, testsetup)
             self._root_element = element
@@ -136,7 +171,7 @@ class EditProfile(Base):
 
         @property
         def is_field_editable(self):
-            return self.input_type == 'text' or self.input_type == 'url'
+            return self.input_type in self.EDITABLE_TYPES
 
         @property
         def field_name(self):
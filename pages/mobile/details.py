@@ -23,7 +23,7 @@ class Details(Base):
             self.addon_name = addon_name.replace(" ", "-")
             self.addon_name = re.sub(r'[^A-Za-z0-9\-]', '', self.addon_name).lower()
             self.addon_name = self.addon_name[:27]
-            self.selenium.get("%s/addon/%s" % (self.base_url, self.addon_name))
+            self.get_url("%s/addon/%s" % (self.base_url, self.addon_name))
 
     @property
     def _page_title(self):
@@ -5,10 +5,10 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.mobile.base import Base
 from pages.page import Page
+from pages.wait import Wait
 
 
 class Home(Base):
@@ -34,7 +34,7 @@ class Home(Base):
 
     def __init__(self, testsetup):
         Base.__init__(self, testsetup)
-        self.selenium.get(self.base_url)
+        self.get_url(self.base_url)
         self.is_the_current_page
 
     def search_for(self, search_term, click_button=True):
@@ -89,7 +89,7 @@ class Home(Base):
         self.selenium.find_element(*self._all_featured_addons_locator).click()
         from pages.mobile.extensions import Extensions
         extensions_page = Extensions(self.testsetup)
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: self.is_element_visible(*extensions_page._sort_by_locator))
+        Wait(self.selenium, self.timeout).until(lambda s: self.is_element_visible(*extensions_page._sort_by_locator))
         return extensions_page
 
     @property
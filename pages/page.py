@@ -7,9 +7,13 @@
 Created on Jun 21, 2010
 
 '''
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import NoSuchElementException
 from selenium.common.exceptions import ElementNotVisibleException
+from selenium.common.exceptions import TimeoutException
+
+from pages.wait import Wait
+from utils import commands
+from utils import page_ready
 
 
 class Page(object):
@@ -17,6 +21,9 @@ class Page(object):
     Base class for all Pages.
     """
 
+    # elements that have to be displayed before wait_for_page_ready returns
+    _ready_locators = ()
+
     def __init__(self, testsetup):
         """
         Constructor
@@ -26,19 +33,58 @@ class Page(object):
         self.services_base_url = testsetup.services_base_url
         self.selenium = testsetup.selenium
         self.timeout = testsetup.timeout
+        # filled in by the navigation timing plugin when it is enabled
+        self.navigation_timing = None
+        self.resource_timing = None
 
-    def get_url(self, url):
+    def get_url(self, url, force_reload=False):
+        """
+        Opens url, unless the browser is still on the page an earlier get_url
+        left it on and no command since could have changed that page.
+        """
+        if not commands.supports_listeners(self.selenium):
+            self.selenium.get(url)
+            self.notify_navigation(url)
+            return
+        if not force_reload and getattr(self.selenium, '_last_get_url', None) == (
+                url, commands.page_generation(self.selenium)):
+            return
         self.selenium.get(url)
+        self.selenium._last_get_url = (url, commands.page_generation(self.selenium))
+        self.notify_navigation(url)
+
+    def notify_navigation(self, url=None):
+        """Tells the navigation listeners this page object is on a freshly loaded page."""
+        for listener in getattr(self.testsetup, 'navigation_listeners', ()):
+            listener(self, url)
+
+    def wait_for_page_ready(self):
+        """
+        Waits until the document has loaded, the network is idle and each of
+        the page's _ready_locators matches a displayed element.
+        """
+        if not commands.supports_listeners(self.selenium):
+            # the browserless driver only has complete documents, there is nothing to wait for
+            for locator in self._ready_locators:
+                self.selenium.find_element(*locator)
+            return
+        # the script gives up on its own first, so the timeout it reports says what it waited for
+        self.selenium.set_script_timeout(self.timeout + 5)
+        failure = self.selenium.execute_async_script(
+            page_ready.SCRIPT, [page_ready.probe_of(locator) for locator in self._ready_locators],
+            self.timeout * 1000, page_ready.QUIET_MS)
+        if failure:
+            raise TimeoutException('Page not ready after %s seconds: %s' % (self.timeout, failure))
 
     @property
     def is_the_current_page(self):
-        WebDriverWait(self.selenium, self.timeout).until(
+        Wait(self.selenium, self.timeout).until(
             lambda s: s.title == self._page_title,
             "Expected page title: %s. Actual page title: %s" % (self._page_title, self.selenium.title))
         return True
 
     def get_url_current_page(self):
-        WebDriverWait(self.selenium, self.timeout).until(lambda s: self.selenium.title)
+        Wait(self.selenium, self.timeout).until(lambda s: self.selenium.title)
         return self.selenium.current_url
 
     def is_element_present(self, *locator):
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import sys
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# seconds between the first polls, growing by BACKOFF up to LAST_POLL
+FIRST_POLL = 0.05
+LAST_POLL = 0.5
+BACKOFF = 1.5
+
+_listeners = []
+
+
+def add_listener(listener):
+    """Calls listener(call_site, duration, polls, timed_out) after every wait."""
+    _listeners.append(listener)
+
+
+def remove_listener(listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def _call_site(frame):
+    page = frame.f_locals.get('self')
+    if page is not None:
+        return '%s.%s' % (type(page).__name__, frame.f_code.co_name)
+    return '%s.%s' % (frame.f_globals.get('__name__'), frame.f_code.co_name)
+
+
+class Wait(WebDriverWait):
+    """
+    A WebDriverWait that polls quickly at first and backs off towards the
+    usual half second, so conditions that hold almost at once cost little
+    wall time while long waits do not flood the browser with commands.
+    """
+
+    def __init__(self, driver, timeout, poll_frequency=LAST_POLL, ignored_exceptions=None):
+        WebDriverWait.__init__(self, driver, timeout, poll_frequency, ignored_exceptions)
+        self._last_poll = poll_frequency
+
+    def until(self, method, message=''):
+        return self._wait(method, message, False, sys._getframe(1))
+
+    def until_not(self, method, message=''):
+        return self._wait(method, message, True, sys._getframe(1))
+
+    def _wait(self, method, message, negate, caller):
+        start = time.time()
+        end_time = start + self._timeout
+        poll = min(FIRST_POLL, self._last_poll)
+        polls = 0
+        timed_out = False
+        screen = stacktrace = None
+        try:
+            while True:
+                polls += 1
+                try:
+                    value = method(self._driver)
+                    if bool(value) != negate:
+                        return value
+                except self._ignored_exceptions as exception:
+                    if negate:
+                        # the element until_not waited on is gone
+                        return True
+                    screen = getattr(exception, 'screen', None)
+                    stacktrace = getattr(exception, 'stacktrace', None)
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    break
+                time.sleep(min(poll, remaining))
+                poll = min(poll * BACKOFF, self._last_poll)
+            timed_out = True
+            raise TimeoutException(message, screen, stacktrace)
+        finally:
+            for listener in list(_listeners):
+                listener(_call_site(caller), time.time() - start, polls, timed_out)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Turns off CSS and jQuery animations so page objects do not wait on them.
+
+With --noanimations a stylesheet that zeroes every transition and
+animation, and jQuery.fx.off, are put into each page the browser lands on
+after a navigation, a click, an ActionChains click, a submit, or keys
+holding Enter or Return. Carousels, hover menus and the image viewer then
+move in no time. A page reached any other way, like a redirect by a
+script or a timer, keeps its animations until the next such command.
+
+Tests that check animated behaviour keep their animations with a marker,
+either for the whole test:
+
+    @pytest.mark.animations
+
+or only while pages of the given classes send the commands, directly or
+from inside the methods of other pages, as Details sends those of its
+ImageViewer:
+
+    @pytest.mark.animations('DiscoveryPane', 'ImageViewer')
+'''
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+
+from utils import commands
+
+# commands after which the browser may be on a new document; ActionChains
+# clicks are sent as mouse commands, or as W3C actions
+PAGE_CHANGING_COMMANDS = commands.NAVIGATION_COMMANDS | frozenset(
+    getattr(Command, name) for name in [
+        'CLICK_ELEMENT', 'SUBMIT_ELEMENT', 'CLICK', 'DOUBLE_CLICK', 'MOUSE_UP', 'W3C_ACTIONS']
+    if hasattr(Command, name))
+
+# typing these keys may submit a form
+SEND_KEYS_COMMANDS = frozenset([Command.SEND_KEYS_TO_ELEMENT, Command.SEND_KEYS_TO_ACTIVE_ELEMENT])
+SUBMITTING_KEYS = frozenset([Keys.RETURN, Keys.ENTER])
+
+SCRIPT = """
+var off = arguments[0];
+var style = document.getElementById('no-animations');
+if (off && !style) {
+    style = document.createElement('style');
+    style.id = 'no-animations';
+    style.textContent = '*, *::before, *::after {' +
+        ' transition-duration: 0s !important; transition-delay: 0s !important;' +
+        ' animation-duration: 0s !important; animation-delay: 0s !important;' +
+        ' scroll-behavior: auto !important; }';
+    (document.head || document.documentElement).appendChild(style);
+} else if (!off && style) {
+    style.parentNode.removeChild(style);
+}
+if (window.jQuery) {
+    jQuery.fx.off = off;
+}
+"""
+
+
+def pytest_addoption(parser):
+    parser.addoption("--noanimations",
+                     action="store_true",
+                     dest='no_animations',
+                     default=False,
+                     help="turn off CSS transitions and animations and jQuery effects in the browser.")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'animations(*page_classes): keep animations on during the test, '
+        'or only on pages of the given classes, when running with --noanimations.')
+
+
+def pytest_mozwebqa_testsetup(testsetup, request):
+    if not request.config.option.no_animations or not commands.supports_listeners(testsetup.selenium):
+        return
+    marker = request.node.get_marker('animations')
+    if marker is not None and not marker.args:
+        return
+    animated_pages = frozenset(marker.args if marker is not None else ())
+    driver = testsetup.selenium
+
+    def turn_off_animations(command, params, duration):
+        if command in SEND_KEYS_COMMANDS:
+            if not SUBMITTING_KEYS & set(u''.join(params.get('value', []))):
+                return
+        elif command not in PAGE_CHANGING_COMMANDS:
+            return
+        animated = bool(animated_pages & commands.page_object_classes())
+        try:
+            driver.execute_script(SCRIPT, not animated)
+        except WebDriverException:
+            # an alert or a closed window; the next page change tries again
+            pass
+    commands.add_listener(driver, turn_off_animations)
+    request.addfinalizer(lambda: commands.remove_listener(driver, turn_off_animations))
@@ -0,0 +1,421 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+In-process HTTP(S) proxy that keeps assets no assertion looks at off the wire.
+
+With --blockassets the browser is pointed at a local proxy that blocks or
+stubs requests according to a set of rules: images, fonts, analytics and
+other third-party hosts by default, or the rules of a JSON file passed with
+--assetrules:
+
+    {"rules": [
+        {"class": "analytics", "action": "block", "hosts": ["google-analytics.com"]},
+        {"class": "image", "action": "stub", "extensions": ["png", "jpg"]},
+        {"class": "tracking", "action": "block", "path": "/__utm\\\\.gif"}
+    ]}
+
+All the criteria of a rule have to match. HTTPS traffic is decrypted with a
+throwaway self-signed certificate (the browser is told to trust any issuer)
+so path rules apply to it too; without openssl on the PATH only host rules
+are applied to HTTPS and everything else is tunnelled untouched.
+
+Tests marked 'assets' get every request passed through. A summary of the
+requests and bytes saved is printed at the end of the run.
+'''
+
+import BaseHTTPServer
+import SocketServer
+import httplib
+import json
+import os
+import re
+import select
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import urlparse
+
+from collections import defaultdict
+
+# a transparent 1x1 gif
+STUB_IMAGE = 'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00!\xf9\x04\x01\x00\x00\x00\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+
+STUBS = {
+    'image': ('image/gif', STUB_IMAGE),
+    'font': ('application/font-woff', ''),
+    'script': ('application/javascript', ''),
+    'stylesheet': ('text/css', ''),
+}
+
+# used to estimate the bytes saved until the run has seen a real asset of the class
+TYPICAL_SIZES = {
+    'image': 25000,
+    'font': 40000,
+    'script': 30000,
+    'stylesheet': 10000,
+    'analytics': 15000,
+}
+
+DEFAULT_RULES = [
+    {'class': 'analytics', 'action': 'block',
+     'hosts': ['google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+               'optimizely.com', 'newrelic.com', 'nr-data.net']},
+    {'class': 'image', 'action': 'stub',
+     'extensions': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'ico', 'svg']},
+    {'class': 'font', 'action': 'stub',
+     'extensions': ['woff', 'woff2', 'ttf', 'otf', 'eot']},
+]
+
+HOP_BY_HOP_HEADERS = frozenset([
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'proxy-connection', 'te', 'trailers', 'transfer-encoding', 'upgrade'])
+
+BUFFER_SIZE = 65536
+
+
+class Rule(object):
+
+    def __init__(self, asset_class, action='block', hosts=(), extensions=(), path=None):
+        if action not in ('block', 'stub'):
+            raise ValueError("Unknown asset rule action '%s'" % action)
+        self.asset_class = asset_class
+        self.action = action
+        self.hosts = tuple(host.lower() for host in hosts)
+        self.extensions = frozenset(extension.lower().lstrip('.') for extension in extensions)
+        self.path = path and re.compile(path)
+
+    @classmethod
+    def from_dict(cls, values):
+        return cls(values['class'],
+                   action=values.get('action', 'block'),
+                   hosts=values.get('hosts', ()),
+                   extensions=values.get('extensions', ()),
+                   path=values.get('path'))
+
+    @property
+    def is_host_rule(self):
+        """True if the rule can be decided from the host alone."""
+        return bool(self.hosts) and not self.extensions and not self.path
+
+    def matches_host(self, host):
+        host = host.lower()
+        return any(host == h or host.endswith('.' + h) for h in self.hosts)
+
+    def matches(self, host, path):
+        if self.hosts and not self.matches_host(host):
+            return False
+        if self.extensions:
+            extension = os.path.splitext(urlparse.urlsplit(path).path)[1].lower().lstrip('.')
+            if extension not in self.extensions:
+                return False
+        if self.path and not self.path.search(path):
+            return False
+        return True
+
+
+class ProxyStatistics(object):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_passed = 0
+        self.bytes_tunnelled = 0
+        self.blocked = defaultdict(int)
+        self.stubbed = defaultdict(int)
+        self._seen = defaultdict(lambda: [0, 0])
+
+    def record_passed(self, asset_class, size):
+        with self._lock:
+            self.requests += 1
+            self.bytes_passed += size
+            if asset_class:
+                seen = self._seen[asset_class]
+                seen[0] += 1
+                seen[1] += size
+
+    def record_tunnelled(self, size):
+        with self._lock:
+            self.bytes_tunnelled += size
+
+    def record_saved(self, rule):
+        with self._lock:
+            self.requests += 1
+            if rule.action == 'stub':
+                self.stubbed[rule.asset_class] += 1
+            else:
+                self.blocked[rule.asset_class] += 1
+
+    def average_size(self, asset_class):
+        count, size = self._seen.get(asset_class, (0, 0))
+        if count:
+            return size / count
+        return TYPICAL_SIZES.get(asset_class, 0)
+
+    @property
+    def requests_saved(self):
+        return sum(self.blocked.values()) + sum(self.stubbed.values())
+
+    @property
+    def bytes_saved(self):
+        """Estimated from the assets of the same class that were let through."""
+        saved = defaultdict(int, self.blocked)
+        for asset_class, count in self.stubbed.items():
+            saved[asset_class] += count
+        return sum(self.average_size(asset_class) * count for asset_class, count in saved.items())
+
+    def summary_lines(self):
+        lines = ['%d of %d requests blocked or stubbed, about %.1f KB saved '
+                 '(%.1f KB passed, %.1f KB tunnelled)' % (
+                     self.requests_saved, self.requests, self.bytes_saved / 1024.0,
+                     self.bytes_passed / 1024.0, self.bytes_tunnelled / 1024.0)]
+        for asset_class in sorted(set(self.blocked) | set(self.stubbed)):
+            lines.append('  %-12s blocked: %5d  stubbed: %5d' % (
+                asset_class, self.blocked.get(asset_class, 0), self.stubbed.get(asset_class, 0)))
+        return lines
+
+
+class ProxyHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # scheme and host of intercepted HTTPS connections, None for plain HTTP
+    origin = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _rule_for(self, host, path):
+        if self.server.allow_assets:
+            return None
+        for rule in self.server.rules:
+            if rule.matches(host, path):
+                return rule
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_CONNECT(self):
+        host, _, port = self.path.partition(':')
+        rule = None
+        if not self.server.allow_assets:
+            rule = next((r for r in self.server.rules if r.is_host_rule and r.matches_host(host)), None)
+        if rule:
+            self.server.statistics.record_saved(rule)
+            self._send(403, 'text/plain', '')
+            return
+        self.send_response(200, 'Connection Established')
+        self.end_headers()
+        self.close_connection = 1
+        if self.server.certificate:
+            self._intercept('https://%s' % self.path)
+        else:
+            self._tunnel(host, int(port or 443))
+
+    def _intercept(self, origin):
+        certificate, key = self.server.certificate
+        try:
+            connection = ssl.wrap_socket(self.connection, certfile=certificate,
+                                         keyfile=key, server_side=True)
+            InterceptingHandler(connection, self.client_address, self.server, origin)
+        except (ssl.SSLError, socket.error):
+            # the browser dropped the connection, there is nobody left to answer
+            pass
+
+    def _tunnel(self, host, port):
+        try:
+            upstream = socket.create_connection((host, port), timeout=self.server.upstream_timeout)
+        except socket.error:
+            return
+        sockets = [self.connection, upstream]
+        try:
+            while True:
+                readable, _, errored = select.select(sockets, [], sockets, self.server.upstream_timeout)
+                if errored or not readable:
+                    break
+                for source in readable:
+                    data = source.recv(BUFFER_SIZE)
+                    if not data:
+                        return
+                    target = source is upstream and self.connection or upstream
+                    target.sendall(data)
+                    self.server.statistics.record_tunnelled(len(data))
+        finally:
+            upstream.close()
+
+    def _forward(self):
+        url = self.origin and self.origin + self.path or self.path
+        parts = urlparse.urlsplit(url)
+        host = parts.hostname or ''
+        path = urlparse.urlunsplit(('', '', parts.path or '/', parts.query, ''))
+
+        rule = self._rule_for(host, path)
+        if rule:
+            self.server.statistics.record_saved(rule)
+            if rule.action == 'stub':
+                self._send(200, *STUBS.get(rule.asset_class, ('text/plain', '')))
+            else:
+                self._send(404, 'text/plain', '')
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = length and self.rfile.read(length) or None
+        headers = dict((name, value) for name, value in self.headers.items()
+                       if name.lower() not in HOP_BY_HOP_HEADERS)
+        if parts.scheme == 'https':
+            upstream = httplib.HTTPSConnection(parts.netloc, timeout=self.server.upstream_timeout,
+                                               context=self.server.upstream_context)
+        else:
+            upstream = httplib.HTTPConnection(parts.netloc, timeout=self.server.upstream_timeout)
+        try:
+            upstream.request(self.command, path, body, headers)
+            response = upstream.getresponse()
+            content = response.read()
+        except (socket.error, httplib.HTTPException):
+            self._send(502, 'text/plain', '')
+            return
+        finally:
+            upstream.close()
+
+        self.send_response(response.status, response.reason)
+        for name, value in response.getheaders():
+            if name.lower() not in HOP_BY_HOP_HEADERS and name.lower() != 'content-length':
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(content)
+        self.server.statistics.record_passed(self._asset_class(host, path), len(content))
+
+    def _asset_class(self, host, path):
+        """Looks for a rule the request would have matched had assets been blocked."""
+        for rule in self.server.rules:
+            if rule.matches(host, path):
+                return rule.asset_class
+
+    do_GET = do_POST = do_HEAD = do_PUT = do_DELETE = do_OPTIONS = _forward
+
+
+class InterceptingHandler(ProxyHandler):
+    """Serves the requests sent inside a decrypted CONNECT tunnel."""
+
+    def __init__(self, request, client_address, server, origin):
+        self.origin = origin
+        ProxyHandler.__init__(self, request, client_address, server)
+
+
+class AssetProxy(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, rules, timeout=60, intercept_https=True):
+        BaseHTTPServer.HTTPServer.__init__(self, ('localhost', 0), ProxyHandler)
+        self.rules = rules
+        self.upstream_timeout = timeout
+        # like pytest-mozwebqa, do not insist on valid certificates in test environments
+        self.upstream_context = ssl.create_default_context()
+        self.upstream_context.check_hostname = False
+        self.upstream_context.verify_mode = ssl.CERT_NONE
+        self.allow_assets = False
+        self.statistics = ProxyStatistics()
+        self._certificate_directory = None
+        self.certificate = intercept_https and self._create_certificate() or None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def _create_certificate(self):
+        self._certificate_directory = tempfile.mkdtemp(prefix='asset-proxy-')
+        certificate = os.path.join(self._certificate_directory, 'proxy.crt')
+        key = os.path.join(self._certificate_directory, 'proxy.key')
+        try:
+            subprocess.check_call(
+                ['openssl', 'req', '-x509', '-nodes', '-newkey', 'rsa:2048', '-days', '1',
+                 '-subj', '/CN=asset-proxy', '-keyout', key, '-out', certificate],
+                stdout=open(os.devnull, 'w'), stderr=subprocess.STDOUT)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return certificate, key
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, name='asset-proxy')
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._certificate_directory:
+            shutil.rmtree(self._certificate_directory, ignore_errors=True)
+
+
+def load_rules(path=None):
+    if path:
+        with open(path) as rules_file:
+            values = json.load(rules_file)['rules']
+    else:
+        values = DEFAULT_RULES
+    return [Rule.from_dict(rule) for rule in values]
+
+
+def pytest_addoption(parser):
+    parser.addoption("--blockassets",
+                     action="store_true",
+                     dest='block_assets',
+                     default=False,
+                     help="route the browser through a local proxy that blocks images, fonts and third-party hosts.")
+    parser.addoption("--assetrules",
+                     action="store",
+                     dest='asset_rules',
+                     metavar='path',
+                     default=None,
+                     help="json file with the blocking rules to use instead of the default ones.")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'assets: the test checks images or other assets, '
+        'let its requests through the --blockassets proxy.')
+
+    if not config.option.block_assets or hasattr(config, 'asset_proxy'):
+        return
+    config.asset_proxy = AssetProxy(load_rules(config.option.asset_rules),
+                                    timeout=config.option.webqatimeout)
+    config.asset_proxy.start()
+    config.option.proxy_host = 'localhost'
+    config.option.proxy_port = config.asset_proxy.port
+    if config.asset_proxy.certificate:
+        # the browser has to accept the proxy's self-signed certificate
+        config.option.assume_untrusted = True
+
+
+def pytest_unconfigure(config):
+    proxy = getattr(config, 'asset_proxy', None)
+    if proxy:
+        proxy.stop()
+        del config.asset_proxy
+
+
+def pytest_runtest_setup(item):
+    proxy = getattr(item.config, 'asset_proxy', None)
+    if proxy:
+        proxy.allow_assets = 'assets' in item.keywords
+
+
+def pytest_terminal_summary(terminalreporter):
+    proxy = getattr(terminalreporter.config, 'asset_proxy', None)
+    if proxy:
+        terminalreporter.write_sep('-', 'asset proxy')
+        for line in proxy.statistics.summary_lines():
+            terminalreporter.write_line(line)
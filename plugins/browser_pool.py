@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Keeps browsers launched ahead of the tests that will use them.
+
+pytest-mozwebqa launches a browser in the setup of every test and quits it
+in the teardown, both on the critical path. With --browserpool=K a pool
+keeps K browsers launched by background threads. Each test still gets a
+browser of its own, but it is taken from the pool, a replacement starts
+launching straight away and the used one is quit in the background. The
+run summary shows how long tests waited on the pool.
+
+With --profiletemplate each pooled browser starts from a clone of the
+template of its own, as running instances of Firefox cannot share a cache.
+'''
+
+import itertools
+import os
+import Queue
+import shutil
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from utils import firefox_profile
+
+# the longest a test waits for a browser before giving up
+ACQUIRE_TIMEOUT = 300
+
+
+class BrowserPool(object):
+
+    def __init__(self, launch, size, after_quit=None):
+        self.launch = launch
+        self.size = size
+        self.after_quit = after_quit
+        self.idle = Queue.Queue()
+        self.lock = threading.Lock()
+        self.launching = 0
+        self.closed = False
+        self.acquired = 0
+        self.immediate = 0
+        self.waited = 0.0
+        self.longest_wait = 0.0
+        self.launches = 0
+        self.launch_time = 0.0
+        self.failures = 0
+        self.discarded = 0
+
+    def _in_background(self, target, *args):
+        thread = threading.Thread(target=target, args=args)
+        thread.daemon = True
+        thread.start()
+
+    def fill(self):
+        """Starts launching browsers until K are idle or on their way."""
+        with self.lock:
+            if self.closed:
+                return
+            missing = max(self.size - self.idle.qsize() - self.launching, 0)
+            self.launching += missing
+        for i in range(missing):
+            self._in_background(self._launch)
+
+    def _launch(self):
+        start = time.time()
+        driver = error = None
+        try:
+            driver = self.launch()
+        except Exception as exception:
+            error = exception
+        with self.lock:
+            self.launching -= 1
+            self.launches += 1
+            self.launch_time += time.time() - start
+            self.failures += error is not None
+            closed = self.closed
+        if closed and driver is not None:
+            self._quit(driver)
+        else:
+            # a failed launch is handed to the test waiting for it, which raises it
+            self.idle.put((driver, error))
+
+    def _is_alive(self, driver):
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def acquire(self):
+        start = time.time()
+        immediate = not self.idle.empty()
+        while True:
+            self.fill()
+            try:
+                driver, error = self.idle.get(timeout=ACQUIRE_TIMEOUT)
+            except Queue.Empty:
+                raise WebDriverException('No browser launched in %s seconds' % ACQUIRE_TIMEOUT)
+            if error is not None:
+                self.fill()
+                raise error
+            if self._is_alive(driver):
+                break
+            # the browser crashed while it sat in the pool
+            self.discarded += 1
+            immediate = False
+            self._in_background(self._quit, driver)
+        self.fill()
+        waited = time.time() - start
+        with self.lock:
+            self.acquired += 1
+            self.immediate += immediate
+            self.waited += waited
+            self.longest_wait = max(self.longest_wait, waited)
+        return driver
+
+    def release(self, driver):
+        self._in_background(self._quit, driver)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        if self.after_quit is not None:
+            self.after_quit(driver)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+        while not self.idle.empty():
+            driver, error = self.idle.get()
+            if driver is not None:
+                self._quit(driver)
+
+    def summary_lines(self):
+        lines = ['%d browsers handed out, %d of them without waiting' % (self.acquired, self.immediate),
+                 'waited %.1f s in all, %.1f s at most' % (self.waited, self.longest_wait)]
+        if self.launches:
+            lines.append('%d browsers launched in %.1f s on average, %d failed to launch, %d crashed while idle' % (
+                self.launches, self.launch_time / self.launches, self.failures, self.discarded))
+        return lines
+
+
+def pytest_addoption(parser):
+    parser.addoption("--browserpool",
+                     action="store",
+                     dest='browser_pool',
+                     metavar='int',
+                     type=int,
+                     default=0,
+                     help="number of browsers to keep launched in the background for the next tests. (default: %default)")
+
+
+def pytest_configure(config):
+    option = config.option
+    if not option.browser_pool or option.api.upper() != 'WEBDRIVER' or getattr(option, 'sauce_labs_credentials_file', None):
+        # Sauce Labs names each session after its test, so it cannot launch them ahead
+        return
+    if hasattr(config, 'browser_pool'):
+        return
+    from pytest_mozwebqa.selenium_client import Client
+    start_webdriver_client = Client.start_webdriver_client
+    stop = Client.stop
+    config._browser_pool_client_methods = (start_webdriver_client, stop)
+
+    slave_input = getattr(config, 'slaveinput', None)
+    worker = slave_input['slaveid'] if slave_input else 'master'
+    numbers = itertools.count()
+
+    def launch():
+        client = Client('browser pool', option)
+        clone = None
+        template = getattr(config, 'profile_template', None)
+        if template is not None:
+            clone = os.path.join(template, 'workers', '%s-%d' % (worker, next(numbers)))
+            client.profile_path = firefox_profile.clone(template, clone)
+        try:
+            start_webdriver_client(client)
+        except Exception:
+            if clone is not None:
+                shutil.rmtree(clone, ignore_errors=True)
+            raise
+        client.selenium._profile_clone = clone
+        return client.selenium
+
+    def remove_clone(driver):
+        clone = getattr(driver, '_profile_clone', None)
+        if clone is not None:
+            shutil.rmtree(clone, ignore_errors=True)
+    pool = config.browser_pool = BrowserPool(launch, option.browser_pool, remove_clone)
+
+    # pytest-mozwebqa reports and takes screenshots through its client, so
+    # the client stays and only its browser comes from the pool
+    def start_from_pool(client):
+        client.selenium = pool.acquire()
+
+    def stop_in_background(client):
+        if client.webdriver:
+            pool.release(client.selenium)
+        else:
+            stop(client)
+    Client.start_webdriver_client = start_from_pool
+    Client.stop = stop_in_background
+
+
+def pytest_sessionstart(session):
+    pool = getattr(session.config, 'browser_pool', None)
+    if pool is not None:
+        # launched once every plugin is configured, the profile template among them
+        pool.fill()
+
+
+def pytest_unconfigure(config):
+    pool = getattr(config, 'browser_pool', None)
+    if pool is None:
+        return
+    from pytest_mozwebqa.selenium_client import Client
+    Client.start_webdriver_client, Client.stop = config._browser_pool_client_methods
+    pool.close()
+    del config.browser_pool
+
+
+def pytest_terminal_summary(terminalreporter):
+    pool = getattr(terminalreporter.config, 'browser_pool', None)
+    if pool is None or not pool.acquired:
+        return
+    terminalreporter.write_sep('-', 'browser pool')
+    for line in pool.summary_lines():
+        terminalreporter.write_line(line)
@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Browserless mode for tests that only read server-rendered HTML.
+
+Tests marked 'browserless' are run against BrowserlessDriver when py.test
+is called with --browserless. The driver fetches pages over the shared
+pooled HTTP session and answers find_element(s) from the parsed document,
+so no browser is launched for them. Anything that needs a real browser
+(clicks, typing, scripts, layout) raises BrowserlessError straight away
+instead of hanging in a wait.
+'''
+
+import re
+import urlparse
+
+import lxml.html
+import pytest
+from cssselect import HTMLTranslator
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from utils.http_session import shared_session
+
+
+# elements whose boundaries start a new line in the rendered text
+BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'header', 'hgroup', 'hr', 'li', 'nav', 'ol', 'p', 'pre',
+    'section', 'table', 'tr', 'ul'])
+
+# elements that never contribute to the rendered text
+SKIPPED_TAGS = frozenset(['head', 'noscript', 'script', 'style', 'template'])
+
+# attributes WebDriver reports as 'true' when present
+BOOLEAN_ATTRIBUTES = frozenset(['checked', 'disabled', 'readonly', 'required', 'selected'])
+
+_translator = HTMLTranslator()
+_xpath_cache = {}
+
+
+class BrowserlessError(WebDriverException):
+    """Raised when a page object needs something only a real browser can do."""
+
+
+def _unsupported(name):
+    def method(self, *args, **kwargs):
+        raise BrowserlessError(
+            '%s is not available in browserless mode. '
+            "Remove the 'browserless' marker from the test." % name)
+    method.__name__ = name
+    return method
+
+
+def _to_xpath(by, value, scoped):
+    """
+    Translates a selenium locator to an XPath expression.
+
+    Scoped expressions only match descendants of the element they are
+    evaluated on, the way WebElement.find_element does.
+    """
+    key = (by, value, scoped)
+    if key not in _xpath_cache:
+        prefix = scoped and 'descendant::' or 'descendant-or-self::'
+        literal = _translator.xpath_literal
+        if by == By.XPATH:
+            xpath = value
+        elif by == By.ID:
+            xpath = '%s*[@id=%s]' % (prefix, literal(value))
+        elif by == By.NAME:
+            xpath = '%s*[@name=%s]' % (prefix, literal(value))
+        elif by == By.CLASS_NAME:
+            xpath = _translator.css_to_xpath('.%s' % value, prefix=prefix)
+        elif by in (By.CSS_SELECTOR, By.TAG_NAME):
+            xpath = _translator.css_to_xpath(value.strip(), prefix=prefix)
+        elif by == By.LINK_TEXT:
+            xpath = '%sa[normalize-space(.)=%s]' % (prefix, literal(value))
+        elif by == By.PARTIAL_LINK_TEXT:
+            xpath = '%sa[contains(normalize-space(.), %s)]' % (prefix, literal(value))
+        else:
+            raise BrowserlessError('Unsupported locator strategy: %s' % by)
+        _xpath_cache[key] = xpath
+    return _xpath_cache[key]
+
+
+def _is_hidden(node):
+    if node.get('hidden') is not None:
+        return True
+    if node.tag == 'input' and node.get('type') == 'hidden':
+        return True
+    style = node.get('style', '').replace(' ', '').lower()
+    return 'display:none' in style or 'visibility:hidden' in style
+
+
+def _collect_text(node, chunks):
+    if not isinstance(node.tag, basestring):
+        # comments and processing instructions
+        return
+    if node.tag == 'br':
+        chunks.append('\n')
+        return
+    if node.tag in SKIPPED_TAGS or _is_hidden(node):
+        return
+    block = node.tag in BLOCK_TAGS
+    if block:
+        chunks.append('\n')
+    if node.text:
+        chunks.append(re.sub(r'\s+', ' ', node.text))
+    for child in node:
+        _collect_text(child, chunks)
+        if child.tail:
+            chunks.append(re.sub(r'\s+', ' ', child.tail))
+    if block:
+        chunks.append('\n')
+
+
+def _render_text(node):
+    """Approximates the text WebDriver reports for an element."""
+    chunks = []
+    _collect_text(node, chunks)
+    lines = [line.replace(u'\xa0', ' ').strip() for line in ''.join(chunks).split('\n')]
+    return '\n'.join(line for line in lines if line)
+
+
+class BrowserlessElement(object):
+
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+
+    def find_element(self, by=By.ID, value=None):
+        return self._driver._find_element(self._node, by, value, scoped=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._driver._find_elements(self._node, by, value, scoped=True)
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        if not self.is_displayed():
+            return ''
+        return _render_text(self._node)
+
+    def get_attribute(self, name):
+        if name in BOOLEAN_ATTRIBUTES:
+            return self._node.get(name) is not None and 'true' or None
+        if name == 'value' and self._node.tag == 'textarea':
+            return self._node.text or ''
+        value = self._node.get(name)
+        if value is not None and name in ('href', 'src'):
+            # WebDriver returns the resolved property rather than the raw attribute
+            return urlparse.urljoin(self._driver.current_url, value)
+        return value
+
+    def is_displayed(self):
+        return not any(_is_hidden(node) for node in self._node.iterancestors()) and \
+            not _is_hidden(self._node)
+
+    def is_selected(self):
+        return self.get_attribute('checked') is not None or self.get_attribute('selected') is not None
+
+    def is_enabled(self):
+        return self.get_attribute('disabled') is None
+
+    click = _unsupported('click')
+    clear = _unsupported('clear')
+    submit = _unsupported('submit')
+    send_keys = _unsupported('send_keys')
+    value_of_css_property = _unsupported('value_of_css_property')
+    location = property(_unsupported('location'))
+    size = property(_unsupported('size'))
+
+
+class BrowserlessDriver(object):
+    """
+    Stands in for a WebDriver when a test only reads server-rendered HTML.
+
+    Navigation fetches the page over the shared HTTP session, so the
+    connection to AMO is reused across pages and tests. Page objects keep
+    using self.selenium.find_element(s) as usual.
+    """
+
+    def __init__(self, timeout=60, session=None):
+        self._session = session or shared_session()
+        self._timeout = timeout
+        self._history = []
+        self._document = None
+        self.current_url = None
+
+    def _load(self, url):
+        response = self._session.get(url, timeout=self._timeout)
+        self._document = lxml.html.document_fromstring(response.content, base_url=response.url)
+        self.current_url = response.url
+
+    def get(self, url):
+        self._load(url)
+        self._history.append(self.current_url)
+
+    def back(self):
+        if len(self._history) > 1:
+            self._history.pop()
+            self._load(self._history[-1])
+
+    def refresh(self):
+        self._load(self.current_url)
+
+    @property
+    def title(self):
+        if self._document is None:
+            return ''
+        return re.sub(r'\s+', ' ', self._document.findtext('.//title') or '').strip()
+
+    @property
+    def page_source(self):
+        return lxml.html.tostring(self._document, encoding=unicode)
+
+    def _find_elements(self, node, by, value, scoped):
+        if node is None:
+            return []
+        return [BrowserlessElement(self, match)
+                for match in node.xpath(_to_xpath(by, value, scoped))]
+
+    def _find_element(self, node, by, value, scoped):
+        elements = self._find_elements(node, by, value, scoped)
+        if not elements:
+            raise NoSuchElementException('Unable to locate element: %s=%s on %s' % (by, value, self.current_url))
+        return elements[0]
+
+    def find_element(self, by=By.ID, value=None):
+        return self._find_element(self._document, by, value, scoped=False)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._find_elements(self._document, by, value, scoped=False)
+
+    def implicitly_wait(self, seconds):
+        # the document is complete once fetched, there is nothing to wait for
+        pass
+
+    def maximize_window(self):
+        pass
+
+    def quit(self):
+        self._document = None
+        self._history = []
+
+    close = quit
+    execute = _unsupported('execute')
+    execute_script = _unsupported('execute_script')
+    execute_async_script = _unsupported('execute_async_script')
+    get_screenshot_as_base64 = _unsupported('get_screenshot_as_base64')
+
+
+def pytest_addoption(parser):
+    parser.addoption("--browserless",
+                     action="store_true",
+                     dest='browserless',
+                     default=False,
+                     help="run tests marked 'browserless' against fetched HTML instead of a browser.")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'browserless: the test only reads server-rendered HTML '
+        'and can run without a browser when --browserless is given.')
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.option.browserless:
+        return
+    for item in items:
+        if 'browserless' in item.keywords:
+            # stops pytest-mozwebqa from launching a browser for the test
+            item.keywords['skip_selenium'] = pytest.mark.skip_selenium
+
+
+def pytest_mozwebqa_testsetup(testsetup, request):
+    if request.config.option.browserless and 'browserless' in request.keywords:
+        driver = BrowserlessDriver(timeout=testsetup.timeout)
+        testsetup.selenium = driver
+        testsetup.default_implicit_wait = 0
+        request.addfinalizer(driver.quit)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Limits the WebDriver round trips a test may use.
+
+A budget caps the commands and navigations of a test. It is declared
+with a marker:
+
+    @pytest.mark.command_budget(commands=120, navigations=2)
+
+or in the json file passed to --commandbudgets, keyed by patterns of test ids
+relative to the repository root:
+
+    {"budgets": {"tests/desktop/test_search.py::*": {"commands": 300},
+                 "tests/desktop/test_details_page.py::TestDetails::test_that_*": {"navigations": 1}}}
+
+The marker wins over the file, and in the file the longest matching
+pattern wins. Tests over budget fail, or only show up in the run summary
+with --budgetmode=warn. --commandbaseline compares the counts with the
+ones recorded by an earlier run with --updatebaseline.
+'''
+
+import json
+import os
+from fnmatch import fnmatch
+
+import pytest
+
+from utils import commands
+
+LIMITS = ('commands', 'navigations')
+
+# budgets and baselines name tests relative to here, wherever py.test runs from
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def budget_key(item):
+    path = os.path.relpath(str(item.fspath), PROJECT_ROOT).replace(os.sep, '/')
+    return '::'.join([path] + item.nodeid.split('::')[1:])
+
+
+class CommandBudgets(object):
+
+    def __init__(self, budgets=None, baseline=None):
+        self.budgets = budgets or {}
+        self.baseline = baseline or {}
+        self.counts = {}
+        self.over_budget = {}
+
+    @classmethod
+    def load(cls, budgets_path=None, baseline_path=None):
+        budgets = baseline = None
+        if budgets_path:
+            with open(budgets_path) as budgets_file:
+                budgets = json.load(budgets_file)['budgets']
+        if baseline_path and os.path.exists(baseline_path):
+            with open(baseline_path) as baseline_file:
+                baseline = json.load(baseline_file)
+        return cls(budgets, baseline)
+
+    def budget_for(self, item):
+        marker = item.get_marker('command_budget')
+        if marker is not None:
+            return dict((limit, marker.kwargs[limit]) for limit in LIMITS if limit in marker.kwargs)
+        patterns = [pattern for pattern in self.budgets if fnmatch(budget_key(item), pattern)]
+        if patterns:
+            return self.budgets[max(patterns, key=len)]
+        return {}
+
+    def check(self, item, counts):
+        """Records the counts of a test and returns how it went over budget."""
+        self.counts[budget_key(item)] = dict(counts)
+        budget = self.budget_for(item)
+        overruns = ['%d %s, budget %d' % (counts[limit], limit, budget[limit])
+                    for limit in LIMITS if limit in budget and counts[limit] > budget[limit]]
+        if overruns:
+            self.over_budget[budget_key(item)] = overruns
+        return overruns
+
+    def baseline_lines(self):
+        lines = []
+        for test in sorted(self.counts):
+            if test not in self.baseline:
+                continue
+            changes = []
+            for limit in LIMITS:
+                difference = self.counts[test][limit] - self.baseline[test].get(limit, 0)
+                if difference:
+                    changes.append('%d %s (%+d)' % (self.counts[test][limit], limit, difference))
+            if changes:
+                lines.append('%s: %s' % (test, ', '.join(changes)))
+        return lines
+
+    def write_baseline(self, path):
+        baseline = dict(self.baseline)
+        baseline.update(self.counts)
+        with open(path, 'w') as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--commandbudgets",
+                     action="store",
+                     dest='command_budgets',
+                     metavar='path',
+                     default=None,
+                     help="json file with the WebDriver command budgets of the tests.")
+    parser.addoption("--budgetmode",
+                     action="store",
+                     dest='budget_mode',
+                     choices=('fail', 'warn'),
+                     default='fail',
+                     help="fail the tests that go over their command budget, or only warn. (default: %default)")
+    parser.addoption("--commandbaseline",
+                     action="store",
+                     dest='command_baseline',
+                     metavar='path',
+                     default=None,
+                     help="json file with the command counts to compare this run with.")
+    parser.addoption("--updatebaseline",
+                     action="store_true",
+                     dest='update_baseline',
+                     default=False,
+                     help="store the command counts of this run in --commandbaseline.")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'command_budget(commands, navigations): the most WebDriver '
+        'commands and navigations the test may use.')
+    config.command_budgets = CommandBudgets.load(config.option.command_budgets,
+                                                 config.option.command_baseline)
+
+
+def pytest_mozwebqa_testsetup(testsetup, request):
+    if not commands.supports_listeners(testsetup.selenium):
+        return
+    counts = request.node._command_counts = dict.fromkeys(LIMITS, 0)
+
+    def count(command, params, duration):
+        counts['commands'] += 1
+        if command in commands.NAVIGATION_COMMANDS:
+            counts['navigations'] += 1
+    commands.add_listener(testsetup.selenium, count)
+    request.addfinalizer(lambda: commands.remove_listener(testsetup.selenium, count))
+
+
+@pytest.mark.hookwrapper
+def pytest_runtest_call(item):
+    outcome = yield
+    counts = getattr(item, '_command_counts', None)
+    if counts is None or outcome.excinfo:
+        # a failing test keeps its own error
+        return
+    overruns = item.config.command_budgets.check(item, counts)
+    if overruns and item.config.option.budget_mode == 'fail':
+        pytest.fail('Over the WebDriver command budget: %s' % '; '.join(overruns))
+
+
+def pytest_terminal_summary(terminalreporter):
+    config = terminalreporter.config
+    budgets = getattr(config, 'command_budgets', None)
+    if budgets is None or not budgets.counts:
+        return
+    if budgets.over_budget:
+        terminalreporter.write_sep('-', 'tests over their WebDriver command budget')
+        for test in sorted(budgets.over_budget):
+            terminalreporter.write_line('%s: %s' % (test, '; '.join(budgets.over_budget[test])))
+    changes = budgets.baseline_lines()
+    if changes:
+        terminalreporter.write_sep('-', 'WebDriver commands compared with %s' % config.option.command_baseline)
+        for line in changes:
+            terminalreporter.write_line(line)
+    if config.option.command_baseline and config.option.update_baseline:
+        budgets.write_baseline(config.option.command_baseline)
+        terminalreporter.write_line('Command counts written to %s' % config.option.command_baseline)
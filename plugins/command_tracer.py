@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Traces the WebDriver commands each test sends.
+
+With --tracecommands every command is recorded with its latency, the page
+object method it was sent from (the outermost one on the stack, so
+'Details.title' rather than the helpers it calls) and the locator of find
+commands. The run summary lists the commands of each test and ranks the
+hottest page object methods. --tracefile also writes the commands as a
+Chrome trace that chrome://tracing can open.
+'''
+
+import json
+import os
+import time
+from collections import defaultdict, namedtuple
+
+import pytest
+
+from utils import commands
+
+CommandRecord = namedtuple('CommandRecord', 'test command locator caller start duration')
+
+# methods shown in the ranking of the run summary
+HOTTEST_METHODS = 20
+
+
+class CommandTracer(object):
+
+    def __init__(self):
+        self.started = time.time()
+        self.records = []
+        self.tests = []
+
+    def listener(self, test):
+        def record(command, params, duration):
+            self.records.append(CommandRecord(
+                test, command, commands.locator_of(command, params),
+                commands.page_object_caller() or '(test)', time.time() - duration, duration))
+        return record
+
+    def start_test(self, test):
+        self.tests.append([test, time.time(), None])
+
+    def stop_test(self):
+        self.tests[-1][2] = time.time()
+
+    def _by(self, key, records):
+        totals = defaultdict(lambda: [0, 0.0])
+        for record in records:
+            totals[key(record)][0] += 1
+            totals[key(record)][1] += record.duration
+        return sorted(totals.items(), key=lambda item: -item[1][1])
+
+    def test_lines(self):
+        per_test = defaultdict(list)
+        for record in self.records:
+            per_test[record.test].append(record)
+        lines = []
+        for test, start, stop in self.tests:
+            records = per_test[test]
+            if not records:
+                continue
+            lines.append('%s: %d commands, %.0f ms' % (
+                test, len(records), sum(record.duration for record in records) * 1000))
+            for caller, (count, duration) in self._by(lambda record: record.caller, records)[:3]:
+                lines.append('    %-60s %5d commands %8.0f ms' % (caller, count, duration * 1000))
+        return lines
+
+    def hottest_lines(self):
+        lines = ['%-60s %8s %10s' % ('page object method', 'commands', 'total ms')]
+        for caller, (count, duration) in self._by(lambda record: record.caller, self.records)[:HOTTEST_METHODS]:
+            lines.append('%-60s %8d %10.0f' % (caller, count, duration * 1000))
+        return lines
+
+    def _microseconds(self, seconds):
+        return int((seconds - self.started) * 1000000)
+
+    def chrome_trace(self):
+        """Returns the trace in the Trace Event Format Chrome understands."""
+        events = [{'name': test, 'cat': 'test', 'ph': 'X', 'pid': 1, 'tid': 1,
+                   'ts': self._microseconds(start),
+                   'dur': self._microseconds(stop or time.time()) - self._microseconds(start)}
+                  for test, start, stop in self.tests]
+        for record in self.records:
+            args = {'command': record.command, 'test': record.test}
+            if record.locator:
+                args['locator'] = record.locator
+            events.append({'name': record.caller, 'cat': record.command, 'ph': 'X', 'pid': 1, 'tid': 1,
+                           'ts': self._microseconds(record.start), 'dur': int(record.duration * 1000000),
+                           'args': args})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(path, 'w') as trace_file:
+            json.dump(self.chrome_trace(), trace_file)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--tracecommands",
+                     action="store_true",
+                     dest='trace_commands',
+                     default=False,
+                     help="record the WebDriver commands of each test and the page object methods sending them.")
+    parser.addoption("--tracefile",
+                     action="store",
+                     dest='trace_file',
+                     metavar='path',
+                     default=None,
+                     help="write the traced commands to a Chrome trace file (implies --tracecommands).")
+
+
+def pytest_configure(config):
+    if config.option.trace_commands or config.option.trace_file:
+        config.command_tracer = CommandTracer()
+
+
+@pytest.mark.trylast
+def pytest_mozwebqa_testsetup(testsetup, request):
+    tracer = getattr(request.config, 'command_tracer', None)
+    if tracer is None or not commands.supports_listeners(testsetup.selenium):
+        return
+    listener = tracer.listener(request.node.nodeid)
+    commands.add_listener(testsetup.selenium, listener)
+    tracer.start_test(request.node.nodeid)
+
+    def stop_tracing():
+        commands.remove_listener(testsetup.selenium, listener)
+        tracer.stop_test()
+    request.addfinalizer(stop_tracing)
+
+
+def pytest_terminal_summary(terminalreporter):
+    tracer = getattr(terminalreporter.config, 'command_tracer', None)
+    if tracer is None or not tracer.records:
+        return
+    terminalreporter.write_sep('-', 'WebDriver commands per test')
+    for line in tracer.test_lines():
+        terminalreporter.write_line(line)
+    terminalreporter.write_sep('-', 'hottest page object methods')
+    for line in tracer.hottest_lines():
+        terminalreporter.write_line(line)
+    path = terminalreporter.config.option.trace_file
+    if path:
+        tracer.write_chrome_trace(path)
+        terminalreporter.write_line('Chrome trace written to %s' % path)
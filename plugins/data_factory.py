@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Gives tests a factory of collections, reviews and favorites made over HTTP.
+
+Tests that only need such data to be there, not to be made through the
+browser, ask for the data_factory fixture, logged in as the default user
+of --variables:
+
+    def test_user_my_favorites_page(self, mozwebqa, existing_user, data_factory):
+        data_factory.favorite('firebug')
+
+One factory serves the whole run. With --datapool=N it makes N
+collections ahead, which tests take with data_factory.collection() and
+give back with data_factory.release(url). Everything it made is deleted
+at the end of the run.
+'''
+
+import pytest
+
+from utils.data_factory import DataFactory
+
+
+def pytest_addoption(parser):
+    parser.addoption("--datapool",
+                     action="store",
+                     dest='data_pool',
+                     metavar='int',
+                     type=int,
+                     default=0,
+                     help="number of collections the data factory makes ahead for tests to share. (default: %default)")
+
+
+def pytest_configure(config):
+    config.data_factory = None
+    config.data_factory_errors = []
+
+
+@pytest.fixture(scope='session')
+def data_factory(request, variables):
+    """Returns the factory of the run, logged in as the default user."""
+    config = request.config
+    if config.data_factory is None:
+        user = variables['users']['default']
+        config.data_factory = DataFactory(config.option.base_url, user['email'], user['password'],
+                                          config.option.webqatimeout)
+        config.data_factory.fill(config.option.data_pool)
+    return config.data_factory
+
+
+def pytest_sessionfinish(session):
+    factory = session.config.data_factory
+    if factory is not None:
+        session.config.data_factory_errors = factory.cleanup()
+
+
+def pytest_terminal_summary(terminalreporter):
+    config = terminalreporter.config
+    factory = getattr(config, 'data_factory', None)
+    if factory is None:
+        return
+    terminalreporter.write_sep('-', 'data factory')
+    terminalreporter.write_line('%d entities made over HTTP, %d pooled collections reused' % (
+        factory.created, factory.reused))
+    for error in config.data_factory_errors:
+        terminalreporter.write_line('could not clean up %s' % error)
@@ -0,0 +1,14 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+
+def pytest_mozwebqa_testsetup(testsetup, request):
+    """
+    Called once the mozwebqa funcarg has built the TestSetup of a test.
+
+    Plugins can replace or wrap testsetup.selenium here before any page
+    object gets hold of it.
+    """
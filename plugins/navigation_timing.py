@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Records the browser's timing of every page object navigation.
+
+With --navigationtimings each page object navigation reads the navigation and
+resource timing of the new page in one script call, leaves them on the
+page object as navigation_timing and resource_timing, and appends them to
+a json lines file keyed by page class and url. Runs append to the same
+file, so it grows into a time series of how fast AMO serves its pages.
+'''
+
+import json
+import os
+import time
+
+from utils import commands
+from utils import navigation_timing
+
+
+class NavigationTimings(object):
+
+    def __init__(self, path=None):
+        self.path = path
+        # other plugins switch collection on when they need the timings
+        self.enabled = path is not None
+        self.run = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self.count = 0
+
+    def listener(self, test):
+        def record(page, url):
+            with commands.unobserved(page.selenium):
+                timing, resources = navigation_timing.collect(page.selenium)
+                if url is None:
+                    url = page.selenium.current_url
+            page.navigation_timing = timing
+            page.resource_timing = resources
+            if self.path and timing is not None:
+                self.write({'run': self.run,
+                            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                            'test': test,
+                            'page': type(page).__name__,
+                            'url': url,
+                            'timing': timing,
+                            'resources': resources})
+        return record
+
+    def write(self, record):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(self.path, 'a') as timings_file:
+            timings_file.write(json.dumps(record, sort_keys=True) + '\n')
+        self.count += 1
+
+
+def pytest_addoption(parser):
+    parser.addoption("--navigationtimings",
+                     action="store",
+                     dest='navigation_timings',
+                     metavar='path',
+                     default=None,
+                     help="append the navigation and resource timing of every page object navigation to this json lines file.")
+
+
+def pytest_configure(config):
+    config.navigation_timings = NavigationTimings(config.option.navigation_timings)
+
+
+def pytest_mozwebqa_testsetup(testsetup, request):
+    timings = request.config.navigation_timings
+    if not timings.enabled or not commands.supports_listeners(testsetup.selenium):
+        return
+    listeners = testsetup.navigation_listeners = getattr(testsetup, 'navigation_listeners', [])
+    listeners.append(timings.listener(request.node.nodeid))
+
+
+def pytest_terminal_summary(terminalreporter):
+    timings = getattr(terminalreporter.config, 'navigation_timings', None)
+    if timings is None or not timings.count:
+        return
+    terminalreporter.write_sep('-', 'navigation timings')
+    terminalreporter.write_line('%d navigations appended to %s' % (timings.count, timings.path))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Holds AMO pages to performance budgets.
+
+The json file passed to --perfbudgets sets the budgets of each page class:
+
+    {"budgets": {"Details": {"ttfb": 400},
+                 "Home": {"dom_content_loaded": 1500},
+                 "SearchResultList": {"requests": 30, "bytes": 2000000}}}
+
+ttfb, dom_content_loaded and load are in milliseconds from the start of
+the navigation, requests counts the page and the resources it loaded and
+bytes adds up their transfer sizes. A page class without budgets of its
+own uses those of its closest base class that has some.
+
+Every page object navigation is checked against the budgets of its page,
+and tests whose pages went over budget fail, or only show up in the run
+summary with --perfbudgetmode=warn. The summary also gives the p50 and p95
+of each metric per page class across the run, parametrized tests included.
+'''
+
+import json
+
+import pytest
+
+from utils import commands
+
+METRICS = ('ttfb', 'dom_content_loaded', 'load', 'requests', 'bytes')
+
+UNITS = {'ttfb': 'ms', 'dom_content_loaded': 'ms', 'load': 'ms', 'requests': 'requests', 'bytes': 'bytes'}
+
+
+def metrics_of(timing, resources):
+    """Returns the budgeted metrics of a navigation that the browser reported."""
+    resources = resources or []
+    metrics = dict((name, timing[name]) for name in ('ttfb', 'dom_content_loaded', 'load')
+                   if timing.get(name) is not None)
+    metrics['requests'] = 1 + len(resources)
+    sizes = [size for size in [timing.get('transfer_size')] + [resource.get('transfer_size') for resource in resources]
+             if size is not None]
+    if sizes:
+        metrics['bytes'] = sum(sizes)
+    return metrics
+
+
+def percentile(values, percent):
+    """Returns the nearest-rank percentile of values."""
+    values = sorted(values)
+    rank = max(int(round(percent / 100.0 * len(values))), 1)
+    return values[rank - 1]
+
+
+class PerfBudgets(object):
+
+    def __init__(self, budgets=None):
+        self.budgets = budgets or {}
+        self.samples = {}
+        self.page_budgets = {}
+        self.over_budget = {}
+
+    @classmethod
+    def load(cls, path=None):
+        budgets = None
+        if path:
+            with open(path) as budgets_file:
+                budgets = json.load(budgets_file)['budgets']
+        return cls(budgets)
+
+    def budget_for(self, page):
+        for page_class in type(page).__mro__:
+            if page_class.__name__ in self.budgets:
+                return self.budgets[page_class.__name__]
+        return {}
+
+    def check(self, test, page):
+        """Records the timing of a navigation and returns how it went over budget."""
+        metrics = metrics_of(page.navigation_timing, page.resource_timing)
+        page_samples = self.samples.setdefault(type(page).__name__, {})
+        for name, value in metrics.items():
+            page_samples.setdefault(name, []).append(value)
+        budget = self.page_budgets[type(page).__name__] = self.budget_for(page)
+        overruns = ['%s %s %d %s, budget %d' % (type(page).__name__, name, metrics[name], UNITS[name], budget[name])
+                    for name in METRICS if name in budget and name in metrics and metrics[name] > budget[name]]
+        if overruns:
+            self.over_budget.setdefault(test, []).extend(overruns)
+        return overruns
+
+    def percentile_lines(self):
+        lines = ['%-40s %-25s %6s %10s %10s %10s' % ('page', 'metric', 'count', 'p50', 'p95', 'budget')]
+        for page in sorted(self.samples):
+            for name in METRICS:
+                values = self.samples[page].get(name)
+                if not values:
+                    continue
+                budget = self.page_budgets[page].get(name)
+                lines.append('%-40s %-25s %6d %10d %10d %10s' % (
+                    page, '%s (%s)' % (name, UNITS[name]), len(values),
+                    percentile(values, 50), percentile(values, 95), '' if budget is None else budget))
+        return lines
+
+
+def pytest_addoption(parser):
+    parser.addoption("--perfbudgets",
+                     action="store",
+                     dest='perf_budgets',
+                     metavar='path',
+                     default=None,
+                     help="json file with the performance budgets of the page classes.")
+    parser.addoption("--perfbudgetmode",
+                     action="store",
+                     dest='perf_budget_mode',
+                     choices=('fail', 'warn'),
+                     default='fail',
+                     help="fail the tests whose pages go over their performance budget, or only warn. (default: %default)")
+
+
+@pytest.mark.trylast
+def pytest_configure(config):
+    config.perf_budgets = PerfBudgets.load(config.option.perf_budgets)
+    if config.option.perf_budgets:
+        config.navigation_timings.enabled = True
+
+
+@pytest.mark.trylast
+def pytest_mozwebqa_testsetup(testsetup, request):
+    # runs after the navigation timing plugin added the listener reading the timings
+    if not request.config.option.perf_budgets or not commands.supports_listeners(testsetup.selenium):
+        return
+    budgets = request.config.perf_budgets
+    overruns = request.node._perf_overruns = []
+
+    def check(page, url):
+        if page.navigation_timing is not None:
+            overruns.extend(budgets.check(request.node.nodeid, page))
+    testsetup.navigation_listeners = getattr(testsetup, 'navigation_listeners', [])
+    testsetup.navigation_listeners.append(check)
+
+
+@pytest.mark.hookwrapper
+def pytest_runtest_call(item):
+    outcome = yield
+    overruns = getattr(item, '_perf_overruns', None)
+    if not overruns or outcome.excinfo:
+        # a failing test keeps its own error
+        return
+    if item.config.option.perf_budget_mode == 'fail':
+        pytest.fail('Over the performance budget: %s' % '; '.join(overruns))
+
+
+def pytest_terminal_summary(terminalreporter):
+    budgets = getattr(terminalreporter.config, 'perf_budgets', None)
+    if budgets is None or not budgets.samples:
+        return
+    if budgets.over_budget:
+        terminalreporter.write_sep('-', 'tests over their performance budget')
+        for test in sorted(budgets.over_budget):
+            terminalreporter.write_line('%s: %s' % (test, '; '.join(budgets.over_budget[test])))
+    terminalreporter.write_sep('-', 'page performance')
+    for line in budgets.percentile_lines():
+        terminalreporter.write_line(line)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Fetches the first page of the next test while the current one runs.
+
+Most tests open with Home(mozwebqa) or Details(mozwebqa, 'Firebug'), so
+the url they start on can be read from their source (parametrized
+arguments included). With --prefetch=http that url is requested in the
+background over the shared connection pool, which warms AMO's own caches
+and the DNS lookup. With --prefetch=browser the page of the current test
+gets <link rel=preconnect> and <link rel=prefetch> hints instead, so the
+browser warms its connection and HTTP cache itself.
+'''
+
+import ast
+import inspect
+import textwrap
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from utils import commands
+from utils.http_session import shared_session
+
+SCRIPT = """
+var head = document.head || document.documentElement;
+var origin = arguments[0].split('/').slice(0, 3).join('/');
+[['preconnect', origin], ['prefetch', arguments[0]]].forEach(function (hint) {
+    var link = document.createElement('link');
+    link.rel = hint[0];
+    link.href = hint[1];
+    head.appendChild(link);
+});
+"""
+
+
+def _argument(node, item):
+    """Returns the string an argument of a call evaluates to, where it is known before the test runs."""
+    if isinstance(node, ast.Str):
+        return node.s
+    params = getattr(getattr(item, 'callspec', None), 'params', {})
+    if isinstance(node, ast.Name) and isinstance(params.get(node.id), basestring):
+        return params[node.id]
+    return None
+
+
+def _calls(function):
+    try:
+        source = textwrap.dedent(inspect.getsource(function))
+    except (IOError, TypeError):
+        return []
+    calls = [node for node in ast.walk(ast.parse(source)) if isinstance(node, ast.Call)]
+    return sorted(calls, key=lambda call: (call.lineno, call.col_offset))
+
+
+def first_url(item, base_url):
+    """Returns the url the first page object of a test opens, or None if it cannot tell."""
+    from pages.desktop.details import Details
+    for call in _calls(getattr(item, 'function', None)):
+        if not call.args or not isinstance(call.args[0], ast.Name) or call.args[0].id != 'mozwebqa':
+            continue
+        name = getattr(call.func, 'id', None) or getattr(call.func, 'attr', None)
+        if name == 'Home' and not [keyword for keyword in call.keywords if keyword.arg == 'open_url']:
+            return base_url
+        if name == 'Details' and len(call.args) > 1:
+            addon_name = _argument(call.args[1], item)
+            return addon_name and '%s/addon/%s' % (base_url, Details.addon_slug(addon_name))
+        # the first page object goes somewhere else
+        return None
+    return None
+
+
+class Prefetcher(object):
+
+    def __init__(self, mode, timeout):
+        self.mode = mode
+        self.timeout = timeout
+        self.prefetched = 0
+        self.failed = 0
+
+    def url_after(self, nextitem):
+        if nextitem is None or 'mozwebqa' not in getattr(nextitem, 'fixturenames', ()):
+            return None
+        return first_url(nextitem, nextitem.config.option.base_url)
+
+    def fetch_in_background(self, url):
+        thread = threading.Thread(target=self._fetch, args=(url,))
+        thread.daemon = True
+        thread.start()
+
+    def _fetch(self, url):
+        try:
+            shared_session().get(url, timeout=self.timeout).close()
+            self.prefetched += 1
+        except Exception:
+            self.failed += 1
+
+    def hint_listener(self, url):
+        hinted = []
+
+        def hint(page, page_url):
+            # one set of hints per test is enough, on the first page it opens
+            if hinted:
+                return
+            hinted.append(url)
+            try:
+                with commands.unobserved(page.selenium):
+                    page.selenium.execute_script(SCRIPT, url)
+                self.prefetched += 1
+            except WebDriverException:
+                self.failed += 1
+        return hint
+
+
+def pytest_addoption(parser):
+    parser.addoption("--prefetch",
+                     action="store",
+                     dest='prefetch',
+                     choices=('http', 'browser'),
+                     default=None,
+                     help="warm up the first page of the next test while the current one runs, "
+                          "over HTTP in the background or with hints in the browser.")
+
+
+def pytest_configure(config):
+    if config.option.prefetch:
+        config.prefetcher = Prefetcher(config.option.prefetch, config.option.webqatimeout)
+
+
+def pytest_runtest_protocol(item, nextitem):
+    prefetcher = getattr(item.config, 'prefetcher', None)
+    if prefetcher is None:
+        return
+    url = prefetcher.url_after(nextitem)
+    item._prefetch_url = url
+    if url and prefetcher.mode == 'http':
+        prefetcher.fetch_in_background(url)
+
+
+def pytest_mozwebqa_testsetup(testsetup, request):
+    prefetcher = getattr(request.config, 'prefetcher', None)
+    url = getattr(request.node, '_prefetch_url', None)
+    if prefetcher is None or prefetcher.mode != 'browser' or not url:
+        return
+    if not commands.supports_listeners(testsetup.selenium):
+        return
+    testsetup.navigation_listeners = getattr(testsetup, 'navigation_listeners', [])
+    testsetup.navigation_listeners.append(prefetcher.hint_listener(url))
+
+
+def pytest_terminal_summary(terminalreporter):
+    prefetcher = getattr(terminalreporter.config, 'prefetcher', None)
+    if prefetcher is None or not (prefetcher.prefetched or prefetcher.failed):
+        return
+    terminalreporter.write_sep('-', 'prefetch')
+    terminalreporter.write_line('%d first pages prefetched for the next test, %d prefetches failed' % (
+        prefetcher.prefetched, prefetcher.failed))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Starts Firefox from a prebuilt profile template with a warm asset cache.
+
+With --profiletemplate the template directory is built once, by visiting
+a few AMO pages with --baseurl, and again when its preferences or
+--baseurl change or --rebuildprofile is given. Each run, and each xdist worker,
+then launches Firefox from its own copy-on-write clone of it, so neither
+first-run work nor AMO's CSS, scripts and sprites are paid for again.
+'''
+
+import os
+
+from utils import firefox_profile
+
+
+def pytest_addoption(parser):
+    parser.addoption("--profiletemplate",
+                     action="store",
+                     dest='profile_template',
+                     metavar='path',
+                     default=None,
+                     help="directory of the firefox profile template to clone for each run, built there if missing.")
+    parser.addoption("--rebuildprofile",
+                     action="store_true",
+                     dest='rebuild_profile',
+                     default=False,
+                     help="build the --profiletemplate again, refreshing its cache.")
+
+
+def pytest_configure(config):
+    template = config.option.profile_template
+    if not template or (getattr(config.option, 'driver', None) or '').upper() != 'FIREFOX':
+        return
+    base_url = config.option.base_url
+    slave_input = getattr(config, 'slaveinput', None)
+    if slave_input is None and (config.option.rebuild_profile or not firefox_profile.is_built(template, base_url)):
+        # only the master builds, the xdist workers clone what it built
+        firefox_profile.build(template, base_url, config.option.firefox_path)
+    if not firefox_profile.is_built(template, base_url):
+        return
+    worker = slave_input['slaveid'] if slave_input else 'master'
+    config.option.profile_path = firefox_profile.clone(template, os.path.join(template, 'workers', worker))
+    # the browser pool clones it once more for each of the browsers it keeps running
+    config.profile_template = template
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Keeps the whole run, xdist workers included, under a request rate per host.
+
+With --ratelimit=N no host is sent more than N requests a second, after a
+burst of --rateburst, by all the processes of the run together. Browser
+navigations and the requests of the shared HTTP sessions both take their
+turn from the same buckets, and a 429, or a 503 with a Retry-After, from
+a host holds everyone back from it for a while.
+
+The run summary lists how many requests each host got and how long they
+waited for their turn; --ratemetrics writes the same to a json file.
+Navigations count once however many assets their page loads, and clicks
+that leave the page are not held back.
+'''
+
+import json
+import os
+
+import pytest
+from selenium.webdriver.remote.command import Command
+
+from utils import commands
+from utils import rate_limit
+
+
+def pytest_addoption(parser):
+    parser.addoption("--ratelimit",
+                     action="store",
+                     dest='rate_limit',
+                     metavar='float',
+                     type=float,
+                     default=0,
+                     help="most requests a second any one host is sent by the whole run, 0 for no limit. "
+                          "(default: %default)")
+    parser.addoption("--rateburst",
+                     action="store",
+                     dest='rate_burst',
+                     metavar='int',
+                     type=int,
+                     default=1,
+                     help="requests a host may be sent at once before --ratelimit holds them back. "
+                          "(default: %default)")
+    parser.addoption("--ratemetrics",
+                     action="store",
+                     dest='rate_metrics',
+                     metavar='path',
+                     default=None,
+                     help="json file to write the requests and waits of each host to.")
+
+
+def pytest_configure(config):
+    config.rate_limiter = None
+    if not config.option.rate_limit:
+        return
+    slave_input = getattr(config, 'slaveinput', None)
+    if slave_input is None:
+        path = rate_limit.create()
+    else:
+        # the workers draw from the buckets the master made
+        path = slave_input['rate_limit_path']
+    config.rate_limiter = rate_limit.RateLimiter(path, config.option.rate_limit, config.option.rate_burst)
+    rate_limit.install(config.rate_limiter)
+
+
+@pytest.mark.optionalhook
+def pytest_configure_node(node):
+    limiter = node.config.rate_limiter
+    if limiter is not None:
+        node.slaveinput['rate_limit_path'] = limiter.path
+
+
+def pytest_mozwebqa_testsetup(testsetup, request):
+    driver = testsetup.selenium
+    if request.config.rate_limiter is None or not commands.supports_listeners(driver):
+        # the browserless driver fetches through the shared session, which is limited already
+        return
+    if getattr(driver, '_rate_limited', False):
+        # a browser kept across tests is gated once
+        return
+    last_url = [None]
+
+    def gate(command, params):
+        limiter = rate_limit.active()
+        if limiter is None or command not in commands.NAVIGATION_COMMANDS:
+            return
+        if command == Command.GET:
+            last_url[0] = params.get('url')
+        # going back, forward or reloading stays, most likely, on the host last opened
+        limiter.acquire(last_url[0])
+    commands.add_gate(driver, gate)
+    driver._rate_limited = True
+
+
+def pytest_unconfigure(config):
+    limiter = getattr(config, 'rate_limiter', None)
+    if limiter is None:
+        return
+    rate_limit.install(None)
+    if getattr(config, 'slaveinput', None) is None:
+        if config.option.rate_metrics:
+            with open(config.option.rate_metrics, 'w') as metrics:
+                json.dump(dict((host.host, {'requests': host.requests, 'waited': host.waited, 'longest': host.longest})
+                               for host in limiter.metrics()),
+                          metrics, indent=2, sort_keys=True)
+        limiter.close()
+        os.remove(limiter.path)
+    else:
+        limiter.close()
+
+
+def pytest_terminal_summary(terminalreporter):
+    limiter = getattr(terminalreporter.config, 'rate_limiter', None)
+    if limiter is None:
+        return
+    hosts = limiter.metrics()
+    if not hosts:
+        return
+    terminalreporter.write_sep('-', 'requests held back by --ratelimit=%g' % limiter.rate)
+    for host in sorted(hosts, key=lambda host: -host.waited):
+        terminalreporter.write_line('%s: %d requests, %.1fs waited, %.2fs at most' % (
+            host.host, host.requests, host.waited, host.longest))
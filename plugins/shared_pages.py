@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Shares one browser and its pages between the read-only tests of a class.
+
+The nondestructive tests of a class or module marked shared_pages run in
+one browser, launched for the first of them and quit after the last.
+They build their pages through the shared_page fixture:
+
+    @pytest.mark.shared_pages
+    class TestDetailsAgainstXML:
+
+        @pytest.mark.nondestructive
+        def test_that_firebug_rating_is_correct(self, mozwebqa, shared_page):
+            firebug_page = shared_page(Details, mozwebqa, 'Firebug')
+
+The first call builds the page object, later calls with the same
+arguments hand back the same live page. Before a page is handed out again
+it is checked, in one script, for drift: another url, a reload, or
+changed text, classes, inline styles or form values. A drifted page is
+built again, which navigates back to it. State the DOM does not show,
+like the scroll position or a CSS :hover, is not seen, so tests that
+leave such state behind should not share.
+
+pytest-mozwebqa does not take screenshots of tests in a shared browser.
+'''
+
+import itertools
+
+import pytest
+
+from utils import commands
+
+SCRIPT = """
+var token = arguments[0];
+var text = document.body ? document.body.textContent : '';
+var elements = document.body ? document.body.getElementsByTagName('*') : [];
+for (var i = 0; i < elements.length; i++) {
+    var element = elements[i];
+    // expanded sections and open menus show up as classes or inline styles
+    text += '|' + element.className + (element.getAttribute('style') || '');
+    if (element.type === 'checkbox' || element.type === 'radio') {
+        text += element.checked;
+    } else if (typeof element.value === 'string') {
+        text += element.value;
+    }
+}
+var hash = 0;
+for (i = 0; i < text.length; i++) {
+    hash = (hash * 31 + text.charCodeAt(i)) | 0;
+}
+if (token !== null) {
+    window.__sharedPage = token;
+}
+return [window.location.href, window.__sharedPage || null, hash];
+"""
+
+
+def scope_of(item):
+    """Returns the class or module whose tests share a browser with item, or None."""
+    if 'shared_pages' not in item.keywords or 'nondestructive' not in item.keywords:
+        return None
+    if item.config.option.browserless and 'browserless' in item.keywords:
+        # the browserless driver fetches each page once anyway
+        return None
+    if item.cls is not None:
+        return item.parent.parent.nodeid
+    return item.module.__name__
+
+
+class SharedBrowser(object):
+
+    def __init__(self):
+        self.scope = None
+        self.client = None
+        self.pages = {}
+        self.tokens = itertools.count(1)
+        self.reused = 0
+        self.rebuilt = 0
+
+    def start(self, item, scope):
+        if scope != self.scope:
+            self.stop()
+            self.scope = scope
+        if self.client is None:
+            from pytest_mozwebqa.selenium_client import Client
+            self.client = Client(scope, item.config.option)
+            self.client.start()
+        return self.client
+
+    def stop(self):
+        if self.client is not None:
+            self.client.stop()
+        self.client = None
+        self.scope = None
+        self.pages.clear()
+
+    def state(self, driver, token=None):
+        with commands.unobserved(driver):
+            return driver.execute_script(SCRIPT, token)
+
+    def page(self, page_class, testsetup, *args, **kwargs):
+        key = (page_class, args, tuple(sorted(kwargs.items())))
+        shared = self.pages.get(key)
+        if shared is not None:
+            page, state = shared
+            if page.selenium is testsetup.selenium and self.state(page.selenium) == state:
+                page.testsetup = testsetup
+                self.reused += 1
+                return page
+            self.rebuilt += 1
+            # the drift may come from commands page_generation never saw, the page has to be loaded again
+            commands.page_changed(testsetup.selenium)
+        page = page_class(testsetup, *args, **kwargs)
+        self.pages[key] = (page, self.state(page.selenium, '%s-%d' % (page_class.__name__, next(self.tokens))))
+        return page
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'shared_pages: the nondestructive tests of the class or module '
+        'share a browser and the pages they build through the shared_page fixture.')
+    config.shared_browser = SharedBrowser()
+
+
+def pytest_collection_modifyitems(config, items):
+    if getattr(config.option, 'sauce_labs_credentials_file', None):
+        # Sauce Labs names each session after its test
+        return
+    for item in items:
+        if scope_of(item) is not None:
+            # the shared browser is started and stopped here, not by pytest-mozwebqa
+            item.keywords['skip_selenium'] = pytest.mark.skip_selenium
+
+
+@pytest.mark.tryfirst
+def pytest_mozwebqa_testsetup(testsetup, request):
+    scope = scope_of(request.node)
+    if scope is None or 'skip_selenium' not in request.node.keywords:
+        return
+    client = request.config.shared_browser.start(request.node, scope)
+    testsetup.selenium = client.selenium
+    testsetup.timeout = client.timeout
+    testsetup.default_implicit_wait = client.default_implicit_wait
+
+
+def pytest_runtest_teardown(item, nextitem):
+    browser = item.config.shared_browser
+    if browser.scope is not None and (nextitem is None or scope_of(nextitem) != browser.scope):
+        browser.stop()
+
+
+def pytest_unconfigure(config):
+    config.shared_browser.stop()
+
+
+@pytest.fixture
+def shared_page(request, mozwebqa):
+    """
+    Returns shared_page(page_class, mozwebqa, *args), which builds page
+    objects once per shared_pages class or module and hands them out again
+    while they have not drifted.
+    """
+    if scope_of(request.node) is None or not commands.supports_listeners(mozwebqa.selenium):
+        return lambda page_class, testsetup, *args, **kwargs: page_class(testsetup, *args, **kwargs)
+    return request.config.shared_browser.page
+
+
+def pytest_terminal_summary(terminalreporter):
+    browser = getattr(terminalreporter.config, 'shared_browser', None)
+    if browser is None or not (browser.reused or browser.rebuilt):
+        return
+    terminalreporter.write_sep('-', 'shared pages')
+    terminalreporter.write_line('%d pages handed out again, %d built again after they drifted' % (
+        browser.reused, browser.rebuilt))
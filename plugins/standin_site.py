@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Points the run at the local stand-in site instead of an AMO environment.
+
+With --standin a StandInServer is started for the session and --baseurl
+is replaced by its address, so page objects load deterministic pages
+from localhost. This is what the benchmarks in benchmarks/ run against.
+'''
+
+from standin.server import StandInServer
+
+
+def pytest_addoption(parser):
+    parser.addoption("--standin",
+                     action="store_true",
+                     dest='standin',
+                     default=False,
+                     help="serve the pages from the local stand-in site instead of --baseurl.")
+    parser.addoption("--standinpagesize",
+                     action="store",
+                     dest='standin_page_size',
+                     type=int,
+                     metavar='int',
+                     default=20,
+                     help="number of results on each stand-in listing page. (default: %default)")
+    parser.addoption("--standinresults",
+                     action="store",
+                     dest='standin_results',
+                     type=int,
+                     metavar='int',
+                     default=100,
+                     help="number of results in each stand-in listing. (default: %default)")
+    parser.addoption("--standindelay",
+                     action="store",
+                     dest='standin_delay',
+                     type=float,
+                     metavar='seconds',
+                     default=0.2,
+                     help="how long stand-in AJAX refreshes keep div.updating up. (default: %default)")
+
+
+def pytest_configure(config):
+    if not config.option.standin or hasattr(config, 'standin_server'):
+        return
+    config.standin_server = StandInServer(page_size=config.option.standin_page_size,
+                                          result_count=config.option.standin_results,
+                                          update_delay=config.option.standin_delay)
+    config.standin_server.start()
+    config.option.base_url = config.standin_server.url
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, 'standin_server', None)
+    if server is not None:
+        server.stop()
+        del config.standin_server
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Reports where page objects spend their time waiting.
+
+With --waitreport every pages.wait.Wait is recorded with the page object
+method it was called from, how long it took and how often it polled. The
+run summary ranks the call sites by their total wait time.
+'''
+
+from collections import defaultdict
+
+from pages import wait
+
+# call sites shown in the run summary
+SLOWEST_WAITS = 20
+
+
+class WaitStatistics(object):
+
+    def __init__(self):
+        # call site: [waits, polls, total seconds, longest seconds, timeouts]
+        self.call_sites = defaultdict(lambda: [0, 0, 0.0, 0.0, 0])
+
+    def record(self, call_site, duration, polls, timed_out):
+        statistics = self.call_sites[call_site]
+        statistics[0] += 1
+        statistics[1] += polls
+        statistics[2] += duration
+        statistics[3] = max(statistics[3], duration)
+        statistics[4] += timed_out
+
+    def lines(self):
+        lines = ['%-60s %6s %6s %9s %9s %8s' % ('wait', 'waits', 'polls', 'total s', 'max s', 'timeouts')]
+        slowest = sorted(self.call_sites.items(), key=lambda item: -item[1][2])[:SLOWEST_WAITS]
+        for call_site, (waits, polls, total, longest, timeouts) in slowest:
+            lines.append('%-60s %6d %6d %9.2f %9.2f %8d' % (call_site, waits, polls, total, longest, timeouts))
+        return lines
+
+
+def pytest_addoption(parser):
+    parser.addoption("--waitreport",
+                     action="store_true",
+                     dest='wait_report',
+                     default=False,
+                     help="report the time page objects spend waiting, per call site.")
+
+
+def pytest_configure(config):
+    if config.option.wait_report:
+        config.wait_statistics = WaitStatistics()
+        wait.add_listener(config.wait_statistics.record)
+
+
+def pytest_unconfigure(config):
+    statistics = getattr(config, 'wait_statistics', None)
+    if statistics is not None:
+        wait.remove_listener(statistics.record)
+
+
+def pytest_terminal_summary(terminalreporter):
+    statistics = getattr(terminalreporter.config, 'wait_statistics', None)
+    if statistics is None or not statistics.call_sites:
+        return
+    terminalreporter.write_sep('-', 'page object waits')
+    for line in statistics.lines():
+        terminalreporter.write_line(line)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Deterministic listing data for the stand-in site.
+
+Every value is derived from the item's index, so two runs with the same
+parameters render byte-identical pages.
+'''
+
+from datetime import date, timedelta
+
+# a search for this term renders the 'no results' page
+NO_RESULTS_TERM = 'no-results'
+
+CATEGORIES = ['Abstract', 'Causes', 'Fashion', 'Film and TV', 'Firefox', 'Foxkeh',
+              'Holiday', 'Music', 'Nature', 'Other', 'Scenery', 'Seasonal',
+              'Solid', 'Sports', 'Websites']
+
+# the sort keys AMO uses in its urls, with the labels shown by the sorter
+SORT_LABELS = [('featured', 'Featured'),
+               ('users', 'Most Users'),
+               ('rating', 'Top Rated'),
+               ('created', 'Newest'),
+               ('name', 'Name'),
+               ('downloads', 'Weekly Downloads'),
+               ('updated', 'Recently Updated'),
+               ('hotness', 'Up & Coming')]
+
+_EPOCH = date(2014, 3, 3)
+
+
+class Item(object):
+    """An add-on, theme or collection shown in a listing."""
+
+    def __init__(self, kind, index, prefix):
+        self.kind = kind
+        self.index = index
+        # names survive the round trip through their slug, see name_from_slug
+        self.name = '%s %03d' % (prefix, index + 1)
+        self.slug = self.name.lower().replace(' ', '-')
+        self.users = (index * 7919) % 100000 + 1000
+        self.downloads = (index * 3571) % 20000 + 100
+        self.rating = index % 5 + 1
+        self.created = _EPOCH - timedelta(days=index * 3)
+        self.updated = _EPOCH - timedelta(days=(index * 11) % 365)
+        self.hotness = (index * 131) % 997
+        self.featured = index % 3 == 0
+        self.compatible = index % 4 != 3
+        self.author = 'Stand-in Author %d' % (index % 7 + 1)
+        self.summary = '%s is a stand-in %s used for benchmarking.' % (self.name, kind)
+
+    @staticmethod
+    def name_from_slug(slug):
+        return ' '.join(word.capitalize() for word in slug.split('-'))
+
+    @staticmethod
+    def format_date(value):
+        return '%s %d, %d' % (value.strftime('%B'), value.day, value.year)
+
+
+class Listing(object):
+    """
+    A sorted, paginated list of items.
+
+    result_count items are spread over pages of page_size, numbered from 1
+    the way the AMO paginator numbers them.
+    """
+
+    _sort_keys = {
+        'featured': lambda item: (not item.featured, item.index),
+        'users': lambda item: -item.users,
+        'rating': lambda item: (-item.rating, item.index),
+        'created': lambda item: item.created,
+        'name': lambda item: item.name,
+        'downloads': lambda item: -item.downloads,
+        'updated': lambda item: item.updated,
+        'hotness': lambda item: -item.hotness,
+    }
+    _reversed_sorts = frozenset(['created', 'updated'])
+
+    def __init__(self, kind, prefix, result_count, page_size, sort='featured'):
+        if sort not in self._sort_keys:
+            sort = 'featured'
+        self.sort = sort
+        self.page_size = page_size
+        self.items = sorted([Item(kind, index, prefix) for index in range(result_count)],
+                            key=self._sort_keys[sort],
+                            reverse=sort in self._reversed_sorts)
+
+    @property
+    def total_items(self):
+        return len(self.items)
+
+    @property
+    def total_pages(self):
+        return max(1, (self.total_items + self.page_size - 1) // self.page_size)
+
+    def page(self, number):
+        number = min(max(1, number), self.total_pages)
+        start = (number - 1) * self.page_size
+        return number, self.items[start:start + self.page_size]
+
+    def sort_label(self):
+        return dict(SORT_LABELS)[self.sort]
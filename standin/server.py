@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+A local stand-in for the AMO pages the desktop page objects drive.
+
+StandInServer renders the home, details, search, extensions, themes,
+complete themes, collections, statistics and discovery pages from
+deterministic data, so page objects can be timed without a live AMO
+environment. Listings are paginated with page_size items out of
+result_count, and paginator and sorter clicks refresh the results over
+AJAX behind a div.updating overlay that stays up for update_delay seconds.
+
+Run it on its own with:
+
+    python -m standin.server --port=8000
+'''
+
+import BaseHTTPServer
+import SocketServer
+import optparse
+import re
+import threading
+import time
+import urlparse
+
+from standin import templates
+from standin.catalog import NO_RESULTS_TERM, Item, Listing
+
+# 1x1 transparent gif served for every image
+STUB_IMAGE = 'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00!\xf9\x04\x01\x00\x00\x00\x00,' \
+             '\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+
+# AMO prefixes most paths with the locale and application
+LOCALE_PREFIX = re.compile(r'^/[a-z]{2}(?:-[A-Z]{2})?/(?:firefox|thunderbird|android|seamonkey)(?=/)')
+
+
+class StandInHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    routes = [
+        (re.compile(r'^/$'), 'home'),
+        (re.compile(r'^/search/?$'), 'search'),
+        (re.compile(r'^/extensions/?$'), 'extensions'),
+        (re.compile(r'^/themes/?$'), 'themes'),
+        (re.compile(r'^/themes/browse/?$'), 'themes_browse'),
+        (re.compile(r'^/complete-themes/?$'), 'complete_themes'),
+        (re.compile(r'^/complete-themes/(?P<category>[\w-]+)/?$'), 'complete_themes_category'),
+        (re.compile(r'^/collections/?$'), 'collections'),
+        (re.compile(r'^/collections/(?P<slug>[\w-]+)/?$'), 'collection'),
+        (re.compile(r'^/addon/(?P<slug>[\w-]+)/statistics/?'), 'statistics'),
+        (re.compile(r'^/addon/(?P<slug>[\w-]+)/?$'), 'details'),
+        (re.compile(r'^/discovery/'), 'discovery'),
+        (re.compile(r'^/static/standin\.css$'), 'stylesheet'),
+        (re.compile(r'^/static/standin\.js$'), 'script'),
+        (re.compile(r'^/static/img/'), 'image'),
+    ]
+
+    def log_message(self, format, *args):
+        # keep the test output readable
+        pass
+
+    def do_GET(self):
+        url = urlparse.urlsplit(self.path)
+        path = LOCALE_PREFIX.sub('', url.path)
+        self.query = dict(urlparse.parse_qsl(url.query))
+        self.is_pjax = self.headers.get('X-PJAX') == 'true'
+        for pattern, name in self.routes:
+            match = pattern.match(path)
+            if match:
+                content_type, body = getattr(self, 'render_%s' % name)(**match.groupdict())
+                self._send(200, content_type, body)
+                return
+        self._send(404, 'text/html; charset=utf-8', self._page('Page not found', '<h1>Page not found</h1>'))
+
+    def _send(self, status, content_type, body):
+        if isinstance(body, unicode):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _page(self, title, content, body_class='', breadcrumbs=''):
+        return templates.layout(title, content, self.server.update_delay, body_class, breadcrumbs)
+
+    def _html(self, title, content, **kwargs):
+        return 'text/html; charset=utf-8', self._page(title, content, **kwargs)
+
+    def _fragment(self, content):
+        # AJAX refreshes take a while on AMO too, keep div.updating up meanwhile
+        time.sleep(self.server.update_delay)
+        return 'text/html; charset=utf-8', content
+
+    @property
+    def page_number(self):
+        try:
+            return int(self.query.get('page', 1))
+        except ValueError:
+            return 1
+
+    def _listing(self, kind, prefix, default_sort='featured', result_count=None):
+        if result_count is None:
+            result_count = self.server.result_count
+        return Listing(kind, prefix, result_count, self.server.page_size,
+                       self.query.get('sort', default_sort))
+
+    def render_home(self):
+        featured = self._listing('extension', 'Extension').items
+        return self._html(templates.SITE_TITLE, templates.home(
+            featured=featured[:6],
+            popular=self._listing('extension', 'Extension', 'users').items[:10],
+            themes=self._listing('theme', 'Theme').items[:6],
+            collections=self._listing('collection', 'Collection').items[:4]))
+
+    def render_search(self):
+        query = self.query.get('q', '')
+        result_count = query.strip().lower() != NO_RESULTS_TERM and self.server.result_count or 0
+        listing = self._listing('extension', query.strip().title() or 'Extension', 'featured', result_count)
+        if self.is_pjax:
+            return self._fragment(templates.results(listing, self.page_number, {'q': query}))
+        return self._html('%s :: Search :: %s' % (query, templates.SITE_TITLE),
+                          templates.search(query, listing, self.page_number),
+                          breadcrumbs=templates.breadcrumbs(('Search', '/search/')))
+
+    def render_extensions(self):
+        listing = self._listing('extension', 'Extension')
+        if self.is_pjax:
+            return self._fragment(templates.results(listing, self.page_number, {}))
+        return self._html('Featured Extensions :: %s' % templates.SITE_TITLE,
+                          templates.extensions(listing, self.page_number),
+                          breadcrumbs=templates.breadcrumbs(('Extensions', '/extensions/')))
+
+    def render_themes(self):
+        return self._html('Themes :: %s' % templates.SITE_TITLE, templates.themes(
+            featured=self._listing('theme', 'Theme').items[:6],
+            created=self._listing('theme', 'Theme', 'created').items[:6],
+            popular=self._listing('theme', 'Theme', 'users').items[:6],
+            rated=self._listing('theme', 'Theme', 'rating').items[:6]),
+            breadcrumbs=templates.breadcrumbs(('Themes', '/themes/')))
+
+    def render_themes_browse(self):
+        listing = self._listing('theme', 'Theme', 'users')
+        return self._html('Themes :: %s' % templates.SITE_TITLE,
+                          templates.themes_browse(listing, self.page_number),
+                          breadcrumbs=templates.breadcrumbs(('Themes', '/themes/'), ('Browse', '/themes/browse/')))
+
+    def render_complete_themes(self):
+        listing = self._listing('complete theme', 'Complete Theme', 'users')
+        if self.is_pjax:
+            return self._fragment(templates.complete_themes_results(listing, self.page_number, {}))
+        return self._html('Complete Themes :: %s' % templates.SITE_TITLE,
+                          templates.complete_themes(listing, self.page_number, listing.sort),
+                          breadcrumbs=templates.breadcrumbs(('Complete Themes', '/complete-themes/')))
+
+    def render_complete_themes_category(self, category):
+        name = Item.name_from_slug(category)
+        return self._html('%s :: Complete Themes :: %s' % (name, templates.SITE_TITLE),
+                          templates.complete_themes_category(name),
+                          breadcrumbs=templates.breadcrumbs(('Complete Themes', '/complete-themes/'), (name, '')))
+
+    def render_collections(self):
+        listing = self._listing('collection', 'Collection')
+        return self._html('Featured Collections :: %s' % templates.SITE_TITLE,
+                          templates.collections(listing, self.page_number),
+                          breadcrumbs=templates.breadcrumbs(('Collections', '/collections/')))
+
+    def render_collection(self, slug):
+        item = self._item('collection', slug)
+        return self._html('%s :: Collections :: %s' % (item.name, templates.SITE_TITLE),
+                          templates.collection(item),
+                          breadcrumbs=templates.breadcrumbs(('Collections', '/collections/'), (item.name, '')))
+
+    def _item(self, kind, slug):
+        """Returns the item for slug, with the same data its listing entry shows."""
+        match = re.search(r'-(\d+)$', slug)
+        item = Item(kind, match and int(match.group(1)) - 1 or 0, 'Stand-in')
+        item.name = Item.name_from_slug(slug)
+        item.slug = slug
+        return item
+
+    def render_details(self, slug):
+        if slug.startswith('complete-theme-'):
+            kind, section = 'complete theme', ('Complete Themes', '/complete-themes/')
+        elif slug.startswith('theme-'):
+            kind, section = 'theme', ('Themes', '/themes/')
+        else:
+            kind, section = 'extension', ('Extensions', '/extensions/')
+        item = self._item(kind, slug)
+        others = self._listing('extension', 'Extension').items
+        return self._html('%s :: %s' % (item.name, templates.SITE_TITLE),
+                          templates.details(item, kind, reviews=others[:self.server.page_size // 2],
+                                            screenshots=5, related=others[:6]),
+                          breadcrumbs=templates.breadcrumbs(section, (item.name, '')))
+
+    def render_statistics(self, slug):
+        item = self._item('extension', slug)
+        return self._html('%s :: Statistics Dashboard :: %s' % (item.name, templates.SITE_TITLE),
+                          templates.statistics(item))
+
+    def render_discovery(self):
+        return self._html('Discover Add-ons', templates.discovery(
+            themes=self._listing('theme', 'Theme').items[:6],
+            up_and_coming=self._listing('extension', 'Extension', 'hotness').items[:5],
+            featured=self._listing('extension', 'Extension').items[:5]),
+            body_class='discovery')
+
+    def render_stylesheet(self):
+        return 'text/css', templates.STYLESHEET
+
+    def render_script(self):
+        return 'application/javascript', templates.SCRIPT
+
+    def render_image(self):
+        return 'image/gif', STUB_IMAGE
+
+
+class StandInServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, page_size=20, result_count=100, update_delay=0.2, port=0):
+        BaseHTTPServer.HTTPServer.__init__(self, ('localhost', port), StandInHandler)
+        self.page_size = page_size
+        self.result_count = result_count
+        self.update_delay = update_delay
+
+    @property
+    def url(self):
+        return 'http://localhost:%d' % self.server_address[1]
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, name='standin')
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == '__main__':
+    parser = optparse.OptionParser()
+    parser.add_option('--port', type='int', default=8000)
+    parser.add_option('--pagesize', type='int', default=20)
+    parser.add_option('--results', type='int', default=100)
+    parser.add_option('--delay', type='float', default=0.2)
+    options, arguments = parser.parse_args()
+    server = StandInServer(options.pagesize, options.results, options.delay, options.port)
+    print 'Serving the stand-in site on %s' % server.url
+    server.serve_forever()
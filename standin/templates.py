@@ -0,0 +1,604 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+HTML for the stand-in site.
+
+The markup mirrors the parts of AMO the desktop page objects locate, so
+every locator in pages/desktop resolves against it. It is not meant to
+look like AMO beyond what the page objects measure (element sizes that
+the constructors wait for, hover flyouts, collapsible sections).
+'''
+
+from cgi import escape
+from urllib import urlencode
+
+from standin.catalog import CATEGORIES, SORT_LABELS, Item
+
+SITE_TITLE = 'Add-ons for Firefox'
+
+STYLESHEET = '''
+body { font: 13px sans-serif; margin: 0; min-width: 1000px; }
+#page { margin: 0 auto; width: 960px; }
+#site-nav > ul > li > a { text-transform: uppercase; }
+#promos { height: 271px; overflow: hidden; }
+body.discovery #promos { height: 273px; }
+#promos .slider li.panel { display: none; }
+#promos .slider li.panel.active { display: block; }
+.other-apps, #site-nav li ul, #site-nav li div, #sorter li.extras ul,
+#aux-nav .account ul, .addon .more, .hovercard .more { display: none; }
+#other-apps:hover .other-apps, #site-nav li:hover ul, #site-nav li:hover div,
+#sorter li.extras:hover ul, #aux-nav .account:hover ul,
+.addon:hover .more, .hovercard:hover .more { display: block; }
+.expando > .content { display: none; }
+.expando.expanded > .content { display: block; }
+.updating { background: #fff; height: 100%; left: 0; opacity: .5; position: absolute; top: 0; width: 100%; }
+#pjax-results { position: relative; }
+#side-explore a.selected { font-weight: bold; }
+#side-explore a { font-weight: normal; }
+'''
+
+SCRIPT = '''
+(function () {
+    var delay = parseInt(document.body.getAttribute('data-update-delay'), 10) || 0;
+
+    function matches(node, selector) {
+        var match = node.matches || node.mozMatchesSelector || node.webkitMatchesSelector || node.msMatchesSelector;
+        return match.call(node, selector);
+    }
+
+    function closest(node, selector) {
+        while (node && node.nodeType === 1) {
+            if (matches(node, selector)) {
+                return node;
+            }
+            node = node.parentNode;
+        }
+        return null;
+    }
+
+    function refresh(url) {
+        var container = document.getElementById('pjax-results');
+        var updating = document.createElement('div');
+        updating.className = 'updating tall';
+        container.appendChild(updating);
+        var request = new XMLHttpRequest();
+        request.open('GET', url);
+        request.setRequestHeader('X-PJAX', 'true');
+        request.onload = function () {
+            container.innerHTML = request.responseText;
+            if (window.history.pushState) {
+                window.history.pushState(null, '', url);
+            }
+        };
+        request.send();
+    }
+
+    function showPanel(step) {
+        var panels = document.querySelectorAll('#promos .slider li.panel');
+        for (var i = 0; i < panels.length; i++) {
+            if (/\\bactive\\b/.test(panels[i].className)) {
+                panels[i].className = 'panel';
+                panels[(i + step + panels.length) % panels.length].className = 'panel active';
+                return;
+            }
+        }
+    }
+
+    document.addEventListener('click', function (event) {
+        var link = closest(event.target, 'a');
+        if (!link) {
+            return;
+        }
+        if (document.getElementById('pjax-results') && closest(link, '.pjax-trigger, #sorter')) {
+            event.preventDefault();
+            if (!/\\bdisabled\\b/.test(link.className)) {
+                refresh(link.href);
+            }
+        } else if (closest(link, '.expando > h2, .expando a.toggle')) {
+            event.preventDefault();
+            var section = closest(link, '.expando');
+            section.className = /\\bexpanded\\b/.test(section.className) ?
+                section.className.replace(/\\s*\\bexpanded\\b/, '') : section.className + ' expanded';
+            link.className = link.className + ' clicked';
+        } else if (closest(link, '#nav-features')) {
+            event.preventDefault();
+            showPanel(closest(link, '.nav-next') ? 1 : -1);
+        }
+    }, false);
+
+    var chart = document.getElementById('head-chart');
+    if (chart) {
+        // the statistics dashboard draws its chart once the data has arrived
+        setTimeout(function () {
+            chart.appendChild(document.createElement('div'));
+        }, delay);
+    }
+})();
+'''
+
+
+def _query(**params):
+    return '?' + urlencode(sorted((key, value) for key, value in params.items() if value))
+
+
+def _format_number(number):
+    return '{:,}'.format(number)
+
+
+def breadcrumbs(*crumbs):
+    items = ['<li><a href="/">%s</a></li>' % SITE_TITLE]
+    for crumb in crumbs[:-1]:
+        items.append('<li><a href="%s">%s</a></li>' % (crumb[1], escape(crumb[0])))
+    items.append('<li><span>%s</span></li>' % escape(crumbs[-1][0]))
+    return '<nav id="breadcrumbs"><ol>%s</ol></nav>' % ''.join(items)
+
+
+def layout(title, content, update_delay, body_class='', breadcrumbs=''):
+    """Wraps page content in the header and footer every AMO page shares."""
+    return '''<!DOCTYPE html>
+<html lang="en-US">
+<head>
+<meta charset="utf-8">
+<title>%(title)s</title>
+<link rel="stylesheet" href="/static/standin.css">
+</head>
+<body class="%(body_class)s" data-update-delay="%(delay)d">
+<div id="page" class="c">
+<header class="c">
+<nav id="aux-nav">
+<ul>
+<li id="other-apps" class="menu"><a href="#">Other Applications</a>
+<ul class="other-apps">
+<li id="app-thunderbird"><a href="/thunderbird/">Thunderbird</a></li>
+<li id="app-android"><a href="/android/">Android</a></li>
+<li id="app-seamonkey"><a href="/seamonkey/">SeaMonkey</a></li>
+</ul>
+</li>
+<li class="account"><a href="/users/register">Register</a> or <a href="/users/login">Log in</a></li>
+</ul>
+</nav>
+<div class="header-bottom">
+<h1 class="site-title"><a href="/" title="Return to the Firefox Add-ons homepage"><img alt="Mozilla Firefox" src="/static/img/firefox.png">ADD-ONS</a></h1>
+<nav id="site-nav">
+<ul>
+<li id="extensions"><a href="/extensions/">Extensions</a>
+<ul>
+<li><em><a href="/extensions/?sort=featured">Featured</a></em></li>
+<li><a href="/extensions/?sort=users">Most Popular</a></li>
+<li><a href="/extensions/?sort=rating">Top Rated</a></li>
+</ul>
+</li>
+<li id="themes"><a href="/themes/">Themes</a>
+<ul>
+<li><em><a href="/themes/">Featured</a></em></li>
+<li><a href="/themes/browse/?sort=users">Most Popular</a></li>
+</ul>
+<div><a class="complete-themes" href="/complete-themes/"><b>Complete Themes</b></a></div>
+</li>
+<li id="collections"><a href="/collections/">Collections</a>
+<ul>
+<li><em><a href="/collections/">Featured</a></em></li>
+<li><a href="/collections/?sort=users">Most Followers</a></li>
+</ul>
+</li>
+<li id="more"><a href="#">More&hellip;</a>
+<ul>
+<li><a href="/search/?q=dictionary">Dictionaries &amp; Language Packs</a></li>
+<li><a href="/search/?q=search">Search Tools</a></li>
+</ul>
+</li>
+</ul>
+</nav>
+<form id="search" action="/search/" method="get">
+<input id="search-q" name="q" type="search" placeholder="search for add-ons">
+<button class="search-button" type="submit" title="Search">Search</button>
+</form>
+</div>
+</header>
+%(breadcrumbs)s
+%(content)s
+</div>
+<div id="footer"><p>Stand-in copy of addons.mozilla.org for page object benchmarks.</p></div>
+<script src="/static/standin.js"></script>
+</body>
+</html>
+''' % {'title': escape(title), 'body_class': body_class, 'delay': int(update_delay * 1000),
+       'breadcrumbs': breadcrumbs, 'content': content}
+
+
+def _stars(rating, css_class='stars'):
+    return '<span class="%s stars-%d"><span>Rated %d out of 5 stars</span></span>' % (css_class, rating, rating)
+
+
+def _addon_summary(item):
+    return '<li><div class="addon"><div class="summary"><a href="/addon/%s/"><h3>%s</h3></a></div></div></li>' % (
+        item.slug, escape(item.name))
+
+
+def _review(review):
+    return '''<div class="review"><h3>%s</h3><p class="byline">by <a href="/user/%d/">%s</a></p>
+<p class="description">%s</p></div>''' % (_stars(review.rating), review.index, escape(review.author), escape(review.summary))
+
+
+def _listing_item(item, sort):
+    if sort == 'created':
+        vital = 'Added %s' % Item.format_date(item.created)
+    else:
+        vital = 'Updated %s' % Item.format_date(item.updated)
+    if sort == 'downloads':
+        adu = '%s weekly downloads' % _format_number(item.downloads)
+    else:
+        adu = '%s users' % _format_number(item.users)
+    featured = item.featured and ' <span class="featured">Featured</span>' or ''
+    return '''<div class="item addon%(incompatible)s">
+<div class="info">
+<h3><a href="/addon/%(slug)s/">%(name)s</a>%(featured)s</h3>
+<p class="desc">%(summary)s</p>
+<div class="vitals c">%(stars)s<div class="adu">%(adu)s</div><div class="updated">%(vital)s</div></div>
+</div>
+</div>''' % {'incompatible': not item.compatible and ' incompatible' or '', 'slug': item.slug,
+             'name': escape(item.name), 'featured': featured, 'summary': escape(item.summary),
+             'stars': _stars(item.rating), 'adu': adu, 'vital': vital}
+
+
+def _sorter(params, selected):
+    links = []
+    for key, label in SORT_LABELS[:4]:
+        links.append('<li%s><a href="%s">%s</a></li>' % (
+            key == selected and ' class="selected"' or '', _query(sort=key, **params), escape(label)))
+    extras = ''.join('<li%s><a href="%s">%s</a></li>' % (
+        key == selected and ' class="selected"' or '', _query(sort=key, **params), escape(label))
+        for key, label in SORT_LABELS[4:])
+    links.append('<li class="extras"><a href="#">More</a><ul>%s</ul></li>' % extras)
+    return '<div id="sorter" class="c"><h3>Sort by:</h3><ul>%s</ul></div>' % ''.join(links)
+
+
+def paginator(listing, number, params):
+    """Renders the AMO paginator for page number of listing."""
+    last = listing.total_pages
+    params = dict(params, sort=listing.sort)
+
+    def link(css_class, page, label):
+        disabled = (page == number or page < 1 or page > last) and ' disabled' or ''
+        page = min(max(page, 1), last)
+        return '<a class="%s%s" href="%s">%s</a>' % (css_class, disabled, _query(page=page, **params), label)
+
+    start = listing.total_items and (number - 1) * listing.page_size + 1 or 0
+    end = min(number * listing.page_size, listing.total_items)
+    return '''<nav class="paginator c pjax-trigger">
+<p class="rel">%(first)s%(prev)s%(next)s%(last)s</p>
+<p class="num">Page <a href="%(current)s">%(number)d</a> of <a href="%(final)s">%(pages)d</a></p>
+<p class="pos">Showing <b>%(start)d</b>&ndash;<b>%(end)d</b> of <b>%(total)d</b> results</p>
+</nav>''' % {'first': link('button', 1, '&laquo; First'),
+             'prev': link('button prev', number - 1, '&#x25C2; Previous'),
+             'next': link('button next', number + 1, 'Next &#x25B8;'),
+             'last': link('button', last, 'Last &raquo;'),
+             'current': _query(page=number, **params), 'number': number,
+             'final': _query(page=last, **params), 'pages': last,
+             'start': start, 'end': end, 'total': listing.total_items}
+
+
+def results(listing, number, params):
+    """The part of a listing page the AJAX pagination replaces."""
+    number, items = listing.page(number)
+    return '%s<div class="items">%s</div>%s' % (
+        _sorter(params, listing.sort),
+        '\n'.join(_listing_item(item, listing.sort) for item in items),
+        paginator(listing, number, params))
+
+
+def home(featured, popular, themes, collections):
+    island_sections = []
+    for start in range(0, len(featured), 3):
+        island_sections.append('<section%s>%s</section>' % (
+            not start and ' class="active"' or ' style="display: none"',
+            ''.join(_addon_summary(item) for item in featured[start:start + 3])))
+    dots = ''.join('<a class="dot%s" href="#"></a>' % (not index and ' selected' or '')
+                   for index in range(len(island_sections)))
+    return '''<div id="homepage">
+<div class="primary">
+<section id="promos" class="island"><div class="slider"><ul><li class="panel active"><h2>Welcome to Firefox Add-ons</h2></li></ul></div></section>
+<section id="featured-extensions" class="island">
+<h2>Featured Extensions <a class="seeall" href="/extensions/?sort=featured">See all &raquo;</a></h2>
+<ul class="listing-grid c"><section>%(featured)s</section></ul>
+</section>
+<section id="upandcoming" class="island">
+<h2>Up &amp; Coming Extensions <a class="seeall" href="/extensions/?sort=hotness">See all &raquo;</a></h2>
+<nav class="pager"><a class="prev" href="#">&laquo;</a>%(dots)s<a class="next" href="#">&raquo;</a></nav>
+<ul>%(island)s</ul>
+</section>
+<section id="featured-themes" class="island">
+<h2>Featured Themes <a href="/themes/">See all &raquo;</a></h2>
+<ul>%(themes)s</ul>
+</section>
+<section id="featured-collections" class="island">
+<h2>Featured Collections <a href="/collections/">See all &raquo;</a></h2>
+<ul><section>%(collections)s</section></ul>
+</section>
+</div>
+<div class="secondary">
+<h2>Most Popular</h2>
+<ol class="toplist">%(popular)s</ol>
+<nav id="side-nav">
+<h2>Explore</h2>
+<ul>
+<li class="s-featured"><a href="/extensions/?sort=featured" title="Featured">Featured</a></li>
+<li class="s-users"><a href="/extensions/?sort=users" title="Most Popular">Most Popular</a></li>
+<li class="s-rating"><a href="/extensions/?sort=rating" title="Top Rated">Top Rated</a></li>
+</ul>
+</nav>
+</div>
+</div>''' % {
+        'featured': ''.join('''<li><div class="addon"><a class="summary" href="/addon/%s/"><h3>%s</h3></a>
+<div class="more"><p class="addon-summary">%s</p><div class="byline">by <a href="/user/%d/">%s</a></div></div></div></li>''' % (
+            item.slug, escape(item.name), escape(item.summary), item.index, escape(item.author)) for item in featured),
+        'dots': dots,
+        'island': ''.join(island_sections),
+        'themes': ''.join('<li><a href="/addon/%s/">%s</a></li>' % (item.slug, escape(item.name)) for item in themes),
+        'collections': ''.join('<li><a href="/collections/%s/">%s</a></li>' % (item.slug, escape(item.name))
+                               for item in collections),
+        'popular': ''.join('<li><a href="/addon/%s/"><span>%s</span><small>%s users</small></a></li>' % (
+            item.slug, escape(item.name), _format_number(item.users)) for item in popular)}
+
+
+def search(query, listing, number):
+    if not listing.total_items:
+        body = '<p class="no-results">No results found.</p>'
+    else:
+        body = '<div id="pjax-results">%s</div>' % results(listing, number, {'q': query})
+    return '''<section class="primary">
+<h1>Search Results for &quot;%(query)s&quot;</h1>
+<div id="search-facets"><p>%(total)s matching results</p></div>
+%(body)s
+</section>''' % {'query': escape(query), 'total': _format_number(listing.total_items), 'body': body}
+
+
+def extensions(listing, number):
+    return '''<section class="primary">
+<h1>Featured Extensions</h1>
+<a id="subscribe" href="/extensions/format:rss?sort=featured">Subscribe</a>
+<div id="pjax-results">%s</div>
+</section>''' % results(listing, number, {})
+
+
+def _persona(item, text):
+    return '''<li><div class="persona persona-small"><a href="/addon/%s/">
+<div class="persona-preview"><img alt="%s" src="/static/img/persona.png"></div>
+<p>%s</p></a></div></li>''' % (item.slug, escape(item.name), text)
+
+
+def themes(featured, created, popular, rated):
+    return '''<section class="primary">
+<div id="featured-addons" class="personas-home">
+<div class="featured-inner">
+<h2>Themes</h2>
+<p>Change your browser's appearance. <a class="more-info" href="/themes/browse/?sort=users">Start Exploring</a></p>
+</div>
+</div>
+<div class="personas-featured"><ul class="personas-grid">%(featured)s</ul></div>
+<div id="personas-created"><ul class="personas-grid">%(created)s</ul></div>
+<div id="personas-popular"><ul class="personas-grid">%(popular)s</ul></div>
+<div id="personas-rating"><ul class="personas-grid">%(rated)s</ul></div>
+</section>''' % {
+        'featured': ''.join(_persona(item, escape(item.name)) for item in featured),
+        'created': ''.join(_persona(item, 'Added %s' % Item.format_date(item.created)) for item in created),
+        'popular': ''.join(_persona(item, '%s users' % _format_number(item.users)) for item in popular),
+        'rated': ''.join(_persona(item, 'Rated %d out of 5 stars' % item.rating) for item in rated)}
+
+
+def themes_browse(listing, number):
+    number, items = listing.page(number)
+    options = ''.join('<li%s><a href="%s">%s</a></li>' % (
+        key == listing.sort and ' class="selected"' or '', _query(sort=key), escape(label))
+        for key, label in SORT_LABELS if key != 'featured')
+    return '''<section class="primary">
+<h1>Themes</h1>
+<ul id="addon-list-options">%(options)s</ul>
+<div class="featured listing"><ul class="personas-grid">%(items)s</ul></div>
+%(paginator)s
+</section>''' % {'options': options,
+                 'items': ''.join(_persona(item, escape(item.name)) for item in items),
+                 'paginator': paginator(listing, number, {})}
+
+
+def _complete_theme(item, sort):
+    vital = sort == 'created' and 'Added %s' % Item.format_date(item.created) or \
+        'Updated %s' % Item.format_date(item.updated)
+    incompatible = ''
+    flag = ''
+    if not item.compatible:
+        incompatible = ' incompatible'
+        flag = '<span class="notavail">This complete theme is incompatible</span>'
+    return '''<li><div class="hovercard addon theme%(incompatible)s">%(flag)s
+<a href="/addon/%(slug)s/"><div class="summary"><img alt="" src="/static/img/theme.png"><h3>%(name)s</h3></div></a>
+<div class="more">
+<div class="install-shell"><div class="extra">%(notavail)s</div></div>
+<div class="vital"><span class="updated">%(vital)s</span></div>
+<div class="downloads adu">%(downloads)s weekly downloads</div>
+%(stars)s
+</div>
+</div></li>''' % {'incompatible': incompatible, 'flag': flag, 'slug': item.slug, 'name': escape(item.name),
+                  'notavail': not item.compatible and '<span class="notavail">Not available for Firefox</span>' or '',
+                  'vital': vital, 'downloads': _format_number(item.downloads), 'stars': _stars(item.rating)}
+
+
+def complete_themes_results(listing, number, params):
+    number, items = listing.page(number)
+    return '%s<ul class="listing-grid c">%s</ul>%s' % (
+        _sorter(params, listing.sort),
+        '\n'.join(_complete_theme(item, listing.sort) for item in items),
+        paginator(listing, number, params))
+
+
+def complete_themes(listing, number, explore):
+    categories = ''.join('<li id="c-%d"><a href="/complete-themes/%s">%s</a></li>' % (
+        30 + index, name.lower().replace(' ', '-'), escape(name)) for index, name in enumerate(CATEGORIES))
+    explore_links = ''.join('<li><a%s href="%s">%s</a></li>' % (
+        key == explore and ' class="selected"' or '', _query(sort=key), escape(label))
+        for key, label in SORT_LABELS[:4])
+    return '''<section class="secondary">
+<h2>Explore</h2>
+<ul id="side-explore">%(explore)s</ul>
+<h2>Categories</h2>
+<ul id="side-categories">%(categories)s</ul>
+</section>
+<section class="primary">
+<h1>Complete Themes</h1>
+<div id="themes-listing"><div id="pjax-results">%(results)s</div></div>
+</section>''' % {'explore': explore_links, 'categories': categories,
+                 'results': complete_themes_results(listing, number, {})}
+
+
+def complete_themes_category(category):
+    return '<section class="primary"><h1>%s</h1></section>' % escape(category)
+
+
+def collections(listing, number):
+    number, items = listing.page(number)
+    return '''<section class="secondary">
+<nav id="side-nav"><a class="button" href="/collections/add">Create a Collection</a></nav>
+</section>
+<section class="primary">
+<h1>Featured Collections</h1>
+<div class="featured-inner">
+%(sorter)s
+%(items)s
+%(paginator)s
+</div>
+</section>''' % {
+        'sorter': _sorter({}, listing.sort),
+        'items': '\n'.join('''<div class="item"><div class="info"><h3><a href="/collections/%s/">%s</a></h3>
+<p class="desc">%s</p><div class="vitals"><div class="updated">Updated %s</div></div></div></div>''' % (
+            item.slug, escape(item.name), escape(item.summary), Item.format_date(item.updated)) for item in items),
+        'paginator': paginator(listing, number, {})}
+
+
+def collection(item):
+    return '''<section class="primary">
+<h2 class="collection"><span>%s</span></h2>
+<p class="desc">%s</p>
+<a class="delete" href="#">Delete this collection</a>
+</section>''' % (escape(item.name), escape(item.summary))
+
+
+def details(item, kind, reviews, screenshots, related):
+    """Renders the details page of an add-on, a theme or a complete theme."""
+    if kind == 'theme':
+        heading = '<h2 class="addon"><span>%s</span></h2>' % escape(item.name)
+    elif kind == 'complete theme':
+        heading = '<h1 class="addon">%s</h1>' % escape(item.name)
+    else:
+        heading = '<h1 class="addon">%s <span class="version-number">1.%d</span> <span class="no-restart">No Restart</span></h1>' % (
+            escape(item.name), item.index)
+    return '''<section class="primary addon-details">
+<hgroup>%(heading)s<h4 class="author">by <a href="/user/%(index)d/">%(author)s</a></h4></hgroup>
+<p id="addon-summary">%(summary)s</p>
+<img class="icon" alt="" src="/static/img/icon.png">
+<div class="install-wrapper"><div class="install-shell"><div class="install clickHijack">
+<p class="install-button"><a class="button prominent add installer" href="/downloads/%(slug)s.xpi"><b></b><span>Add to Firefox</span></a></p>
+</div></div></div>
+<div class="widgets"><a class="collection-add widget collection" href="#">Add to collection</a><a class="favorite" href="#">Add to favorites</a></div>
+<div class="meta compat">Works with Firefox 4.0 and later</div>
+<div class="meta">%(stars)s<a id="reviews-link" href="#reviews">%(review_count)d reviews</a></div>
+<div id="daily-users"><a class="stats" href="/addon/%(slug)s/statistics/">%(users)s users</a></div>
+<div class="grouped_ratings"><span class="num_ratings">%(review_count)d</span></div>
+<section class="previews"><div class="carousel"><a class="prev" href="#">&laquo;</a><ul id="preview">%(screenshots)s</ul><a class="next" href="#">&raquo;</a></div></section>
+<h2>About this Add-on</h2>
+<div class="prose">%(summary)s</div>
+<section id="developer-comments" class="expando">
+<h2><a href="#developer-comments">Developer&rsquo;s Comments</a></h2>
+<div class="content">Comments from the developer of %(name)s.</div>
+</section>
+<section id="reviews">
+<h2>Reviews for %(name)s</h2>
+%(reviews)s
+<p><a class="more-info" href="/addon/%(slug)s/reviews/">See all %(review_count)d reviews</a></p>
+<p><a id="add-review" href="/addon/%(slug)s/reviews/add">Write a review</a></p>
+</section>
+<section id="detail-relnotes" class="expando">
+<h2><a href="/addon/%(slug)s/versions/">Version Information<b></b></a></h2>
+<div class="content">
+<div class="info"><h3><a href="/addon/%(slug)s/versions/1.%(index)d">Version 1.%(index)d</a></h3></div>
+<ul class="source"><li><a href="/licenses/">Mozilla Public License, version 2.0</a></li></ul>
+</div>
+</section>
+<ul><li><a class="scrollto" href="#detail-relnotes">Version Information</a></li></ul>
+<section id="beta-channel" class="expando">
+<h2><a class="toggle" href="#beta-channel">Development Channel</a></h2>
+<div class="content">
+<p class="beta-version">Version 2.0b1</p>
+<p class="install-button"><a class="button caution" href="/downloads/%(slug)s-beta.xpi">Install</a></p>
+</div>
+</section>
+<h2 class="compact-bottom">Often used with&hellip;</h2>
+<ul class="listing-grid c">%(related)s</ul>
+<div id="author-addons">
+<h2>Other add-ons by %(author)s</h2>
+<ul class="listing-grid"><section>%(related)s</section></ul>
+</div>
+</section>
+<section class="secondary">
+<div class="source-license"><a href="/licenses/">Mozilla Public License, version 2.0</a> <a class="license-faq" href="/faq#license">What&rsquo;s this?</a></div>
+<a class="source-code" href="/files/browse/%(index)d/">View the source</a>
+<div class="links"><a class="home" href="/outgoing/http%%3A//example.com/%(slug)s">Add-on home page</a><a class="support" href="/outgoing/http%%3A//example.com/%(slug)s/support">Support site</a></div>
+<div id="tagbox"><ul><li><a href="/tag/standin">standin</a></li></ul></div>
+<div id="collections-grid"><h2>Part of these collections</h2><section><ul>%(collections)s</ul></section></div>
+</section>''' % {
+        'heading': heading, 'index': item.index, 'author': escape(item.author), 'summary': escape(item.summary),
+        'slug': item.slug, 'name': escape(item.name), 'stars': _stars(item.rating, 'stars large'),
+        'review_count': len(reviews), 'users': _format_number(item.users),
+        'screenshots': ''.join('<li><a href="/static/img/preview-%d.png" title="Screenshot %d"><img alt="" src="/static/img/preview-%d-thumb.png"></a></li>' % (
+            index, index + 1, index) for index in range(screenshots)),
+        'reviews': ''.join(_review(review) for review in reviews),
+        'related': ''.join(_addon_summary(other) for other in related),
+        'collections': ''.join('<li><div class="summary"><a href="/collections/collection-%03d/"><h3>Collection %03d</h3></a></div></li>' % (
+            other.index + 1, other.index + 1) for other in related)}
+
+
+def statistics(item):
+    return '''<section class="primary">
+<h1 class="addon">Statistics for %(name)s</h1>
+<div class="island two-up">
+<div><a href="/addon/%(slug)s/statistics/downloads">%(downloads)s downloads</a></div>
+<div><a href="/addon/%(slug)s/statistics/usage">%(users)s users</a></div>
+</div>
+<div id="head-chart"></div>
+</section>''' % {'name': escape(item.name), 'slug': item.slug,
+                 'downloads': _format_number(item.downloads * 52), 'users': _format_number(item.users)}
+
+
+def discovery(themes, up_and_coming, featured):
+    return '''<section id="intro">
+<h2>What are add-ons?</h2>
+<p>Add-ons are applications that let you personalize Firefox with extra functionality or style. Try a time-saving sidebar, a weather notifier, or a themed look to make Firefox your own.<br><a id="learn-more" href="#">Learn More</a></p>
+</section>
+<section id="mission"><p>Thanks for using Firefox and supporting <a href="http://www.mozilla.org/mission/">Mozilla's mission</a>!</p></section>
+<section id="promos">
+<div class="slider"><ul>
+<li class="panel active"><h2>Get ready for the holidays</h2></li>
+<li class="panel"><h2>Add-ons for everyone</h2></li>
+<li class="panel"><h2>Stay organised</h2></li>
+</ul></div>
+<div id="nav-features"><p class="nav-prev"><a href="#">&lsaquo;</a></p><p class="nav-next"><a href="#">&rsaquo;</a></p></div>
+</section>
+<p id="download-count">Add-ons downloaded: 3,400,000,000</p>
+<section id="featured-addons"><ul>%(featured)s</ul></section>
+<section id="featured-themes">
+<h2>Featured Themes <a class="all" href="/en-US/firefox/themes/">See all</a></h2>
+<ul>%(themes)s</ul>
+</section>
+<section id="up-and-coming"><h2>Up &amp; Coming</h2><ul>%(up_and_coming)s</ul></section>
+<section id="more-ways">
+<h2>More ways to customize</h2>
+<a id="more-addons" href="/extensions/">Browse all add-ons</a>
+<a id="more-complete-themes" href="/complete-themes/">See all complete themes</a>
+</section>
+<p id="logout"><a href="/users/logout">Log out</a></p>''' % {
+        'featured': ''.join('<li><a class="addon-title" href="/addon/%s/">%s</a></li>' % (item.slug, escape(item.name))
+                            for item in featured),
+        'themes': ''.join('<li><a href="/addon/%s/">%s</a></li>' % (item.slug, escape(item.name)) for item in themes),
+        'up_and_coming': ''.join('<li><a class="addon-title" href="/addon/%s/">%s</a></li>' % (item.slug, escape(item.name))
+                                 for item in up_and_coming)}
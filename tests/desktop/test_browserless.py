@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import re
+
+import pytest
+
+from pages.desktop.details import Details
+from pages.desktop.home import Home
+
+
+class TestBrowserless:
+
+    @pytest.mark.browserless
+    @pytest.mark.nondestructive
+    def test_that_firebug_details_are_read_from_the_served_html(self, mozwebqa):
+        firebug_page = Details(mozwebqa, 'Firebug')
+        assert re.search('Firebug', firebug_page.page_title) is not None
+        assert len(firebug_page.version_number) > 0
+        assert len(firebug_page.authors) > 0
+        assert len(firebug_page.summary) > 0
+
+    @pytest.mark.browserless
+    @pytest.mark.nondestructive
+    def test_that_home_page_lists_most_popular_addons(self, mozwebqa):
+        home_page = Home(mozwebqa)
+        # the heading is upper case through CSS, which fetched HTML does not apply
+        assert 'MOST POPULAR' in home_page.most_popular_list_heading.upper()
+        assert home_page.most_popular_count == 10
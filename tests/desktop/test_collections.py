@@ -64,23 +64,15 @@ class TestCollections:
 
     @pytest.mark.native
     @pytest.mark.login
-    def test_user_my_favorites_page(self, mozwebqa, existing_user):
+    def test_user_my_favorites_page(self, mozwebqa, existing_user, data_factory):
+        # mark an add-on as favorite, over HTTP as only the favorites page is under test
+        data_factory.favorite(Details.addon_slug('Firebug'))
+
         home_page = Home(mozwebqa)
         home_page.login(existing_user['email'], existing_user['password'])
         assert home_page.is_the_current_page
         assert home_page.header.is_user_logged_in
 
-        # mark an add-on as favorite if there is none
-        if not home_page.header.is_my_favorites_menu_present:
-            details_page = Details(mozwebqa, 'Firebug')
-            # sometimes the call to is_my_favorites_menu_present lies
-            # and clicking the add to favorites locator when it's already favorited
-            # makes things worse
-            if not details_page.is_addon_marked_as_favorite:
-                details_page.click_add_to_favorites()
-                assert details_page.is_addon_marked_as_favorite
-            home_page = Home(mozwebqa)
-
         my_favorites_page = home_page.header.click_my_favorites()
         assert my_favorites_page.is_the_current_page
         assert 'My Favorite Add-ons' == my_favorites_page.my_favorites_header_text
@@ -39,13 +39,12 @@ class TestCompleteThemes:
         home_page = Home(mozwebqa)
         complete_themes_page = home_page.header.click_complete_themes()
         complete_themes_page.click_sort_by("recently updated")
-        addons = complete_themes_page.addon_names
-        addons_set = set(addons)
-        assert len(addons) == len(addons_set), 'There are duplicates in the names'
-        updated_dates = complete_themes_page.addon_updated_dates
+        grid = complete_themes_page.grid
+        assert len(grid.names) == len(set(grid.names)), 'There are duplicates in the names'
+        updated_dates = grid.updated_dates
         assert is_sorted_descending(updated_dates)
         complete_themes_page.paginator.click_next_page()
-        updated_dates.extend(complete_themes_page.addon_updated_dates)
+        updated_dates.extend(complete_themes_page.grid.updated_dates)
         assert is_sorted_descending(updated_dates)
 
     @pytest.mark.native
@@ -54,13 +53,12 @@ class TestCompleteThemes:
         home_page = Home(mozwebqa)
         complete_themes_page = home_page.header.click_complete_themes()
         complete_themes_page.click_sort_by("newest")
-        addons = complete_themes_page.addon_names
-        addons_set = set(addons)
-        assert len(addons) == len(addons_set), 'There are duplicates in the names'
-        created_dates = complete_themes_page.addon_created_dates
+        grid = complete_themes_page.grid
+        assert len(grid.names) == len(set(grid.names)), 'There are duplicates in the names'
+        created_dates = grid.created_dates
         assert is_sorted_descending(created_dates)
         complete_themes_page.paginator.click_next_page()
-        created_dates.extend(complete_themes_page.addon_created_dates)
+        created_dates.extend(complete_themes_page.grid.created_dates)
         assert is_sorted_descending(created_dates)
 
     @pytest.mark.native
@@ -69,13 +67,12 @@ class TestCompleteThemes:
         home_page = Home(mozwebqa)
         complete_themes_page = home_page.header.click_complete_themes()
         complete_themes_page.click_sort_by("weekly downloads")
-        addons = complete_themes_page.addon_names
-        addons_set = set(addons)
-        assert len(addons) == len(addons_set), 'There are duplicates in the names'
-        downloads = complete_themes_page.addon_download_number
+        grid = complete_themes_page.grid
+        assert len(grid.names) == len(set(grid.names)), 'There are duplicates in the names'
+        downloads = grid.downloads
         assert is_sorted_descending(downloads)
         complete_themes_page.paginator.click_next_page()
-        downloads.extend(complete_themes_page.addon_download_number)
+        downloads.extend(complete_themes_page.grid.downloads)
         assert is_sorted_descending(downloads)
 
     @pytest.mark.native
@@ -184,6 +181,19 @@ class TestCompleteThemes:
             else:
                 assert not complete_theme.is_incompatible_flag_visible
 
+    @pytest.mark.native
+    @pytest.mark.nondestructive
+    def test_that_incompatible_complete_themes_are_flagged_in_the_grid(self, mozwebqa):
+        home_page = Home(mozwebqa)
+        complete_themes_page = home_page.header.click_complete_themes()
+        grid = complete_themes_page.grid
+
+        for incompatible, flag_visible, flyout_text in zip(
+                grid.incompatible, grid.incompatible_flags_visible, grid.flyout_texts):
+            assert flag_visible == incompatible
+            if incompatible:
+                assert 'Not available' in flyout_text
+
     @pytest.mark.native
     @pytest.mark.nondestructive
     def test_that_most_popular_link_is_default(self, mozwebqa):
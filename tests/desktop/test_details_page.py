@@ -11,6 +11,7 @@ import pytest
 from pages.desktop.details import Details
 from pages.desktop.extensions import ExtensionsHome
 from pages.desktop.home import Home
+from utils import asset_check
 
 
 class TestDetails:
@@ -136,6 +137,7 @@ class TestDetails:
             assert name in detail_page.title
             Details(mozwebqa, 'firebug')
 
+    @pytest.mark.assets
     @pytest.mark.nondestructive
     def test_open_close_functionality_for_image_viewer(self, mozwebqa):
 
@@ -146,6 +148,15 @@ class TestDetails:
         image_viewer.close()
         assert image_viewer.is_visible is False
 
+    @pytest.mark.assets
+    @pytest.mark.nondestructive
+    def test_that_firebug_icon_and_previews_are_not_broken(self, mozwebqa):
+        detail_page = Details(mozwebqa, 'firebug')
+        reports = asset_check.check(detail_page.asset_urls)
+        assert [report.kind for report in reports].count('preview') == detail_page.previewer.image_count
+        assert asset_check.problems(reports) == []
+
+    @pytest.mark.assets
     @pytest.mark.nondestructive
     def test_navigation_buttons_for_image_viewer(self, mozwebqa):
 
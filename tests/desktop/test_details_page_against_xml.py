@@ -13,25 +13,29 @@ from pages.desktop.details import Details
 from pages.desktop.addons_api import AddonsAPI
 
 
+@pytest.mark.shared_pages
 class TestDetailsAgainstXML:
 
     firebug = "Firebug"
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_firebug_page_title_is_correct(self, mozwebqa):
-        firebug_page = Details(mozwebqa, self.firebug)
+    def test_that_firebug_page_title_is_correct(self, mozwebqa, shared_page):
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         assert re.search(self.firebug, firebug_page.page_title) is not None
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_firebug_version_number_is_correct(self, mozwebqa):
-        firebug_page = Details(mozwebqa, self.firebug)
+    def test_that_firebug_version_number_is_correct(self, mozwebqa, shared_page):
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         assert len(str(firebug_page.version_number)) > 0
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_firebug_authors_is_correct(self, mozwebqa):
+    def test_that_firebug_authors_is_correct(self, mozwebqa, shared_page):
 
         # get authors from browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         browser_authors = firebug_page.authors
 
         # get authors from xml
@@ -45,15 +49,14 @@ class TestDetailsAgainstXML:
         for i in range(len(xml_authors)):
             assert xml_authors[i] == browser_authors[i]
 
+    @pytest.mark.assets
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_firebug_images_is_correct(self, mozwebqa):
+    def test_that_firebug_images_is_correct(self, mozwebqa, shared_page):
 
         # get images links from browser
-        firebug_page = Details(mozwebqa, self.firebug)
-        images_count = firebug_page.previewer.image_count
-        browser_images = []
-        for i in range(images_count):
-            browser_images.append(firebug_page.previewer.image_link(i))
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
+        browser_images = [url for kind, url in firebug_page.asset_urls if kind == 'thumbnail']
 
         # get images links from xml
         addons_xml = AddonsAPI(mozwebqa, self.firebug)
@@ -68,11 +71,12 @@ class TestDetailsAgainstXML:
                 re.sub('src=api(&amp;|&)', '', xml_images[i]) ==
                 browser_images[i]
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_firebug_summary_is_correct(self, mozwebqa):
+    def test_that_firebug_summary_is_correct(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         browser_summary = firebug_page.summary
 
         # api
@@ -81,15 +85,17 @@ class TestDetailsAgainstXML:
 
         assert xml_summary == browser_summary
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_firebug_rating_is_correct(self, mozwebqa):
-        firebug_page = Details(mozwebqa, self.firebug)
+    def test_that_firebug_rating_is_correct(self, mozwebqa, shared_page):
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         assert "5" == firebug_page.rating
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_description_text_is_correct(self, mozwebqa):
+    def test_that_description_text_is_correct(self, mozwebqa, shared_page):
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         browser_description = firebug_page.description
 
         # api
@@ -100,11 +106,13 @@ class TestDetailsAgainstXML:
             browser_description.replace('\n', '') ==
             xml_description.replace('\n', '')
 
+    @pytest.mark.assets
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_icon_is_correct(self, mozwebqa):
+    def test_that_icon_is_correct(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         browser_icon = firebug_page.icon_url
 
         # api
@@ -114,11 +122,12 @@ class TestDetailsAgainstXML:
 
         assert browser_icon == xml_icon
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_support_url_is_correct(self, mozwebqa):
+    def test_that_support_url_is_correct(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         browser_support_url = firebug_page.support_url
 
         # api
@@ -127,11 +136,12 @@ class TestDetailsAgainstXML:
 
         assert browser_support_url == xml_support_url
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_rating_in_api_equals_rating_in_details_page(self, mozwebqa):
+    def test_that_rating_in_api_equals_rating_in_details_page(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         browser_rating = firebug_page.rating
 
         # api
@@ -141,10 +151,10 @@ class TestDetailsAgainstXML:
         assert browser_rating == xml_rating
 
     @pytest.mark.nondestructive
-    def test_that_compatible_applications_equal(self, mozwebqa):
+    def test_that_compatible_applications_equal(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         firebug_page.expand_version_information()
         browser_compatible_applications = firebug_page.compatible_applications
 
@@ -169,10 +179,10 @@ class TestDetailsAgainstXML:
 
     @pytest.mark.native
     @pytest.mark.nondestructive
-    def test_that_addon_number_of_total_downloads_is_correct(self, mozwebqa):
+    def test_that_addon_number_of_total_downloads_is_correct(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         statistics_page = firebug_page.click_view_statistics()
         browser_downloads = statistics_page.total_downloads_number
 
@@ -182,6 +192,7 @@ class TestDetailsAgainstXML:
 
         assert browser_downloads == xml_downloads
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
     def test_that_learn_more_link_is_correct(self, mozwebqa):
 
@@ -196,10 +207,10 @@ class TestDetailsAgainstXML:
         assert self.firebug in details_page.page_title
 
     @pytest.mark.nondestructive
-    def test_that_firebug_devs_comments_is_correct(self, mozwebqa):
+    def test_that_firebug_devs_comments_is_correct(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         firebug_page.expand_devs_comments()
         browser_devs_comments = firebug_page.devs_comments_message
 
@@ -209,11 +220,12 @@ class TestDetailsAgainstXML:
 
         assert xml_devs_comments == browser_devs_comments
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_home_page_in_api_equals_home_page_in_details_page(self, mozwebqa):
+    def test_that_home_page_in_api_equals_home_page_in_details_page(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         browser_home_page = urlparse.unquote(firebug_page.website)
 
         # api
@@ -222,11 +234,12 @@ class TestDetailsAgainstXML:
 
         assert xml_home_page in browser_home_page
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_reviews_in_api_equals_reviews_in_details_page(self, mozwebqa):
+    def test_that_reviews_in_api_equals_reviews_in_details_page(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         browser_reviews = firebug_page.total_reviews_count
 
         # api
@@ -235,11 +248,12 @@ class TestDetailsAgainstXML:
 
         assert browser_reviews == xml_reviews
 
+    @pytest.mark.browserless
     @pytest.mark.nondestructive
-    def test_that_daily_users_in_api_equals_daily_users_in_details_page(self, mozwebqa):
+    def test_that_daily_users_in_api_equals_daily_users_in_details_page(self, mozwebqa, shared_page):
 
         # browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_page(Details, mozwebqa, self.firebug)
         browser_daily_users = firebug_page.daily_users_number
 
         # api
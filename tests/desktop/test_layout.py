@@ -6,7 +6,9 @@
 
 import pytest
 
+from pages.desktop.details import Details
 from pages.desktop.home import Home
+from utils import link_check
 
 
 class TestAmoLayout:
@@ -22,6 +24,7 @@ class TestAmoLayout:
 
         assert home_page.header.is_other_application_visible(app_under_test) is False
 
+    @pytest.mark.assets
     @pytest.mark.nondestructive
     def test_that_checks_amo_logo_text_layout_and_title(self, mozwebqa):
         home_page = Home(mozwebqa)
@@ -29,6 +32,13 @@ class TestAmoLayout:
         assert home_page.amo_logo_title == "Return to the Firefox Add-ons homepage"
         assert "/img/app-icons/med/firefox.png" in home_page.amo_logo_image_source
 
+    @pytest.mark.nondestructive
+    def test_that_links_on_home_category_and_details_pages_are_not_broken(self, mozwebqa):
+        home_page = Home(mozwebqa)
+        links = home_page.links + home_page.get_category().links + Details(mozwebqa, 'Firebug').links
+        broken = [report for report in link_check.LinkChecker().check(links) if report.error]
+        assert broken == []
+
     @pytest.mark.nondestructive
     def test_that_clicking_the_amo_logo_loads_home_page(self, mozwebqa):
         home_page = Home(mozwebqa)
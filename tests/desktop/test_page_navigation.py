@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+from selenium.webdriver.remote.command import Command
+
+from pages.desktop.details import Details
+from pages.desktop.home import Home
+from utils import commands
+
+
+class TestPageNavigation:
+
+    def _record_loads(self, mozwebqa, request):
+        loaded = []
+
+        def record_load(command, params, duration):
+            if command == Command.GET:
+                loaded.append(params['url'])
+        commands.add_listener(mozwebqa.selenium, record_load)
+        request.addfinalizer(lambda: commands.remove_listener(mozwebqa.selenium, record_load))
+        return loaded
+
+    @pytest.mark.nondestructive
+    def test_that_home_page_is_loaded_again_only_when_forced(self, mozwebqa, request):
+        home_page = Home(mozwebqa)
+        loaded = self._record_loads(mozwebqa, request)
+        Home(mozwebqa)
+        assert loaded == []
+        Home(mozwebqa, force_reload=True)
+        Home(mozwebqa, force_reload=True)
+        assert loaded == [home_page.base_url, home_page.base_url]
+
+    @pytest.mark.nondestructive
+    def test_that_details_page_is_loaded_again_after_unobserved_changes(self, mozwebqa, request):
+        details_page = Details(mozwebqa, 'Firebug')
+        loaded = self._record_loads(mozwebqa, request)
+        with commands.unobserved(mozwebqa.selenium):
+            mozwebqa.selenium.execute_script('document.body.className += " changed";')
+        commands.page_changed(mozwebqa.selenium)
+        Details(mozwebqa, 'Firebug')
+        assert loaded == ['%s/addon/firebug' % details_page.base_url]
@@ -48,6 +48,15 @@ class TestReviews:
         assert len(view_reviews.reviews) == 20
         assert view_reviews.paginator.page_number == page_number + 1
 
+    @pytest.mark.nondestructive
+    def test_that_every_review_of_firebug_has_an_author_rating_and_date(self, mozwebqa):
+        view_reviews = Details(mozwebqa, "Firebug").click_all_reviews_link()
+        reviews = list(view_reviews.all_reviews())
+        assert len(reviews) > 20
+        incomplete = [review for review in reviews
+                      if not (review.author and review.date and 1 <= review.rating <= 5)]
+        assert incomplete == []
+
     @pytest.mark.native
     @pytest.mark.login
     def test_that_new_review_is_saved(self, mozwebqa, existing_user):
@@ -8,6 +8,7 @@
 import pytest
 
 from pages.desktop.home import Home
+from utils import search_relevance
 
 
 class TestSearch:
@@ -106,18 +107,10 @@ class TestSearch:
         search_page = home_page.search_for(search_term)
         assert search_page.is_no_results_present is False
 
-        for i in range(0, len(search_page.results)):
-            try:
-                assert search_term in search_page.results[i].text.lower()
-            except:
-                devs_comments = ''
-                details_page = search_page.results[i].click_result()
-                if details_page.is_devs_comments_section_present:
-                    details_page.expand_devs_comments()
-                    devs_comments = details_page.devs_comments_message
-                search_range = details_page.description + devs_comments
-                assert search_term in search_range.lower()
-                details_page.return_to_previous_page()
+        results = [(result.name, result.url, result.text) for result in search_page.results]
+        irrelevant = [evidence for evidence in search_relevance.verify(search_term, results)
+                      if not evidence.found_in]
+        assert irrelevant == []
 
     @pytest.mark.native
     @pytest.mark.nondestructive
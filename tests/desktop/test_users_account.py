@@ -6,7 +6,6 @@
 
 import pytest
 import random
-from copy import deepcopy
 
 from pages.desktop.home import Home
 
@@ -90,34 +89,27 @@ class TestAccounts:
         assert user_edit_page.is_the_current_page
 
         # save initial values to restore them after the test is finished
-        fields_no = len(user_edit_page.profile_fields)
-        initial_value = [None] * fields_no
+        initial_values = user_edit_page.editable_profile_values
         random_name = "webqa.account%s" % random.randrange(1, 100)
 
         # enter new values
-        for i in range(0, fields_no):
-            if user_edit_page.profile_fields[i].is_field_editable:
-                initial_value[i] = deepcopy(user_edit_page.profile_fields[i].field_value)
-                user_edit_page.profile_fields[i].clear_field()
-                user_edit_page.profile_fields[i].type_value(random_name)
+        # ProfileSection.type_value makes the Homepage a url the same way
+        user_edit_page.fill_profile(dict(
+            (name, name == 'Homepage' and 'http://example.com/' + random_name or random_name)
+            for name in initial_values))
 
         user_edit_page.click_update_account()
         assert user_edit_page.update_message == "Profile Updated"
 
         # using try finally to ensure that the initial values are restore even if the Asserts fail.
         try:
-            for i in range(0, fields_no):
-                if user_edit_page.profile_fields[i].is_field_editable:
-                    assert random_name in user_edit_page.profile_fields[i].field_value
+            for value in user_edit_page.editable_profile_values.values():
+                assert random_name in value
 
         except Exception as exception:
             assert not exception.msg
 
         finally:
             # restore initial values
-            for i in range(0, fields_no):
-                if user_edit_page.profile_fields[i].is_field_editable:
-                    user_edit_page.profile_fields[i].clear_field()
-                    user_edit_page.profile_fields[i].type_value(initial_value[i])
-
+            user_edit_page.fill_profile(initial_values)
             user_edit_page.click_update_account()
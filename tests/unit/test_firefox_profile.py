@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from utils import firefox_profile
+
+
+@pytest.mark.skip_selenium
+class TestFirefoxProfile:
+
+    @pytest.mark.nondestructive
+    def test_that_a_template_is_built_for_its_base_url_only(self, monkeypatch, tmpdir):
+        monkeypatch.setattr(firefox_profile, 'warm', lambda profile_directory, base_url, firefox_path: None)
+        template = str(tmpdir.join('template'))
+        assert not firefox_profile.is_built(template, 'https://addons.allizom.org')
+        firefox_profile.build(template, 'https://addons.allizom.org')
+        assert firefox_profile.is_built(template, 'https://addons.allizom.org/')
+        assert not firefox_profile.is_built(template, 'https://addons-dev.allizom.org')
+        assert not firefox_profile.is_built(template)
+        preferences = dict(firefox_profile.PREFERENCES, **{'browser.startup.page': 1})
+        assert not firefox_profile.is_built(template, 'https://addons.allizom.org', preferences)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import time
+
+import pytest
+
+from utils import rate_limit
+from utils.link_check import LinkChecker
+
+
+class FakeResponse(object):
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+
+class FakeSession(object):
+    """Answers each url with the next of its statuses, an exception standing for a timeout."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.requested = []
+
+    def head(self, url, **kwargs):
+        self.requested.append(url)
+        status = self.statuses[url].pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return FakeResponse(status)
+
+
+@pytest.mark.skip_selenium
+class TestLinkCheck:
+
+    @pytest.mark.nondestructive
+    def test_that_a_broken_link_is_checked_again_on_the_next_check(self, tmpdir):
+        cache_path = str(tmpdir.join('links.json'))
+        session = FakeSession({'http://a.com/': [IOError('timed out'), 200],
+                               'http://b.com/': [503, 200]})
+        links = [('footer', 'http://a.com/'), ('footer', 'http://b.com/#top')]
+
+        checker = LinkChecker(session, cache_path=cache_path)
+        assert [(report.status, report.error) for report in checker.check(links)] == [
+            (None, 'timed out'), (503, 'HTTP 503')]
+
+        reports = checker.check(links)
+        assert [(report.status, report.error, report.cached) for report in reports] == [
+            (200, None, False), (200, None, False)]
+        assert len(session.requested) == 4
+
+    @pytest.mark.nondestructive
+    def test_that_a_working_link_is_taken_from_the_cache(self, tmpdir):
+        cache_path = str(tmpdir.join('links.json'))
+        session = FakeSession({'http://a.com/': [200], 'http://b.com/': [404, 404]})
+        links = [('footer', 'http://a.com/'), ('footer', 'http://b.com/')]
+        LinkChecker(session, cache_path=cache_path).check(links)
+
+        reports = LinkChecker(session, cache_path=cache_path).check(links)
+        assert [(report.status, report.cached) for report in reports] == [(200, True), (404, False)]
+        assert sorted(session.requested) == ['http://a.com/', 'http://b.com/', 'http://b.com/']
+
+    @pytest.mark.nondestructive
+    def test_that_links_of_one_host_are_held_to_the_host_rate(self):
+        session = FakeSession(dict(('http://a.com/%d' % number, [200]) for number in range(3)))
+        start = time.time()
+        LinkChecker(session, host_rate=10).check([('footer', url) for url in session.statuses])
+        # the first request goes at once, the other two a tenth of a second apart
+        assert time.time() - start >= 0.2
+
+    @pytest.mark.nondestructive
+    def test_that_the_run_rate_limit_replaces_the_host_rate(self, request):
+        rate_limit.install(rate_limit.RateLimiter(None, 1000))
+        request.addfinalizer(lambda: rate_limit.install(None))
+        session = FakeSession(dict(('http://a.com/%d' % number, [200]) for number in range(3)))
+        checker = LinkChecker(session, host_rate=1)
+        start = time.time()
+        checker.check([('footer', url) for url in session.statuses])
+        assert time.time() - start < 1
+        assert checker.limiter.metrics() == []
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from utils import rate_limit
+
+
+@pytest.mark.skip_selenium
+class TestRateLimit:
+
+    @pytest.fixture
+    def limiter(self, request, tmpdir):
+        limiter = rate_limit.RateLimiter(rate_limit.create(str(tmpdir.join('buckets'))), 100)
+        request.addfinalizer(limiter.close)
+        return limiter
+
+    @pytest.mark.nondestructive
+    def test_that_unicode_urls_take_a_token_of_their_host(self, limiter):
+        limiter.acquire(u'http://a.com/')
+        limiter.acquire('http://A.com/addon/firebug')
+        limiter.acquire(u'https://b\xfccher.example:8443/')
+        assert [(host.host, host.requests) for host in limiter.metrics()] == [
+            ('a.com', 2), ('xn--bcher-kva.example:8443', 1)]
+
+    @pytest.mark.nondestructive
+    def test_that_a_penalized_host_is_held_back(self, limiter):
+        limiter.penalize(u'http://a.com/', 0.2)
+        assert limiter.acquire(u'http://a.com/') >= 0.2
+        assert limiter.acquire(u'http://b.com/') == 0
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from utils import relevance_corpus
+from utils.relevance_corpus import FAR, MISSING, Query, Score
+
+
+@pytest.mark.skip_selenium
+class TestRelevanceCorpus:
+
+    @pytest.mark.nondestructive
+    def test_that_precision_at_k_counts_the_expected_names_in_the_top_k(self):
+        query = Query(u'firebug', [u'Firebug', u'Firebug Autocompleter'])
+        assert relevance_corpus.score(query, ['firebug', 'FireFTP', 'Firebug Autocompleter']).precision == 0.5
+        assert relevance_corpus.score(query, ['Firebug Autocompleter', 'Firebug']).precision == 1.0
+        assert relevance_corpus.score(query, []).precision == 0.0
+        assert relevance_corpus.score(Query(u'anything', []), ['Firebug']).precision == 1.0
+
+    @pytest.mark.nondestructive
+    def test_that_rank_deltas_tell_how_far_below_its_place_each_name_came(self):
+        query = Query(u'firebug', [u'Firebug', u'FireFTP', u'Firebug Autocompleter'])
+        results = ['Firebug Autocompleter', 'Firebug'] + ['Other %d' % number for number in range(3)]
+        assert relevance_corpus.score(query, results).rank_deltas == [1, MISSING, -2]
+
+    @pytest.mark.nondestructive
+    def test_that_rank_deltas_beyond_a_report_are_far(self, monkeypatch):
+        monkeypatch.setattr(relevance_corpus, 'FAR', 3)
+        results = ['Other %d' % number for number in range(5)] + ['Firebug']
+        assert relevance_corpus.score(Query(u'firebug', [u'Firebug']), results).rank_deltas == [3]
+
+    @pytest.mark.nondestructive
+    def test_that_a_report_reads_back_what_was_written(self, tmpdir):
+        path = str(tmpdir.join('today.rlv'))
+        scores = [Score(u'firebug', 0.5, [0, MISSING, FAR, -2], None),
+                  Score(u'b\xfccher', 1.0, [], None),
+                  Score('adblock', 0.0, [], 'Connexion refus\xc3\xa9e'),
+                  Score(u'video', 0.0, [], u'Zeit\xfcberschreitung')]
+        relevance_corpus.write_report(path, scores)
+        assert relevance_corpus.read_report(path) == [
+            Score(u'firebug', 0.5, [0, MISSING, FAR, -2], None),
+            Score(u'b\xfccher', 1.0, [], None),
+            Score(u'adblock', 0.0, [], u'Connexion refus\xe9e'),
+            Score(u'video', 0.0, [], u'Zeit\xfcberschreitung')]
+
+    @pytest.mark.nondestructive
+    def test_that_a_query_failing_with_a_non_ascii_message_is_reported(self, monkeypatch, tmpdir):
+        def fetch(session, base_url, query, timeout):
+            raise IOError('Connexion refus\xc3\xa9e')
+        monkeypatch.setitem(relevance_corpus.SOURCES, 'page', fetch)
+        scores = relevance_corpus.run([Query(u'firebug', [u'Firebug'])], 'http://localhost', workers=1)
+        assert scores == [Score(u'firebug', 0.0, [], u'Connexion refus\xe9e')]
+        relevance_corpus.write_report(str(tmpdir.join('today.rlv')), scores)
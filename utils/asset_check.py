@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Checks the images of a page over HTTP, several at a time.
+
+The urls of the assets are read from the page in one script, and each is
+requested with HEAD (falling back to a GET when the server will not say
+how big it is) over the shared connection pool:
+
+    reports = asset_check.check(details_page.asset_urls)
+    assert asset_check.problems(reports) == []
+'''
+
+import time
+from collections import namedtuple
+from multiprocessing.pool import ThreadPool
+
+from utils import commands
+from utils.http_session import POOL_SIZE, shared_session
+
+# the largest an asset of a kind may be before it counts as oversized, in bytes
+MAX_SIZES = {
+    'icon': 100 * 1024,
+    'thumbnail': 250 * 1024,
+    'preview': 2 * 1024 * 1024,
+}
+
+SCRIPT = """
+var urls = [];
+arguments[0].forEach(function (source) {
+    var elements = document.querySelectorAll(source[1]);
+    for (var i = 0; i < elements.length; i++) {
+        // the property, unlike the attribute, is the resolved url
+        if (elements[i][source[2]]) {
+            urls.push([source[0], elements[i][source[2]]]);
+        }
+    }
+});
+return urls;
+"""
+
+# size is None when neither the headers nor the body told; error is None or why the asset is broken
+AssetReport = namedtuple('AssetReport', 'kind url status content_type size latency error')
+
+
+def urls_of(driver, sources):
+    """
+    Returns (kind, url) for the elements each (kind, CSS selector, 'src' or
+    'href') of sources matches, in one round trip where driver supports it.
+    """
+    if commands.supports_listeners(driver):
+        return [tuple(asset) for asset in driver.execute_script(SCRIPT, [list(source) for source in sources])]
+    # the browserless driver has no round trips to save
+    from selenium.webdriver.common.by import By
+    return [(kind, element.get_attribute(attribute))
+            for kind, selector, attribute in sources
+            for element in driver.find_elements(By.CSS_SELECTOR, selector)
+            if element.get_attribute(attribute)]
+
+
+def check_asset(kind, url, session=None, timeout=60):
+    """Requests the asset at url and returns its AssetReport."""
+    session = session or shared_session()
+    start = time.time()
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+        size = response.headers.get('content-length')
+        if response.status_code in (405, 501) or (response.ok and size is None):
+            response = session.get(url, stream=True, timeout=timeout)
+            size = sum(len(chunk) for chunk in response.iter_content(64 * 1024))
+    except Exception as exception:
+        return AssetReport(kind, url, None, None, None, time.time() - start, str(exception))
+    latency = time.time() - start
+    if size is not None:
+        size = int(size)
+    content_type = response.headers.get('content-type', '').split(';')[0].strip() or None
+    error = None
+    if not response.ok:
+        error = 'HTTP %s' % response.status_code
+    elif not (content_type or '').startswith('image/'):
+        error = 'not an image but %s' % content_type
+    return AssetReport(kind, url, response.status_code, content_type, size, latency, error)
+
+
+def check(assets, session=None, workers=POOL_SIZE, timeout=60):
+    """Returns the AssetReport of each (kind, url) of assets, requesting up to workers at a time."""
+    if not assets:
+        return []
+    pool = ThreadPool(min(workers, len(assets)))
+    try:
+        return pool.map(lambda asset: check_asset(asset[0], asset[1], session, timeout), assets)
+    finally:
+        pool.close()
+
+
+def problems(reports, max_sizes=MAX_SIZES):
+    """Returns the reports of assets that are broken or bigger than max_sizes allows for their kind."""
+    return [report for report in reports
+            if report.error or (report.size or 0) > max_sizes.get(report.kind, report.size or 0)]
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Hooks into the WebDriver commands a driver sends.
+
+Every WebDriver and WebElement call ends up in driver.execute, so wrapping
+that one method is enough to see each round trip to the browser.
+'''
+
+import sys
+import time
+from contextlib import contextmanager
+
+from selenium.webdriver.remote.command import Command
+
+NAVIGATION_COMMANDS = frozenset([Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH])
+
+FIND_COMMANDS = frozenset([Command.FIND_ELEMENT, Command.FIND_ELEMENTS,
+                           Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS])
+
+# commands after which the page may not be what the last navigation left;
+# asynchronous scripts are left out as the only one sent waits for the page
+PAGE_CHANGING_COMMANDS = NAVIGATION_COMMANDS | frozenset(
+    getattr(Command, name) for name in [
+        'CLICK_ELEMENT', 'SUBMIT_ELEMENT', 'SEND_KEYS_TO_ELEMENT', 'SEND_KEYS_TO_ACTIVE_ELEMENT',
+        'CLEAR_ELEMENT', 'EXECUTE_SCRIPT', 'MOVE_TO', 'CLICK', 'DOUBLE_CLICK',
+        'MOUSE_DOWN', 'MOUSE_UP', 'W3C_ACTIONS', 'SWITCH_TO_WINDOW', 'SWITCH_TO_FRAME', 'CLOSE',
+        'ACCEPT_ALERT', 'DISMISS_ALERT', 'ADD_COOKIE', 'DELETE_COOKIE', 'DELETE_ALL_COOKIES']
+    if hasattr(Command, name))
+
+
+def supports_listeners(driver):
+    """Tells whether driver talks WebDriver, unlike the browserless driver."""
+    return hasattr(driver, 'command_executor')
+
+
+def add_listener(driver, listener):
+    """
+    Calls listener(command, params, duration) after each command driver runs,
+    whether the command succeeded or not.
+
+    Commands a listener runs itself are not reported to any listener.
+    """
+    if not hasattr(driver, '_command_listeners'):
+        _install(driver)
+    driver._command_listeners.append(listener)
+
+
+def add_gate(driver, gate):
+    """
+    Calls gate(command, params) before each command driver runs, so that
+    it may hold the command back, or stop it by raising.
+    """
+    if not hasattr(driver, '_command_listeners'):
+        _install(driver)
+    driver._command_gates.append(gate)
+
+
+def page_generation(driver):
+    """
+    Returns a number that goes up whenever driver runs a command that may
+    change the page, so two equal numbers mean the page is as it was.
+    """
+    if not hasattr(driver, '_page_generation'):
+        generation = driver._page_generation = [0]
+
+        def count(command, params, duration):
+            if command in PAGE_CHANGING_COMMANDS:
+                generation[0] += 1
+        add_listener(driver, count)
+    return driver._page_generation[0]
+
+
+def page_changed(driver):
+    """
+    Tells page_generation the page may have changed in a way no reported
+    command shows, like through commands run unobserved.
+    """
+    page_generation(driver)
+    driver._page_generation[0] += 1
+
+
+def remove_listener(driver, listener):
+    listeners = getattr(driver, '_command_listeners', [])
+    if listener in listeners:
+        listeners.remove(listener)
+
+
+@contextmanager
+def unobserved(driver):
+    """Runs the commands of the block without reporting them to any listener."""
+    state = getattr(driver, '_command_listener_state', None)
+    if state is None or state['notifying']:
+        yield
+        return
+    state['notifying'] = True
+    try:
+        yield
+    finally:
+        state['notifying'] = False
+
+
+def _install(driver):
+    execute = driver.execute
+    listeners = driver._command_listeners = []
+    gates = driver._command_gates = []
+    state = driver._command_listener_state = {'notifying': False}
+
+    def execute_and_notify(driver_command, params=None):
+        for gate in list(gates):
+            gate(driver_command, params or {})
+        start = time.time()
+        try:
+            return execute(driver_command, params)
+        finally:
+            if not state['notifying']:
+                duration = time.time() - start
+                state['notifying'] = True
+                try:
+                    for listener in list(listeners):
+                        listener(driver_command, params or {}, duration)
+                finally:
+                    state['notifying'] = False
+
+    driver.execute = execute_and_notify
+
+
+def locator_of(command, params):
+    """Returns the 'strategy=value' locator a find command used, or None."""
+    if command in FIND_COMMANDS:
+        return '%s=%s' % (params.get('using'), params.get('value'))
+    return None
+
+
+def page_object_caller():
+    """
+    Returns 'Class.method' for the outermost page object method on the
+    stack, which is the property or action a test called, or None when the
+    command was not sent from a page object.
+    """
+    from pages.page import Page
+    caller = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        name = frame.f_code.co_name
+        if not name.startswith('<') and isinstance(frame.f_locals.get('self'), Page):
+            caller = '%s.%s' % (type(frame.f_locals['self']).__name__, name)
+        frame = frame.f_back
+    return caller
+
+
+def page_object_classes():
+    """Returns the names of the classes of all the page objects whose methods are on the stack."""
+    from pages.page import Page
+    names = set()
+    frame = sys._getframe(1)
+    while frame is not None:
+        if isinstance(frame.f_locals.get('self'), Page):
+            names.add(type(frame.f_locals['self']).__name__)
+        frame = frame.f_back
+    return names
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Creates and deletes the collections, reviews and favorites tests need
+over HTTP, logged in as a user, rather than through the browser.
+
+The factory submits the site's own forms, the way the browser would: it
+fetches the page a form is on, keeps the form's hidden fields (the CSRF
+token among them) and posts it with the values filled in. The forms are
+found with the locators of the page objects, so both follow the site.
+
+    factory = DataFactory('https://addons.allizom.org', email, password)
+    collection = factory.create_collection()
+    factory.favorite('firebug')
+    factory.cleanup()   # deletes everything it created, and unfavorites
+
+Collections are kept in a pool: collection() hands out one made earlier
+when a test is done with it, and fill() makes a few ahead of time.
+'''
+
+import threading
+import time
+import uuid
+
+import lxml.html
+
+from utils.http_session import new_session
+
+# where the forms are, relative to the base url
+LOGIN_PATH = '/users/login'
+ADD_COLLECTION_PATH = '/collections/add'
+ADD_REVIEW_PATH = '/addon/%s/reviews/add'
+REVIEWS_PATH = '/addon/%s/reviews/'
+DETAILS_PATH = '/addon/%s/'
+
+
+class DataFactoryError(Exception):
+    pass
+
+
+class DataFactory(object):
+
+    def __init__(self, base_url, email, password, timeout=60):
+        self.base_url = base_url.rstrip('/')
+        self.email = email
+        self.password = password
+        self.timeout = timeout
+        # a session of its own, as the shared one is not logged in
+        self.session = new_session()
+        self.logged_in = False
+        self.lock = threading.Lock()
+        self.collections = []
+        self.idle_collections = []
+        self.reviews = []
+        self.favorites = set()
+        self.created = 0
+        self.reused = 0
+
+    def _document(self, response):
+        document = lxml.html.document_fromstring(response.content, base_url=response.url)
+        document.make_links_absolute()
+        return document
+
+    def _get(self, url):
+        if url.startswith('/'):
+            url = self.base_url + url
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def _post(self, url, data, referer):
+        response = self.session.post(url, data=data, headers={'Referer': referer}, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def submit(self, url, form_selector='form', values=None):
+        """
+        Fetches the page at url, finds the first form form_selector matches
+        that has a field for each key of values, posts it with its own fields
+        and values, and returns the response.
+        """
+        values = values or {}
+        page = self._get(url)
+        for form in self._document(page).cssselect(form_selector):
+            data = dict(form.form_values())
+            if set(values) <= set(data) | set(form.inputs.keys()):
+                data.update(values)
+                return self._post(form.action or page.url, data, page.url)
+        raise DataFactoryError('No form %s with %s at %s' % (form_selector, ', '.join(sorted(values)), page.url))
+
+    def login(self):
+        if self.logged_in:
+            return
+        response = self.submit(LOGIN_PATH, values={'username': self.email, 'password': self.password})
+        if LOGIN_PATH in response.url:
+            raise DataFactoryError('Could not log in as %s' % self.email)
+        self.logged_in = True
+
+    def create_collection(self, name=None):
+        """Creates a collection and returns its url."""
+        self.login()
+        name = name or 'webqa %s' % uuid.uuid4().hex[:20]
+        response = self.submit(ADD_COLLECTION_PATH, values={
+            'name': name, 'description': 'Description is %s' % name})
+        if ADD_COLLECTION_PATH in response.url:
+            raise DataFactoryError('Could not create collection %s' % name)
+        with self.lock:
+            self.collections.append(response.url)
+            self.created += 1
+        return response.url
+
+    def delete_collection(self, url):
+        from pages.desktop.collections import Collection
+        document = self._document(self._get(url))
+        links = document.cssselect(Collection._delete_collection_locator[1])
+        if not links:
+            raise DataFactoryError('No delete link on %s' % url)
+        self.submit(links[0].get('href'), Collection._delete_confirmation_form_locator[1])
+        with self.lock:
+            if url in self.collections:
+                self.collections.remove(url)
+
+    def fill(self, count):
+        """Creates collections until count are waiting in the pool."""
+        while len(self.idle_collections) < count:
+            url = self.create_collection()
+            with self.lock:
+                self.idle_collections.append(url)
+
+    def collection(self):
+        """Returns the url of a collection from the pool, created if the pool is empty."""
+        with self.lock:
+            if self.idle_collections:
+                self.reused += 1
+                return self.idle_collections.pop()
+        return self.create_collection()
+
+    def release(self, url):
+        """Puts a collection back in the pool, for a test that left it as it found it."""
+        with self.lock:
+            if url in self.collections and url not in self.idle_collections:
+                self.idle_collections.append(url)
+
+    def add_review(self, addon_slug, body=None, rating=1):
+        """Writes a review of the add-on and returns its text."""
+        self.login()
+        body = body or 'Automatic addon review by the test data factory %s' % time.time()
+        self.submit(ADD_REVIEW_PATH % addon_slug, values={'body': body, 'rating': str(rating)})
+        with self.lock:
+            self.reviews.append((addon_slug, body))
+            self.created += 1
+        return body
+
+    def delete_review(self, addon_slug, body):
+        from pages.desktop.addons_site import ViewReviews
+        snippet = ViewReviews.ReviewSnippet
+        document = self._document(self._get(REVIEWS_PATH % addon_slug))
+        for review in document.cssselect(ViewReviews._review_locator[1]):
+            if body in review.text_content():
+                for link in review.cssselect(snippet._delete_review_locator[1]):
+                    self._post(link.get('href'), {'csrfmiddlewaretoken': self.session.cookies.get('csrftoken', '')},
+                               document.base_url)
+        with self.lock:
+            if (addon_slug, body) in self.reviews:
+                self.reviews.remove((addon_slug, body))
+
+    def _favorite_widget(self, addon_slug):
+        from pages.desktop.details import Details
+        page = self._get(DETAILS_PATH % addon_slug)
+        widgets = self._document(page).cssselect(Details._add_to_favorites_widget_locator[1])
+        if not widgets:
+            raise DataFactoryError('No favorite widget on %s' % page.url)
+        return page, widgets[0]
+
+    def set_favorite(self, addon_slug, favorite=True):
+        """Adds the add-on to the favorites, or removes it, unless it is there already, or not."""
+        self.login()
+        page, widget = self._favorite_widget(addon_slug)
+        changed = ('Remove from favorites' in widget.text_content()) != favorite
+        if changed:
+            # the widget's link is what its script posts to
+            self._post(widget.get('href'), {
+                'addon_id': widget.get('data-addonid'),
+                'csrfmiddlewaretoken': self.session.cookies.get('csrftoken', '')}, page.url)
+        with self.lock:
+            # only favorites the factory added are removed again
+            if favorite and changed:
+                self.favorites.add(addon_slug)
+            elif not favorite:
+                self.favorites.discard(addon_slug)
+
+    def favorite(self, addon_slug):
+        self.set_favorite(addon_slug, True)
+
+    def cleanup(self):
+        """Deletes everything the factory created, and returns the errors it ran into."""
+        cleanups = [(self.delete_collection, (url,)) for url in list(self.collections)]
+        cleanups += [(self.delete_review, review) for review in list(self.reviews)]
+        cleanups += [(self.set_favorite, (slug, False)) for slug in list(self.favorites)]
+        errors = []
+        for cleanup, arguments in cleanups:
+            try:
+                cleanup(*arguments)
+            except Exception as exception:
+                errors.append('%s%r: %s' % (cleanup.__name__, arguments, exception))
+        self.idle_collections = []
+        return errors
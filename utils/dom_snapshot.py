@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Reads fields of every item of a list or grid in one script.
+
+Page objects of lists usually build an object per item whose properties
+each cost a find and a read, or a hover first when the value sits in a
+hover card. columns() reads them all at once, hidden or not, and returns
+one list per field:
+
+    columns(selenium, '.listing-grid > li', {
+        'name': ('h3', 'text'),
+        'incompatible': ('div.hovercard', 'class'),
+    })
+    # {'name': [u'Theme 1', u'Theme 2'], 'incompatible': [u'hovercard', u'hovercard incompatible']}
+
+Each field is read from the first element its CSS selector matches in the
+item (the item itself when the selector is None), as one of:
+
+    text      its text, hidden or not, with the whitespace collapsed
+    texts     the texts of all the elements the selector matches, as a list
+    class     its class attribute
+    visible   whether it takes up space on the page
+    href      its resolved link
+    value     the value of the form field
+    type      the type of the form field
+    element   the element itself, as a WebElement
+
+A field whose selector matches nothing is None, or an empty list for texts.
+'''
+
+SCRIPT = """
+var items = document.querySelectorAll(arguments[0]);
+var fields = arguments[1];
+function text(element) {
+    return element.textContent.replace(/\\s+/g, ' ').trim();
+}
+// a list of columns rather than an object, as selenium only turns elements in lists into WebElements
+return fields.map(function (field) {
+    var column = [];
+    for (var i = 0; i < items.length; i++) {
+        var element = field[0] ? items[i].querySelector(field[0]) : items[i];
+        var value = null;
+        if (field[1] === 'texts') {
+            value = Array.prototype.map.call(items[i].querySelectorAll(field[0]), text);
+        } else if (element) {
+            switch (field[1]) {
+            case 'text':
+                value = text(element);
+                break;
+            case 'element':
+                value = element;
+                break;
+            case 'class':
+                value = element.getAttribute('class') || '';
+                break;
+            case 'visible':
+                value = !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length);
+                break;
+            case 'href':
+                value = element.href || null;
+                break;
+            case 'value':
+                value = element.value;
+                break;
+            case 'type':
+                value = element.type || null;
+                break;
+            }
+        }
+        column.push(value);
+    }
+    return column;
+});
+"""
+
+
+def columns(driver, item_selector, fields):
+    """Returns a list per field of fields, read from each item item_selector matches."""
+    names = sorted(fields)
+    return dict(zip(names, driver.execute_script(SCRIPT, item_selector, [list(fields[name]) for name in names])))
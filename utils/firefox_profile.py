@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Builds a Firefox profile template with a warm cache of AMO's static assets.
+
+A template directory holds:
+
+    profile/        user.js turning off updates, telemetry and first-run pages
+    cache/          the HTTP cache, kept out of the profile
+    template.json   the preferences and base url it was built with
+
+The cache sits outside the profile because selenium copies the profile on
+every launch. Each worker gets its own clone of both (Firefox does not
+share a cache between running instances), made with copy-on-write where
+the filesystem supports it so cloning costs next to nothing.
+
+    python -m utils.firefox_profile /path/to/template --baseurl=https://addons.allizom.org
+'''
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+PREFERENCES = {
+    'app.update.auto': False,
+    'app.update.enabled': False,
+    'browser.cache.disk.capacity': 1048576,
+    'browser.cache.disk.smart_size.enabled': False,
+    'browser.rights.3.shown': True,
+    'browser.safebrowsing.enabled': False,
+    'browser.safebrowsing.malware.enabled': False,
+    'browser.search.update': False,
+    'browser.shell.checkDefaultBrowser': False,
+    'browser.startup.homepage_override.mstone': 'ignore',
+    'browser.startup.page': 0,
+    'datareporting.healthreport.service.enabled': False,
+    'datareporting.healthreport.uploadEnabled': False,
+    'datareporting.policy.dataSubmissionEnabled': False,
+    'extensions.update.enabled': False,
+    'startup.homepage_welcome_url': 'about:blank',
+    'startup.homepage_welcome_url.additional': '',
+    'toolkit.telemetry.enabled': False,
+    'toolkit.telemetry.unified': False,
+}
+
+# pages whose stylesheets, scripts and sprites cover the rest of the site
+WARM_PATHS = ['/', '/addon/firebug/', '/search/?q=firebug', '/extensions/',
+              '/themes/', '/complete-themes/', '/collections/']
+
+
+def write_user_js(profile_directory, preferences, cache_directory):
+    preferences = dict(preferences)
+    preferences['browser.cache.disk.parent_directory'] = os.path.abspath(cache_directory)
+    with open(os.path.join(profile_directory, 'user.js'), 'w') as user_js:
+        for name in sorted(preferences):
+            user_js.write('user_pref(%s, %s);\n' % (json.dumps(name), json.dumps(preferences[name])))
+
+
+def is_built(template, base_url=None, preferences=PREFERENCES):
+    """Tells whether template was built with the current preferences, and its cache warmed from base_url."""
+    try:
+        with open(os.path.join(template, 'template.json')) as description:
+            built = json.load(description)
+        return built['preferences'] == preferences and same_site(built['base_url'], base_url)
+    except (IOError, ValueError, KeyError):
+        return False
+
+
+def same_site(base_url, other_url):
+    return (base_url or '').rstrip('/') == (other_url or '').rstrip('/')
+
+
+def build(template, base_url=None, firefox_path=None, preferences=PREFERENCES):
+    """Builds the template afresh, warming its cache from base_url if given."""
+    if os.path.exists(template):
+        shutil.rmtree(template)
+    profile_directory = os.path.join(template, 'profile')
+    cache_directory = os.path.join(template, 'cache')
+    os.makedirs(profile_directory)
+    os.makedirs(cache_directory)
+    write_user_js(profile_directory, preferences, cache_directory)
+    if base_url:
+        warm(profile_directory, base_url, firefox_path)
+    with open(os.path.join(template, 'template.json'), 'w') as description:
+        json.dump({'preferences': preferences, 'base_url': base_url}, description, indent=2, sort_keys=True)
+
+
+def warm(profile_directory, base_url, firefox_path=None, paths=WARM_PATHS):
+    """Visits the pages of paths so their static assets land in the cache."""
+    from selenium import webdriver
+    from selenium.webdriver.firefox.firefox_binary import FirefoxBinary
+    binary = firefox_path and FirefoxBinary(firefox_path) or None
+    driver = webdriver.Firefox(firefox_binary=binary,
+                               firefox_profile=webdriver.FirefoxProfile(profile_directory))
+    try:
+        for path in paths:
+            driver.get(base_url.rstrip('/') + path)
+    finally:
+        driver.quit()
+
+
+def clone_tree(source, destination):
+    """
+    Copies source to destination, sharing the file blocks with reflinks on
+    btrfs and XFS, or clonefile on APFS, and copying them elsewhere.
+    """
+    if os.path.exists(destination):
+        shutil.rmtree(destination)
+    parent = os.path.dirname(destination)
+    if parent and not os.path.exists(parent):
+        os.makedirs(parent)
+    if sys.platform.startswith('linux'):
+        # cp falls back to a plain copy where reflinks are not supported
+        command = ['cp', '-R', '--reflink=auto', source, destination]
+    elif sys.platform == 'darwin':
+        command = ['cp', '-c', '-R', source, destination]
+    else:
+        command = None
+    if command is not None and subprocess.call(command) == 0:
+        return
+    if os.path.exists(destination):
+        shutil.rmtree(destination)
+    shutil.copytree(source, destination)
+
+
+def clone(template, destination, preferences=PREFERENCES):
+    """Clones template into destination and returns the path of its profile."""
+    profile_directory = os.path.join(destination, 'profile')
+    cache_directory = os.path.join(destination, 'cache')
+    clone_tree(os.path.join(template, 'profile'), profile_directory)
+    clone_tree(os.path.join(template, 'cache'), cache_directory)
+    write_user_js(profile_directory, preferences, cache_directory)
+    return profile_directory
+
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+    parser = OptionParser(usage='%prog [options] template')
+    parser.add_option('--baseurl', dest='base_url', help='site to warm the cache from')
+    parser.add_option('--firefoxpath', dest='firefox_path', help='firefox binary to warm the cache with')
+    options, arguments = parser.parse_args()
+    if len(arguments) != 1:
+        parser.error('give the directory to build the template in')
+    build(arguments[0], options.base_url, options.firefox_path)
+    print 'Profile template built in %s' % arguments[0]
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Fills the fields of a form in one script.
+
+Each field of the form is an element holding a label and an input. The
+inputs whose label is a key of values get the value, and the input and
+change events typing it would fire, so the page's own scripts see the
+change:
+
+    form_fill.fill(selenium, '#profile-personal > ol.formfields li', 'label', 'input',
+                   {'Display Name': 'webqa', 'Homepage': ''})
+'''
+
+SCRIPT = """
+var fields = document.querySelectorAll(arguments[0]);
+var values = arguments[3];
+var missing = Object.keys(values);
+function fire(input, type) {
+    var event = document.createEvent('HTMLEvents');
+    event.initEvent(type, true, false);
+    input.dispatchEvent(event);
+}
+for (var i = 0; i < fields.length; i++) {
+    var label = fields[i].querySelector(arguments[1]);
+    var input = fields[i].querySelector(arguments[2]);
+    var name = label && label.textContent.replace(/\\s+/g, ' ').trim();
+    if (!input || !values.hasOwnProperty(name)) {
+        continue;
+    }
+    input.focus();
+    input.value = values[name];
+    fire(input, 'input');
+    fire(input, 'change');
+    input.blur();
+    // a second field with the same label is filled too, but was no longer missing
+    var at = missing.indexOf(name);
+    if (at >= 0) {
+        missing.splice(at, 1);
+    }
+}
+return missing;
+"""
+
+
+def fill(driver, field_selector, label_selector, input_selector, values):
+    """
+    Sets the input of each field whose label is a key of values to its
+    value, and returns the keys no field was labelled with. Fields that
+    share a label all get its value.
+    """
+    return driver.execute_script(SCRIPT, field_selector, label_selector, input_selector, values)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils import rate_limit
+
+POOL_SIZE = 10
+RETRIES = 2
+
+_shared_session = None
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Sends each request through the installed rate limiter, if any."""
+
+    def send(self, request, **kwargs):
+        limiter = rate_limit.active()
+        if limiter is not None:
+            limiter.acquire(request.url)
+        response = super(RateLimitedAdapter, self).send(request, **kwargs)
+        if limiter is not None:
+            delay = rate_limit.retry_after(response)
+            if delay:
+                limiter.penalize(request.url, delay)
+        return response
+
+
+def new_session(pool_size=POOL_SIZE):
+    """
+    Returns a requests session that keeps up to pool_size connections
+    per host alive, so repeated fetches skip the TCP and TLS handshakes.
+    """
+    session = requests.Session()
+    adapter = RateLimitedAdapter(pool_connections=pool_size,
+                                 pool_maxsize=pool_size,
+                                 max_retries=RETRIES)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # the test environments use certificates pytest-mozwebqa does not verify either
+    session.verify = False
+    return session
+
+
+def shared_session():
+    """Returns the session shared by all non-browser HTTP clients of the run."""
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = new_session()
+    return _shared_session
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Checks the links of pages over HTTP, several at a time.
+
+Page objects read their links in one script through their links property,
+as (region, url) pairs. A LinkChecker requests each url once however many
+pages link to it, HEAD first and GET where HEAD is not allowed, without
+sending more than HOST_RATE requests a second to any one host. When the
+run has a --ratelimit, its per-host buckets hold the requests back
+instead, like every other request of the run:
+
+    checker = link_check.LinkChecker(cache_path='.link_cache.json')
+    reports = checker.check(Home(mozwebqa).links + Details(mozwebqa, 'Firebug').links)
+    assert [report for report in reports if report.error] == []
+
+With a cache_path the results are kept on disk, so links found working
+within the last CACHE_TTL seconds are not requested again by the next run.
+Broken links are never cached: the failure may be passing, so they are
+requested again by every check.
+'''
+
+import json
+import os
+import tempfile
+import time
+import urlparse
+from collections import namedtuple
+from multiprocessing.pool import ThreadPool
+
+from utils import rate_limit
+from utils.http_session import POOL_SIZE, shared_session
+
+CACHE_TTL = 6 * 60 * 60
+# requests a second sent to any one host when the run has no --ratelimit
+HOST_RATE = 5
+
+# error is None for a working link; cached tells the result came from the cache
+LinkReport = namedtuple('LinkReport', 'region url status error cached')
+
+
+def normalize(url):
+    """Returns url without its fragment, or None when it is not an HTTP link."""
+    url = urlparse.urldefrag(url.strip())[0]
+    return urlparse.urlparse(url).scheme in ('http', 'https') and url or None
+
+
+class LinkChecker(object):
+
+    def __init__(self, session=None, workers=POOL_SIZE, host_rate=HOST_RATE,
+                 cache_path=None, ttl=CACHE_TTL, timeout=60):
+        self.session = session or shared_session()
+        self.workers = workers
+        self.limiter = rate_limit.RateLimiter(None, host_rate)
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.timeout = timeout
+        # url: [status, error, checked at], of the links found working
+        self.results = self._load_cache()
+        self.requested = 0
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path) as cache:
+                results = json.load(cache)
+        except (IOError, TypeError, ValueError):
+            return {}
+        now = time.time()
+        return dict((url, result) for url, result in results.items()
+                    if result[1] is None and now - result[2] < self.ttl)
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        # written aside and renamed, so parallel runs never read half a cache
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        descriptor, path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(descriptor, 'w') as cache:
+            json.dump(self.results, cache)
+        os.rename(path, self.cache_path)
+
+    def _wait_turn(self, url):
+        # with a --ratelimit the shared session takes the turn from its buckets
+        if rate_limit.active() is None:
+            self.limiter.acquire(url)
+
+    def _request(self, url):
+        try:
+            self._wait_turn(url)
+            response = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+            if response.status_code in (403, 405, 501):
+                # some servers only refuse the method, not the page
+                self._wait_turn(url)
+                response = self.session.get(url, stream=True, timeout=self.timeout)
+                response.close()
+        except Exception as exception:
+            return [None, str(exception) or type(exception).__name__, time.time()]
+        return [response.status_code, not response.ok and 'HTTP %s' % response.status_code or None, time.time()]
+
+    def check(self, links):
+        """Returns a LinkReport for each (region, url) of links that is an HTTP link."""
+        links = [(region, normalize(url)) for region, url in links if url and normalize(url)]
+        cached = set(url for region, url in links if url in self.results)
+        missing = sorted(set(url for region, url in links) - cached)
+        results = dict(self.results)
+        if missing:
+            pool = ThreadPool(min(self.workers, len(missing)))
+            try:
+                results.update(zip(missing, pool.map(self._request, missing)))
+            finally:
+                pool.close()
+            self.requested += len(missing)
+            self.results.update((url, results[url]) for url in missing if results[url][1] is None)
+            self._save_cache()
+        return [LinkReport(region, url, results[url][0], results[url][1], url in cached)
+                for region, url in links]
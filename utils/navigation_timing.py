@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Reads the browser's timing of the page it navigated to.
+
+The milestones are in milliseconds from the start of the navigation, and
+None when the browser has not reached them. Browsers without Navigation
+Timing Level 2 fall back to the older performance.timing.
+'''
+
+MILESTONES = ('redirect', 'dns', 'connect', 'ttfb', 'response_end',
+              'dom_interactive', 'dom_content_loaded', 'load')
+
+# one round trip for the navigation and all the resources it loaded
+SCRIPT = """
+var performance = window.performance;
+if (!performance) {
+    return null;
+}
+var entry = performance.getEntriesByType ? performance.getEntriesByType('navigation')[0] : null;
+var start = 0;
+if (!entry) {
+    entry = performance.timing;
+    start = entry.navigationStart;
+}
+function since(value) {
+    return value > 0 ? Math.round(value - start) : null;
+}
+function between(from, to) {
+    return entry[to] > 0 ? Math.round(entry[to] - entry[from]) : null;
+}
+var resources = performance.getEntriesByType ? performance.getEntriesByType('resource') : [];
+return {
+    timing: {
+        redirect: between('redirectStart', 'redirectEnd'),
+        dns: between('domainLookupStart', 'domainLookupEnd'),
+        connect: between('connectStart', 'connectEnd'),
+        ttfb: since(entry.responseStart),
+        response_end: since(entry.responseEnd),
+        dom_interactive: since(entry.domInteractive),
+        dom_content_loaded: since(entry.domContentLoadedEventEnd),
+        load: since(entry.loadEventEnd),
+        transfer_size: entry.transferSize === undefined ? null : entry.transferSize
+    },
+    resources: resources.map(function (resource) {
+        return {
+            name: resource.name,
+            initiator_type: resource.initiatorType,
+            start: Math.round(resource.startTime),
+            duration: Math.round(resource.duration),
+            transfer_size: resource.transferSize === undefined ? null : resource.transferSize
+        };
+    })
+};
+"""
+
+
+def collect(driver):
+    """Returns (timing, resources) for the page driver is on, or (None, None)."""
+    result = driver.execute_script(SCRIPT)
+    if not result:
+        return None, None
+    return result['timing'], result['resources']
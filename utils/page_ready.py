@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Waits in the browser until a page is ready to be tested.
+
+A page is ready once the document has loaded, no XHR or fetch request is
+pending, no new resource has finished loading for QUIET_MS, and every
+ready locator matches a displayed element. The whole wait is one async
+script, so it costs a single round trip however long it takes.
+'''
+
+from selenium.webdriver.common.by import By
+
+# how long the network has to stay quiet before the page counts as idle
+QUIET_MS = 100
+
+SCRIPT = """
+var probes = arguments[0], timeout = arguments[1], quiet = arguments[2];
+var done = arguments[arguments.length - 1];
+var tracker = window.__pageReadyTracker;
+if (!tracker) {
+    // counts the requests started from now on, jQuery.active covers the earlier ones
+    tracker = window.__pageReadyTracker = {pending: 0};
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var settled = false;
+        tracker.pending += 1;
+        this.addEventListener('loadend', function () {
+            if (!settled) {
+                settled = true;
+                tracker.pending -= 1;
+            }
+        });
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            var settle = function () {
+                tracker.pending -= 1;
+            };
+            tracker.pending += 1;
+            var result = fetch.apply(this, arguments);
+            result.then(settle, settle);
+            return result;
+        };
+    }
+}
+function visible(element) {
+    return !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length);
+}
+function found(probe) {
+    var elements = [], i;
+    if (probe[0] === 'xpath') {
+        var matches = document.evaluate(probe[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (i = 0; i < matches.snapshotLength; i++) {
+            elements.push(matches.snapshotItem(i));
+        }
+    } else {
+        elements = document.querySelectorAll(probe[1]);
+    }
+    for (i = 0; i < elements.length; i++) {
+        if (visible(elements[i])) {
+            return true;
+        }
+    }
+    return false;
+}
+function resources() {
+    return window.performance && performance.getEntriesByType ? performance.getEntriesByType('resource').length : 0;
+}
+function pending() {
+    return tracker.pending + (window.jQuery && jQuery.active ? jQuery.active : 0);
+}
+var deadline = new Date().getTime() + timeout;
+var loaded = -1, quietSince = 0;
+(function poll() {
+    var now = new Date().getTime();
+    if (document.readyState !== 'complete' || pending() > 0 || resources() !== loaded) {
+        loaded = resources();
+        quietSince = now;
+    }
+    var missing = probes.filter(function (probe) {
+        return !found(probe);
+    });
+    if (!missing.length && now - quietSince >= quiet) {
+        done(null);
+    } else if (now > deadline) {
+        done('document ' + document.readyState + ', ' + pending() + ' pending requests, waiting for ' +
+             (missing.map(function (probe) { return probe[1]; }).join(', ') || 'the network to go quiet'));
+    } else {
+        setTimeout(poll, 50);
+    }
+})();
+"""
+
+
+def probe_of(locator):
+    """Returns the ['css' or 'xpath', expression] the script looks for a locator with."""
+    by, value = locator
+    if by == By.XPATH:
+        return ['xpath', value]
+    if by == By.CSS_SELECTOR:
+        return ['css', value]
+    if by == By.ID:
+        return ['css', '[id="%s"]' % value]
+    if by == By.NAME:
+        return ['css', '[name="%s"]' % value]
+    if by == By.CLASS_NAME:
+        return ['css', '.%s' % value]
+    if by == By.TAG_NAME:
+        return ['css', value]
+    raise ValueError('Cannot wait for a %s locator in the page ready script' % by)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Keeps the requests of all the processes of a run under a rate per host.
+
+A RateLimiter is a token bucket per host kept in a small file mapped into
+the memory of each process that opens it, so the xdist workers, and the
+threads of each, draw from the same buckets. Each request takes a token
+of its host, and waits for one when the bucket is empty:
+
+    path = rate_limit.create()
+    rate_limit.install(rate_limit.RateLimiter(path, rate=5, burst=5))
+    # in any process the path is handed to
+    rate_limit.active().acquire('https://addons.allizom.org/en-US/firefox/')
+
+The buckets also count the requests of each host and how long they
+waited, for all processes together, which metrics() returns. A
+RateLimiter made without a path keeps its buckets in memory, for the
+threads of one process only.
+'''
+
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import urlparse
+import zlib
+from collections import namedtuple
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # without it the buckets are only shared between the threads of a process
+    fcntl = None
+
+# host, tokens, last update, requests, seconds waited, longest wait
+RECORD = struct.Struct('<64sddQdd')
+SLOTS = 1024
+# seconds a host gets to rest after a 429 without a Retry-After
+PENALTY = 5
+
+HostMetrics = namedtuple('HostMetrics', 'host requests waited longest')
+
+_limiter = None
+
+
+def host_of(url):
+    """Returns the host of url as the byte string its bucket is kept under."""
+    host = urlparse.urlparse(url or '').netloc.lower()
+    if isinstance(host, unicode):
+        try:
+            host = host.encode('idna')
+        except UnicodeError:
+            host = host.encode('utf-8')
+    return host[:64]
+
+
+def create(path=None):
+    """Creates the file of an empty set of buckets, at path or a temporary one, and returns its path."""
+    if path is None:
+        descriptor, path = tempfile.mkstemp(prefix='rate-limit-')
+        os.close(descriptor)
+    with open(path, 'wb') as buckets:
+        buckets.write('\0' * RECORD.size * SLOTS)
+    return path
+
+
+def install(limiter):
+    """Makes limiter the one the HTTP sessions and browsers of this process go through."""
+    global _limiter
+    _limiter = limiter
+
+
+def active():
+    """Returns the installed RateLimiter, or None when requests are not limited."""
+    return _limiter
+
+
+class RateLimiter(object):
+
+    def __init__(self, path, rate, burst=1):
+        self.path = path
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self.lock = threading.Lock()
+        if path is None:
+            self.file = None
+            self.memory = mmap.mmap(-1, RECORD.size * SLOTS)
+        else:
+            self.file = open(path, 'r+b')
+            self.memory = mmap.mmap(self.file.fileno(), RECORD.size * SLOTS)
+
+    @contextmanager
+    def _locked(self):
+        # file locks are held by the process, the thread lock keeps its threads apart
+        shared = fcntl is not None and self.file is not None
+        with self.lock:
+            if shared:
+                fcntl.lockf(self.file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if shared:
+                    fcntl.lockf(self.file, fcntl.LOCK_UN)
+
+    def _slot(self, host):
+        """Returns the offset of the bucket of host, or None when all buckets are taken."""
+        start = zlib.crc32(host) % SLOTS
+        for index in range(SLOTS):
+            offset = (start + index) % SLOTS * RECORD.size
+            key = self.memory[offset:offset + 64].rstrip('\0')
+            if key == host or not key:
+                return offset
+        return None
+
+    def _update(self, url, change):
+        host = host_of(url)
+        if not host:
+            return 0
+        with self._locked():
+            offset = self._slot(host)
+            if offset is None:
+                # more hosts than buckets, the rest go unlimited
+                return 0
+            key, tokens, updated, requests, waited, longest = RECORD.unpack_from(self.memory, offset)
+            now = time.time()
+            if not key.rstrip('\0'):
+                tokens, updated = self.burst, now
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            tokens, requests, wait = change(tokens, requests)
+            RECORD.pack_into(self.memory, offset, host, tokens, now, requests,
+                             waited + wait, max(longest, wait))
+        return wait
+
+    def acquire(self, url):
+        """Takes a token of the host of url, sleeping until there is one, and returns the seconds slept."""
+        def take(tokens, requests):
+            # the token is taken now and the wait is slept after, so waiting holds no lock
+            tokens -= 1
+            return tokens, requests + 1, max(0.0, -tokens / self.rate)
+        wait = self._update(url, take)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, url, seconds=PENALTY):
+        """Empties the bucket of the host of url so that no process sends it anything for seconds."""
+        self._update(url, lambda tokens, requests: (min(tokens, -seconds * self.rate), requests, 0.0))
+
+    def metrics(self):
+        """Returns the HostMetrics of each host that was sent a request, by any process."""
+        with self._locked():
+            records = [RECORD.unpack_from(self.memory, index * RECORD.size) for index in range(SLOTS)]
+        return sorted(HostMetrics(record[0].rstrip('\0'), record[3], record[4], record[5])
+                      for record in records if record[0].rstrip('\0'))
+
+    def close(self):
+        self.memory.close()
+        if self.file is not None:
+            self.file.close()
+
+
+def retry_after(response):
+    """Returns the seconds a 429 or 503 response asks to wait, or None when it is no such response."""
+    if response.status_code not in (429, 503):
+        return None
+    try:
+        return float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        # a 503 without a delay is an error of its own, not throttling
+        return response.status_code == 429 and PENALTY or None
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Runs a corpus of searches and scores how relevant their results are.
+
+Each line of a corpus holds a query, a tab, and the names of the add-ons
+expected at the top of its results, best first and separated by '|':
+
+    firebug<tab>Firebug|Firebug Autocompleter
+    # lines starting with '#' are ignored
+
+The queries are run several at a time against the search page or the
+search API. Each is scored with its precision@k, the share of the top k
+results that are expected, k being the number of expected names, and the
+rank delta of each expected name, how far below its expected place it came.
+The scores are written to a compact binary report, and compared with an
+earlier report when one is given, so regressions stand out:
+
+    python -m utils.relevance_corpus corpus.txt --baseurl=https://addons.allizom.org \\
+        --report=today.rlv --baseline=yesterday.rlv
+'''
+
+import codecs
+import struct
+import urllib
+import xml.etree.ElementTree as ET
+import zlib
+from collections import namedtuple
+from multiprocessing.pool import ThreadPool
+
+import lxml.html
+
+from utils.http_session import POOL_SIZE, new_session, shared_session
+
+MAGIC = 'RLV1'
+# the rank delta of an expected name missing from the results
+MISSING = -32768
+# the rank delta of an expected name beyond the largest delta a report holds
+FAR = 32767
+
+Query = namedtuple('Query', 'query expected')
+# error is None, or why the query could not be scored
+Score = namedtuple('Score', 'query precision rank_deltas error')
+
+
+def load_corpus(path):
+    """Returns the Query of each line of the corpus file at path."""
+    corpus = []
+    with codecs.open(path, encoding='utf-8') as lines:
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            query, _, expected = line.partition('\t')
+            corpus.append(Query(query.strip(), [name.strip() for name in expected.split('|') if name.strip()]))
+    return corpus
+
+
+def _unicode(text):
+    """Returns text as unicode, decoding the byte strings of exception messages as utf-8."""
+    if isinstance(text, str):
+        return text.decode('utf-8', 'replace')
+    return text
+
+
+def _error_of(exception):
+    try:
+        message = unicode(exception)
+    except UnicodeError:
+        # a byte string message that is not ascii
+        message = _unicode(str(exception))
+    return message or unicode(type(exception).__name__)
+
+
+def _quote(query):
+    return urllib.quote(query.encode('utf-8'), safe='')
+
+
+def page_results(session, base_url, query, timeout):
+    """Returns the add-on names on the first search results page for query."""
+    from pages.desktop.search import SearchResultList
+    response = session.get('%s/search/?q=%s' % (base_url, _quote(query)), timeout=timeout)
+    response.raise_for_status()
+    document = lxml.html.document_fromstring(response.content)
+    selector = '%s %s' % (SearchResultList._results_locator[1],
+                          SearchResultList.SearchResultItem._name_locator[1])
+    return [' '.join(link.text_content().split()) for link in document.cssselect(selector)]
+
+
+def api_results(session, base_url, query, timeout):
+    """Returns the add-on names the search API returns for query."""
+    response = session.get('%s/en-us/firefox/api/1.5/search/%s' % (base_url, _quote(query)), timeout=timeout)
+    response.raise_for_status()
+    return [(addon.findtext('name') or '').strip() for addon in ET.fromstring(response.content).findall('addon')]
+
+
+SOURCES = {'page': page_results, 'api': api_results}
+
+
+def score(query, results):
+    """Returns the Score of the results of a Query."""
+    expected = [name.lower() for name in query.expected]
+    results = [name.lower() for name in results]
+    k = len(expected)
+    if not k:
+        return Score(query.query, 1.0, [], None)
+    precision = len(set(results[:k]) & set(expected)) / float(k)
+    rank_deltas = [min(results.index(name) - rank, FAR) if name in results else MISSING
+                   for rank, name in enumerate(expected)]
+    return Score(query.query, precision, rank_deltas, None)
+
+
+def run(corpus, base_url, source='page', workers=POOL_SIZE, timeout=60):
+    """Scores each Query of corpus, running up to workers searches at a time."""
+    fetch = SOURCES[source]
+    base_url = base_url.rstrip('/')
+    session = workers > POOL_SIZE and new_session(workers) or shared_session()
+
+    def run_query(query):
+        try:
+            return score(query, fetch(session, base_url, query.query, timeout))
+        except Exception as exception:
+            return Score(query.query, 0.0, [], _error_of(exception))
+    pool = ThreadPool(max(min(workers, len(corpus)), 1))
+    try:
+        return pool.map(run_query, corpus)
+    finally:
+        pool.close()
+
+
+def write_report(path, scores):
+    """
+    Writes scores to path, each as its query, its precision in thousandths
+    and its rank deltas in two bytes apiece, the whole compressed.
+    """
+    chunks = [MAGIC, struct.pack('<I', len(scores))]
+    for query_score in scores:
+        rank_deltas = query_score.rank_deltas[:255]
+        query = _unicode(query_score.query).encode('utf-8')
+        error = _unicode(query_score.error or u'').encode('utf-8')
+        chunks.append(struct.pack('<H%dsHB' % len(query), len(query), query,
+                                  int(round(query_score.precision * 1000)), len(rank_deltas)))
+        chunks.append(struct.pack('<%dh' % len(rank_deltas), *rank_deltas))
+        chunks.append(struct.pack('<H%ds' % len(error), len(error), error))
+    with open(path, 'wb') as report:
+        report.write(zlib.compress(''.join(chunks), 9))
+
+
+def read_report(path):
+    """Returns the scores written to path by write_report."""
+    with open(path, 'rb') as report:
+        data = zlib.decompress(report.read())
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError('%s is not a relevance report' % path)
+    offset = len(MAGIC)
+    count, = struct.unpack_from('<I', data, offset)
+    offset += 4
+    scores = []
+    for i in range(count):
+        length, = struct.unpack_from('<H', data, offset)
+        query, precision, deltas = struct.unpack_from('<%dsHB' % length, data, offset + 2)
+        offset += 2 + length + 3
+        rank_deltas = list(struct.unpack_from('<%dh' % deltas, data, offset))
+        offset += 2 * deltas
+        length, = struct.unpack_from('<H', data, offset)
+        error, = struct.unpack_from('<%ds' % length, data, offset + 2)
+        offset += 2 + length
+        scores.append(Score(query.decode('utf-8'), precision / 1000.0, rank_deltas, error.decode('utf-8') or None))
+    return scores
+
+
+def summary_lines(scores, baseline=None):
+    """Returns lines with the mean precision and the queries that got worse since baseline."""
+    scored = [query_score for query_score in scores if query_score.error is None]
+    lines = ['%d queries, %d could not be run' % (len(scores), len(scores) - len(scored))]
+    if scored:
+        lines.append('mean precision@k %.3f' % (sum(s.precision for s in scored) / len(scored)))
+    if baseline is None:
+        return lines
+    before = dict((query_score.query, query_score) for query_score in baseline if query_score.error is None)
+    worse = [(before[s.query].precision - s.precision, s) for s in scored
+             if s.query in before and s.precision < before[s.query].precision]
+    lines.append('%d queries less precise than in the baseline' % len(worse))
+    for drop, query_score in sorted(worse, key=lambda pair: -pair[0]):
+        lines.append(u'  %-40s %.3f -> %.3f  rank deltas %s' % (
+            query_score.query, before[query_score.query].precision, query_score.precision,
+            ' '.join(delta == MISSING and '-' or str(delta) for delta in query_score.rank_deltas)))
+    return lines
+
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+    parser = OptionParser(usage='%prog [options] corpus')
+    parser.add_option('--baseurl', dest='base_url', help='site to search')
+    parser.add_option('--source', dest='source', choices=sorted(SOURCES), default='page',
+                      help='search the results page or the API (default: %default)')
+    parser.add_option('--workers', dest='workers', type='int', default=POOL_SIZE,
+                      help='searches to run at a time (default: %default)')
+    parser.add_option('--report', dest='report', help='file to write the binary report to')
+    parser.add_option('--baseline', dest='baseline', help='earlier report to compare with')
+    options, arguments = parser.parse_args()
+    if len(arguments) != 1 or not options.base_url:
+        parser.error('give a corpus file and --baseurl')
+    scores = run(load_corpus(arguments[0]), options.base_url, options.source, options.workers)
+    if options.report:
+        write_report(options.report, scores)
+    for line in summary_lines(scores, options.baseline and read_report(options.baseline)):
+        print line.encode('utf-8')
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Streams every review of an add-on, across all its review pages.
+
+The reviews of the page the browser is on are read in one script, the
+following pages are fetched over HTTP, each one while the reviews of the
+page before it are being consumed:
+
+    for review in view_reviews.all_reviews():
+        assert 1 <= review.rating <= 5
+'''
+
+import re
+from collections import namedtuple
+from datetime import datetime
+from multiprocessing.pool import ThreadPool
+
+import lxml.html
+
+from utils import commands
+from utils.http_session import shared_session
+
+# 'by Someone on May 5, 2015' or 'by Someone on May 5, 2015 (Firefox 38)'
+_DATE = re.compile(r'\son\s([A-Za-z]+\s\d+,\s\d+)')
+
+# author and text are unicode, rating an int (None when the review has none) and date a datetime.date
+Review = namedtuple('Review', 'author rating date text')
+
+SCRIPT = """
+var selectors = arguments[0];
+function text(review, selector) {
+    var element = review.querySelector(selector);
+    return element ? element.textContent : null;
+}
+var reviews = document.querySelectorAll(selectors.review);
+var rows = [];
+for (var i = 0; i < reviews.length; i++) {
+    rows.push([text(reviews[i], selectors.author), text(reviews[i], selectors.rating),
+               text(reviews[i], selectors.date), text(reviews[i], selectors.text)]);
+}
+var next = document.querySelector(selectors.next);
+return [rows, next && !/disabled/.test(next.className) ? next.href : null];
+"""
+
+
+def _selectors():
+    from pages.desktop.addons_site import ViewReviews
+    from pages.desktop.regions.paginator import Paginator
+    snippet = ViewReviews.ReviewSnippet
+    return {'review': ViewReviews._review_locator[1],
+            'author': snippet._review_author_locator[1],
+            'rating': snippet._review_rating_locator[1],
+            'date': snippet._review_date_locator[1],
+            'text': snippet._review_text_locator[1],
+            'next': Paginator._next_locator[1]}
+
+
+def _clean(text):
+    return text is not None and ' '.join(text.split()) or None
+
+
+def review_of(author, rating, byline, text):
+    """Returns the Review of the raw text of a review's author, rating, byline and text."""
+    rating = _clean(rating)
+    date = _DATE.search(byline or '')
+    return Review(_clean(author),
+                  rating and int(rating.split()[1]) or None,
+                  date and datetime.strptime(date.group(1), '%B %d, %Y').date() or None,
+                  _clean(text))
+
+
+def browser_page(driver):
+    """Returns the raw reviews of the page driver is on and the url of the next page, or None."""
+    return tuple(driver.execute_script(SCRIPT, _selectors()))
+
+
+def fetch_page(url, session=None, timeout=60):
+    """Returns the raw reviews of the review page at url and the url of the next page, or None."""
+    response = (session or shared_session()).get(url, timeout=timeout)
+    response.raise_for_status()
+    document = lxml.html.document_fromstring(response.content, base_url=response.url)
+    document.make_links_absolute()
+    selectors = _selectors()
+
+    def text(review, selector):
+        elements = review.cssselect(selector)
+        return elements and elements[0].text_content() or None
+    rows = [[text(review, selectors[field]) for field in ('author', 'rating', 'date', 'text')]
+            for review in document.cssselect(selectors['review'])]
+    next_links = [link for link in document.cssselect(selectors['next'])
+                  if 'disabled' not in (link.get('class') or '')]
+    return rows, next_links and next_links[0].get('href') or None
+
+
+def stream(driver, session=None, timeout=60):
+    """
+    Yields the Review of every review on the page driver is on and on the
+    pages after it.
+    """
+    if commands.supports_listeners(driver):
+        rows, next_url = browser_page(driver)
+    else:
+        # the browserless driver saves no round trips, fetch the page like the others
+        rows, next_url = fetch_page(driver.current_url, session, timeout)
+    seen = set([driver.current_url])
+    pool = ThreadPool(1)
+    try:
+        while True:
+            pending = None
+            if next_url and next_url not in seen:
+                seen.add(next_url)
+                pending = pool.apply_async(fetch_page, (next_url, session, timeout))
+            for row in rows:
+                yield review_of(*row)
+            if pending is None:
+                return
+            rows, next_url = pending.get()
+    finally:
+        pool.terminate()
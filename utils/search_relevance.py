@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+'''
+Checks that search results are relevant to the term searched for.
+
+A result is relevant when the term is in its own text on the results
+page, or else in the name, description or developer comments of its
+detail page. Detail pages are fetched over HTTP, several at a time, rather
+than opened one by one in the browser:
+
+    results = [(result.name, result.url, result.text) for result in search_page.results]
+    irrelevant = [evidence for evidence in search_relevance.verify('cool', results)
+                  if not evidence.found_in]
+'''
+
+from collections import namedtuple
+from multiprocessing.pool import ThreadPool
+
+import lxml.html
+
+from utils.http_session import POOL_SIZE, shared_session
+
+# found_in is the first place the term was found, or None with the reason in error
+Evidence = namedtuple('Evidence', 'name url found_in error')
+
+
+def detail_fields():
+    """Returns (field, CSS selector) for the parts of a detail page the term is looked for in."""
+    from pages.desktop.details import Details
+    return [('name', Details._title_locator[1]),
+            ('description', Details._description_locator[1]),
+            # collapsed in the browser, but the text is in the document all the same
+            ('developer comments', Details._devs_comments_message_locator[1])]
+
+
+def _text(document, selector):
+    return ' '.join(' '.join(node.text_content().split()) for node in document.cssselect(selector))
+
+
+def check_detail_page(term, name, url, session=None, timeout=60):
+    """Fetches the detail page at url and returns the Evidence of where term is in it."""
+    try:
+        response = (session or shared_session()).get(url, timeout=timeout)
+        response.raise_for_status()
+    except Exception as exception:
+        return Evidence(name, url, None, 'could not fetch the detail page: %s' % exception)
+    document = lxml.html.document_fromstring(response.content, base_url=response.url)
+    for field, selector in detail_fields():
+        if term in _text(document, selector).lower():
+            return Evidence(name, url, field, None)
+    return Evidence(name, url, None, 'not in the result, name, description or developer comments')
+
+
+def verify(term, results, session=None, workers=POOL_SIZE, timeout=60):
+    """
+    Returns the Evidence for each (name, url, text) of results, in order.
+    Detail pages are only fetched for results whose text lacks the term.
+    """
+    term = term.lower()
+    evidence = [Evidence(name, url, 'result', None) if term in text.lower() else None
+                for name, url, text in results]
+    unmatched = [index for index, found in enumerate(evidence) if found is None]
+    if unmatched:
+        pool = ThreadPool(min(workers, len(unmatched)))
+        try:
+            checked = pool.map(lambda index: check_detail_page(
+                term, results[index][0], results[index][1], session, timeout), unmatched)
+        finally:
+            pool.close()
+        for index, found in zip(unmatched, checked):
+            evidence[index] = found
+    return evidence